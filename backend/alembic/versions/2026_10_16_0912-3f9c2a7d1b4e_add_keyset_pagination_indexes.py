@@ -0,0 +1,30 @@
+"""Add keyset pagination indexes
+
+Revision ID: 3f9c2a7d1b4e
+Revises: 85e3ba802688
+Create Date: 2026-10-16 09:12:41.512304
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d1b4e'
+down_revision: Union[str, None] = '85e3ba802688'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_session_created_at_id', 'session', ['created_at', 'id'], unique=False)
+    op.create_index('ix_review_created_at_id', 'review', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_review_created_at_id', table_name='review')
+    op.drop_index('ix_session_created_at_id', table_name='session')
@@ -0,0 +1,41 @@
+"""Add userprofile email trigram index
+
+Revision ID: 7b41e6d0c2f5
+Revises: 3f9c2a7d1b4e
+Create Date: 2026-10-16 10:34:18.204117
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7b41e6d0c2f5'
+down_revision: Union[str, None] = '3f9c2a7d1b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_userprofile_email_trgm',
+        'userprofile',
+        ['email'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_userprofile_email_trgm',
+        table_name='userprofile',
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'},
+    )
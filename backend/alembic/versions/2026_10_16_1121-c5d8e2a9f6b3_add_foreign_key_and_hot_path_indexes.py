@@ -0,0 +1,52 @@
+"""Add foreign key and hot path indexes
+
+Revision ID: c5d8e2a9f6b3
+Revises: 7b41e6d0c2f5
+Create Date: 2026-10-16 11:21:07.845530
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d8e2a9f6b3'
+down_revision: Union[str, None] = '7b41e6d0c2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_conversationscenario_user_id', 'conversationscenario', ['user_id']),
+    ('ix_conversationscenario_category_id', 'conversationscenario', ['category_id']),
+    ('ix_scenariopreparation_scenario_id', 'scenariopreparation', ['scenario_id']),
+    ('ix_session_scenario_id', 'session', ['scenario_id']),
+    ('ix_sessionfeedback_session_id', 'sessionfeedback', ['session_id']),
+    (
+        'ix_sessionturn_session_id_start_offset_ms',
+        'sessionturn',
+        ['session_id', 'start_offset_ms'],
+    ),
+    (
+        'ix_sessionturn_session_id_full_audio_start_offset_ms',
+        'sessionturn',
+        ['session_id', 'full_audio_start_offset_ms'],
+    ),
+    ('ix_sessionturn_created_at', 'sessionturn', ['created_at']),
+    ('ix_livefeedback_session_id_created_at', 'livefeedback', ['session_id', 'created_at']),
+    ('ix_review_session_id_user_id', 'review', ['session_id', 'user_id']),
+    ('ix_review_user_id', 'review', ['user_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, table_name, columns in INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, table_name, _ in reversed(INDEXES):
+        op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,62 @@
+"""Shard admin dashboard stats counters
+
+Revision ID: e1a7c4b9d3f2
+Revises: c5d8e2a9f6b3
+Create Date: 2026-10-16 13:02:41.216904
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1a7c4b9d3f2'
+down_revision: Union[str, None] = 'c5d8e2a9f6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'admindashboardstats',
+        sa.Column('shard', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    )
+    # Existing rows become distinct shards so their counters are kept
+    op.execute(
+        """
+        UPDATE admindashboardstats
+        SET shard = numbered.shard
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY id) - 1 AS shard FROM admindashboardstats
+        ) AS numbered
+        WHERE admindashboardstats.id = numbered.id
+        """
+    )
+    op.create_unique_constraint('uq_admindashboardstats_shard', 'admindashboardstats', ['shard'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Fold the shards back into a single row
+    op.execute(
+        """
+        UPDATE admindashboardstats
+        SET total_trainings = totals.total_trainings, score_sum = totals.score_sum
+        FROM (
+            SELECT sum(total_trainings) AS total_trainings, sum(score_sum) AS score_sum
+            FROM admindashboardstats
+        ) AS totals
+        WHERE admindashboardstats.shard = (SELECT min(shard) FROM admindashboardstats)
+        """
+    )
+    op.execute(
+        'DELETE FROM admindashboardstats '
+        'WHERE shard <> (SELECT min(shard) FROM admindashboardstats)'
+    )
+    op.drop_constraint('uq_admindashboardstats_shard', 'admindashboardstats', type_='unique')
+    op.drop_column('admindashboardstats', 'shard')
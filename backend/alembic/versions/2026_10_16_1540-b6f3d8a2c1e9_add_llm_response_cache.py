@@ -0,0 +1,45 @@
+"""Add LLM response cache table
+
+Revision ID: b6f3d8a2c1e9
+Revises: e1a7c4b9d3f2
+Create Date: 2026-10-16 15:40:12.530417
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f3d8a2c1e9'
+down_revision: Union[str, None] = 'e1a7c4b9d3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'llmresponsecacheentry',
+        sa.Column('key', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('response', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(
+        op.f('ix_llmresponsecacheentry_expires_at'),
+        'llmresponsecacheentry',
+        ['expires_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_llmresponsecacheentry_expires_at'), table_name='llmresponsecacheentry')
+    op.drop_table('llmresponsecacheentry')
@@ -0,0 +1,53 @@
+"""Add scenario preparation content hash and reuse counters
+
+Revision ID: 4d2e9b7a5c81
+Revises: b6f3d8a2c1e9
+Create Date: 2026-10-16 16:55:03.771254
+
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+import sqlmodel
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2e9b7a5c81'
+down_revision: Union[str, None] = 'b6f3d8a2c1e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'scenariopreparation',
+        sa.Column('content_hash', sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+    )
+    op.create_index(
+        'ix_scenariopreparation_content_hash',
+        'scenariopreparation',
+        ['content_hash'],
+        unique=False,
+    )
+    op.add_column(
+        'admindashboardstats',
+        sa.Column(
+            'preparations_generated', sa.Integer(), nullable=False, server_default=sa.text('0')
+        ),
+    )
+    op.add_column(
+        'admindashboardstats',
+        sa.Column('preparations_reused', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('admindashboardstats', 'preparations_reused')
+    op.drop_column('admindashboardstats', 'preparations_generated')
+    op.drop_index('ix_scenariopreparation_content_hash', table_name='scenariopreparation')
+    op.drop_column('scenariopreparation', 'content_hash')
@@ -55,6 +55,53 @@ class Settings(BaseSettings):
         VERTEXAI_LOCATION (str): Vertex AI region.
         VERTEXAI_MAX_TOKENS (int): Max tokens for Vertex AI.
         SENTRY_DSN (str | None): Sentry DSN for error reporting.
+        METRICS_TOKEN (str | None): Bearer token required by the /metrics endpoint, the
+            endpoint is disabled when unset.
+        LLM_EXECUTOR_MAX_WORKERS (int): Threads of the process-wide LLM executor.
+        LLM_MODEL_MAX_CONCURRENCY (int): Maximum number of concurrent calls per LLM model.
+        LLM_MODEL_REQUESTS_PER_MINUTE (int): Maximum number of calls per LLM model and minute.
+        LLM_RESPONSE_CACHE_BACKEND (Literal['memory', 'postgres']): Storage of cached LLM
+            responses.
+        LLM_RESPONSE_CACHE_TTL_SECONDS (int): Lifetime of cached LLM responses.
+        LLM_RESPONSE_CACHE_MAX_SIZE (int): Maximum number of LLM responses cached in memory.
+        VERTEX_CONTEXT_CACHE_ENABLED (bool): Whether static system prompts are stored as
+            Vertex AI cached content.
+        VERTEX_CONTEXT_CACHE_TTL_SECONDS (int): Lifetime of a cached system prompt, it is
+            extended in the background while the app is running.
+        VERTEX_CONTEXT_CACHE_MIN_TOKENS (int): Minimum size of a system prompt to be cached,
+            smaller prompts are always sent inline.
+        PROMPT_MAX_TOKENS (int): Estimated token budget of a prompt, variable sections are
+            trimmed to fit.
+        PROMPT_HR_CONTEXT_MAX_TOKENS (int): Estimated token budget of the HR document context
+            in a prompt.
+        PROMPT_HISTORY_MAX_TOKENS (int): Estimated token budget of history in a prompt, e.g.
+            previous live feedback.
+        FEEDBACK_GENERATION_MODE (Literal['parallel', 'fused']): Whether session feedback
+            examples, goals and recommendations are generated by three parallel LLM calls or
+            by a single fused call.
+        LLM_CALL_TIMEOUT_SECONDS (float): Timeout of a single LLM call, shortened to the
+            remaining time of the pipeline deadline.
+        LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD (int): Consecutive failed calls after which
+            calls to a model fail fast.
+        LLM_CIRCUIT_BREAKER_RESET_SECONDS (float): Time calls to a model fail fast before a
+            probe call is let through.
+        LLM_HEDGING_ENABLED (bool): Whether LLM calls still running after the p95 latency of
+            their operation get a duplicate request.
+        LLM_HEDGING_WINDOW (int): Number of recent latencies per operation the p95 is taken
+            from.
+        LLM_HEDGING_MIN_SAMPLES (int): Latencies needed before calls of an operation are
+            hedged.
+        FEEDBACK_DEADLINE_SECONDS (float): Deadline of the session feedback LLM calls.
+        SCENARIO_PREPARATION_DEADLINE_SECONDS (float): Deadline of the scenario preparation
+            LLM calls.
+        LIVE_FEEDBACK_DEADLINE_SECONDS (float): Deadline of a live feedback item.
+        ADVISOR_DEADLINE_SECONDS (float): Deadline of the scenario advice generation.
+        APP_CONFIG_CACHE_TTL_SECONDS (int): Fallback lifetime of cached app config values.
+        ADMIN_DASHBOARD_CACHE_TTL_SECONDS (int): Age after which cached admin dashboard
+            counts are refreshed in the background.
+        JWT_CACHE_MAX_SIZE (int): Maximum number of verified JWT payloads cached per process.
+        USER_PROFILE_CACHE_TTL_SECONDS (int): Lifetime of cached authenticated user profiles.
+        USER_PROFILE_CACHE_MAX_SIZE (int): Maximum number of cached user profiles per process.
     """
 
     stage: Literal['dev', 'prod'] = 'dev'
@@ -125,6 +172,39 @@ class Settings(BaseSettings):
     VERTEXAI_MAX_TOKENS: int = 8192  # Max tokens for VertexAI in dev mode
 
     SENTRY_DSN: str | None = None
+    METRICS_TOKEN: str | None = None
+
+    # Shared LLM executor
+    LLM_EXECUTOR_MAX_WORKERS: int = 16
+    LLM_MODEL_MAX_CONCURRENCY: int = 8
+    LLM_MODEL_REQUESTS_PER_MINUTE: int = 300
+    LLM_RESPONSE_CACHE_BACKEND: Literal['memory', 'postgres'] = 'memory'
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = 86_400
+    LLM_RESPONSE_CACHE_MAX_SIZE: int = 1_000
+    VERTEX_CONTEXT_CACHE_ENABLED: bool = True
+    VERTEX_CONTEXT_CACHE_TTL_SECONDS: int = 3_600
+    VERTEX_CONTEXT_CACHE_MIN_TOKENS: int = 2_048
+    PROMPT_MAX_TOKENS: int = 16_000
+    PROMPT_HR_CONTEXT_MAX_TOKENS: int = 4_000
+    PROMPT_HISTORY_MAX_TOKENS: int = 1_000
+    FEEDBACK_GENERATION_MODE: Literal['parallel', 'fused'] = 'parallel'
+    LLM_CALL_TIMEOUT_SECONDS: float = 60.0
+    LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 5
+    LLM_CIRCUIT_BREAKER_RESET_SECONDS: float = 30.0
+    LLM_HEDGING_ENABLED: bool = False
+    LLM_HEDGING_WINDOW: int = 200
+    LLM_HEDGING_MIN_SAMPLES: int = 20
+    FEEDBACK_DEADLINE_SECONDS: float = 180.0
+    SCENARIO_PREPARATION_DEADLINE_SECONDS: float = 120.0
+    LIVE_FEEDBACK_DEADLINE_SECONDS: float = 20.0
+    ADVISOR_DEADLINE_SECONDS: float = 120.0
+
+    # Process-local caches
+    APP_CONFIG_CACHE_TTL_SECONDS: int = 60
+    ADMIN_DASHBOARD_CACHE_TTL_SECONDS: int = 60
+    JWT_CACHE_MAX_SIZE: int = 10_000
+    USER_PROFILE_CACHE_TTL_SECONDS: int = 30
+    USER_PROFILE_CACHE_MAX_SIZE: int = 10_000
 
     @property
     def mock_user_data(self) -> MockUser:
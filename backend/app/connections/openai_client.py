@@ -10,6 +10,7 @@ from openai import OpenAI
 from pydantic import BaseModel
 
 from app.config import Settings
+from app.services.llm_metrics import llm_metrics
 
 # Load environment variables from .env file
 load_dotenv()
@@ -75,6 +76,7 @@ def call_structured_llm(
     system_prompt: str | None = None,
     mock_response: T | None = None,
     audio_uri: str | None = None,
+    operation: str = 'unknown',
 ) -> T:
     """Call the LLM with a structured output request and parse the response.
 
@@ -87,6 +89,7 @@ def call_structured_llm(
         system_prompt (str | None): Optional system prompt.
         mock_response (T | None): Fallback response when AI is disabled.
         audio_uri (str | None): Optional audio input reference.
+        operation (str): Logical operation the call is recorded under, e.g. 'scoring'.
 
     Returns:
         T: Parsed structured response.
@@ -106,15 +109,20 @@ def call_structured_llm(
         messages.append({'role': 'system', 'content': system_prompt})
     messages.append({'role': 'user', 'content': request_prompt})
 
-    response = client.responses.parse(
-        model=selected_model,
-        input=messages,
-        temperature=temperature,
-        max_output_tokens=max_tokens,
-        text_format=output_model,
-    )
+    with llm_metrics.track(operation, selected_model) as record:
+        response = client.responses.parse(
+            model=selected_model,
+            input=messages,
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            text_format=output_model,
+        )
+        if response.usage is not None:
+            record.input_tokens = response.usage.input_tokens
+            record.cached_input_tokens = response.usage.input_tokens_details.cached_tokens
+            record.output_tokens = response.usage.output_tokens
 
-    if not response.output_parsed:
-        raise ValueError('LLM did not return a valid response')
+        if not response.output_parsed:
+            raise ValueError('LLM did not return a valid response')
 
     return response.output_parsed
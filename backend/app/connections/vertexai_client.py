@@ -1,13 +1,44 @@
 """External service clients for vertexai client."""
 
-from typing import Any, TypeVar
+import asyncio
+import contextvars
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, ParamSpec, TypeVar
 
 from google import genai
-from google.genai.types import GenerateContentConfig, Part
+from google.genai import errors
+from google.genai.types import (
+    CreateCachedContentConfig,
+    GenerateContentConfig,
+    GenerateContentResponse,
+    HttpOptions,
+    Part,
+    UpdateCachedContentConfig,
+)
 from google.oauth2 import service_account
 from pydantic import BaseModel
 
 from app.config import Settings
+from app.services.llm_metrics import LLMCallRecord, llm_metrics
+from app.services.llm_resilience import (
+    DeadlineExceededError,
+    arun_hedged,
+    circuit_breakers,
+    get_call_timeout,
+    hedge_policy,
+    is_timeout_error,
+    remaining_time,
+    run_hedged,
+)
+from app.services.llm_response_cache import llm_response_cache
 
 settings = Settings()
 
@@ -67,6 +98,549 @@ else:
     )
 
 
+P = ParamSpec('P')
+R = TypeVar('R')
+
+ASYNC_SLOT_POLL_INTERVAL_S = 0.01
+# Handles this close to expiry are not referenced, so a call never races the expiry
+CONTEXT_CACHE_EXPIRY_MARGIN_S = 60
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of requests."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """Initialize a full bucket.
+
+        Parameters:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens, i.e. the allowed burst.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take one token if one is available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise the seconds until one is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, deadline: float | None = None) -> bool:
+        """Take one token, blocking until one is available.
+
+        Parameters:
+            deadline (float | None): Monotonic time to give up at, None to wait indefinitely.
+
+        Returns:
+            bool: True once a token was taken, False if none is available before the deadline.
+        """
+        while wait := self.try_acquire():
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, deadline: float | None = None) -> bool:
+        """Take one token, yielding to the event loop until one is available.
+
+        Parameters:
+            deadline (float | None): Monotonic time to give up at, None to wait indefinitely.
+
+        Returns:
+            bool: True once a token was taken, False if none is available before the deadline.
+        """
+        while wait := self.try_acquire():
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+        return True
+
+
+@dataclass
+class ModelLimiterMetrics:
+    """Load of a single model.
+
+    Parameters:
+        waiting (int): Calls waiting for a concurrency slot or a rate limit token.
+        in_flight (int): Calls currently running against the model.
+    """
+
+    waiting: int = 0
+    in_flight: int = 0
+
+
+@dataclass
+class LLMExecutorMetrics:
+    """Load of the shared LLM executor.
+
+    Parameters:
+        queued (int): Tasks submitted to the pool that have not started yet.
+        running (int): Tasks currently running on the pool.
+        models (dict[str, ModelLimiterMetrics]): Load per model.
+    """
+
+    queued: int = 0
+    running: int = 0
+    models: dict[str, ModelLimiterMetrics] = field(default_factory=dict)
+
+
+def _slot_deadline_error(model: str) -> DeadlineExceededError:
+    """Build the error raised when the pipeline deadline passes while waiting for a slot.
+
+    Parameters:
+        model (str): Model the call was waiting for.
+
+    Returns:
+        DeadlineExceededError: Error to raise instead of making the call.
+    """
+    return DeadlineExceededError(f'Pipeline deadline exceeded while waiting for a {model} slot')
+
+
+class LLMExecutor:
+    """Process-wide bounded executor for LLM work.
+
+    Background pipelines submit their LLM tasks to one shared pool instead of creating a
+    pool per invocation, so a burst of completions queues up instead of spawning hundreds
+    of threads. Every model call additionally takes a slot of a per-model semaphore and a
+    token of a per-model token bucket, which keeps the request rate below the quota.
+    Tasks run in a copy of the submitter's context, so a pipeline deadline reaches the
+    model calls of its tasks.
+    """
+
+    def __init__(
+        self, max_workers: int, max_concurrency_per_model: int, requests_per_minute: int
+    ) -> None:
+        """Initialize the executor.
+
+        Parameters:
+            max_workers (int): Number of threads of the shared pool.
+            max_concurrency_per_model (int): Maximum number of concurrent calls per model.
+            requests_per_minute (int): Maximum number of calls per model and minute.
+        """
+        self.max_concurrency_per_model = max_concurrency_per_model
+        self.requests_per_minute = requests_per_minute
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm')
+        self._metrics = LLMExecutorMetrics()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+        """Run a task on the shared pool.
+
+        Parameters:
+            fn (Callable[P, R]): Task to run.
+            *args (P.args): Positional arguments of the task.
+            **kwargs (P.kwargs): Keyword arguments of the task.
+
+        Returns:
+            Future[R]: Future of the task result.
+        """
+        with self._lock:
+            self._metrics.queued += 1
+            queued = self._metrics.queued
+        logging.debug('LLM executor queue depth: %d', queued)
+        # The task sees the context of the submitter, e.g. the deadline of its pipeline
+        context = contextvars.copy_context()
+        return self._pool.submit(context.run, self._run, fn, *args, **kwargs)
+
+    def _run(self, fn: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Run a submitted task and keep the queue metrics up to date.
+
+        Parameters:
+            fn (Callable[P, R]): Task to run.
+            *args (P.args): Positional arguments of the task.
+            **kwargs (P.kwargs): Keyword arguments of the task.
+
+        Returns:
+            R: Result of the task.
+        """
+        with self._lock:
+            self._metrics.queued -= 1
+            self._metrics.running += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._metrics.running -= 1
+
+    def _get_model_limits(
+        self, model: str
+    ) -> tuple[threading.BoundedSemaphore, TokenBucket, ModelLimiterMetrics]:
+        """Return the limits of a model, creating them on first use.
+
+        Parameters:
+            model (str): Model the call is made against.
+
+        Returns:
+            tuple[threading.BoundedSemaphore, TokenBucket, ModelLimiterMetrics]: Concurrency
+                semaphore, rate limit bucket and metrics of the model.
+        """
+        with self._lock:
+            if model not in self._semaphores:
+                self._semaphores[model] = threading.BoundedSemaphore(self.max_concurrency_per_model)
+                self._buckets[model] = TokenBucket(
+                    rate=self.requests_per_minute / 60, capacity=self.max_concurrency_per_model
+                )
+                self._metrics.models[model] = ModelLimiterMetrics()
+            return self._semaphores[model], self._buckets[model], self._metrics.models[model]
+
+    def _update_model_metrics(
+        self, model_metrics: ModelLimiterMetrics, waiting: int = 0, in_flight: int = 0
+    ) -> None:
+        """Adjust the load counters of a model.
+
+        Parameters:
+            model_metrics (ModelLimiterMetrics): Metrics of the model.
+            waiting (int): Change of the number of waiting calls.
+            in_flight (int): Change of the number of calls in flight.
+
+        Returns:
+            None: This function mutates the metrics in-place.
+        """
+        with self._lock:
+            model_metrics.waiting += waiting
+            model_metrics.in_flight += in_flight
+
+    @contextmanager
+    def model_slot(self, model: str) -> Iterator[None]:
+        """Hold a concurrency slot of a model and respect its rate limit.
+
+        The wait for the slot is bounded by the deadline of the running pipeline.
+
+        Parameters:
+            model (str): Model the call is made against.
+
+        Returns:
+            Iterator[None]: Yields once the call may be made.
+
+        Raises:
+            DeadlineExceededError: If the pipeline deadline passes while waiting.
+        """
+        semaphore, bucket, model_metrics = self._get_model_limits(model)
+        remaining = remaining_time()
+        deadline = None if remaining is None else time.monotonic() + remaining
+        self._update_model_metrics(model_metrics, waiting=1)
+        try:
+            if not semaphore.acquire(timeout=remaining):
+                raise _slot_deadline_error(model)
+            try:
+                if not bucket.acquire(deadline):
+                    raise _slot_deadline_error(model)
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self._update_model_metrics(model_metrics, waiting=-1)
+
+        self._update_model_metrics(model_metrics, in_flight=1)
+        try:
+            yield
+        finally:
+            self._update_model_metrics(model_metrics, in_flight=-1)
+            semaphore.release()
+
+    @asynccontextmanager
+    async def amodel_slot(self, model: str) -> AsyncIterator[None]:
+        """Hold a concurrency slot of a model without blocking the event loop.
+
+        The slot is taken from the same semaphore and token bucket as in `model_slot`,
+        so sync and async calls share the limits of a model across threads and loops.
+
+        Parameters:
+            model (str): Model the call is made against.
+
+        Returns:
+            AsyncIterator[None]: Yields once the call may be made.
+
+        Raises:
+            DeadlineExceededError: If the pipeline deadline passes while waiting.
+        """
+        semaphore, bucket, model_metrics = self._get_model_limits(model)
+        remaining = remaining_time()
+        deadline = None if remaining is None else time.monotonic() + remaining
+        self._update_model_metrics(model_metrics, waiting=1)
+        try:
+            while not semaphore.acquire(blocking=False):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise _slot_deadline_error(model)
+                await asyncio.sleep(ASYNC_SLOT_POLL_INTERVAL_S)
+            try:
+                if not await bucket.acquire_async(deadline):
+                    raise _slot_deadline_error(model)
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self._update_model_metrics(model_metrics, waiting=-1)
+
+        self._update_model_metrics(model_metrics, in_flight=1)
+        try:
+            yield
+        finally:
+            self._update_model_metrics(model_metrics, in_flight=-1)
+            semaphore.release()
+
+    def get_metrics(self) -> LLMExecutorMetrics:
+        """Return a snapshot of the executor load.
+
+        Returns:
+            LLMExecutorMetrics: Queue depth, running tasks and load per model.
+        """
+        with self._lock:
+            return LLMExecutorMetrics(
+                queued=self._metrics.queued,
+                running=self._metrics.running,
+                models={
+                    model: ModelLimiterMetrics(metrics.waiting, metrics.in_flight)
+                    for model, metrics in self._metrics.models.items()
+                },
+            )
+
+
+llm_executor = LLMExecutor(
+    max_workers=settings.LLM_EXECUTOR_MAX_WORKERS,
+    max_concurrency_per_model=settings.LLM_MODEL_MAX_CONCURRENCY,
+    requests_per_minute=settings.LLM_MODEL_REQUESTS_PER_MINUTE,
+)
+
+# Runs the requests of hedged blocking calls, while the caller waits for the first response
+hedge_pool = ThreadPoolExecutor(
+    max_workers=settings.LLM_EXECUTOR_MAX_WORKERS, thread_name_prefix='llm-hedge'
+)
+
+
+def _resolve_model(model: str) -> str:
+    """Return the model a call is actually made against.
+
+    Parameters:
+        model (str): Requested model name.
+
+    Returns:
+        str: The cheap model when it is forced or nothing was requested, else the model.
+    """
+    return DEFAULT_CHEAP_MODEL if FORCE_CHEAP_MODEL else (model or DEFAULT_CHEAP_MODEL)
+
+
+@dataclass
+class ContextCacheEntry:
+    """State of a static system prompt registered for context caching.
+
+    Parameters:
+        model (str): Model the cached content is bound to.
+        system_prompt (str): Static system prompt.
+        name (str | None): Handle of the cached content, None while it is served inline.
+        expires_at (float): Monotonic time at which the cached content expires.
+        retry_at (float): Monotonic time before which a failed creation is not retried.
+    """
+
+    model: str
+    system_prompt: str
+    name: str | None = None
+    expires_at: float = 0.0
+    retry_at: float = 0.0
+
+
+class VertexContextCache:
+    """Static system prompts stored once as Vertex AI cached content.
+
+    Call sites register their static prompts once at startup. `refresh` creates the cached
+    contents and extends their lifetime before they expire, and is run by the scheduler, so
+    no request waits for it. Calls with a registered prompt reference its handle instead of
+    sending the prompt inline. Prompts below the provider minimum, failed creations and
+    handles close to expiry all fall back to the inline prompt.
+    """
+
+    def __init__(self, enabled: bool, ttl: int, min_tokens: int) -> None:
+        """Initialize an empty registry.
+
+        Parameters:
+            enabled (bool): Whether prompts are cached with the provider at all.
+            ttl (int): Lifetime of a cached content in seconds.
+            min_tokens (int): Minimum prompt size the provider accepts for caching.
+        """
+        self.enabled = enabled
+        self.ttl = ttl
+        self.min_tokens = min_tokens
+        self._entries: dict[str, ContextCacheEntry] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(model: str, system_prompt: str) -> str:
+        """Return the registry key of a prompt on a model.
+
+        Parameters:
+            model (str): Model the call is made against.
+            system_prompt (str): Static system prompt.
+
+        Returns:
+            str: SHA-256 hex digest over the model and prompt.
+        """
+        return hashlib.sha256(f'{model}\0{system_prompt}'.encode()).hexdigest()
+
+    def register(self, system_prompt: str, model: str = DEFAULT_MODEL) -> None:
+        """Register a static system prompt for caching.
+
+        Parameters:
+            system_prompt (str): Static system prompt.
+            model (str): Model the prompt is sent to.
+
+        Returns:
+            None: This function mutates the registry in-place.
+        """
+        selected_model = _resolve_model(model)
+        key = self._make_key(selected_model, system_prompt)
+        with self._lock:
+            self._entries.setdefault(key, ContextCacheEntry(selected_model, system_prompt))
+
+    def get_handle(self, model: str, system_prompt: str | None) -> str | None:
+        """Return the cached content handle of a prompt.
+
+        Parameters:
+            model (str): Model the call is made against.
+            system_prompt (str | None): System prompt of the call.
+
+        Returns:
+            str | None: Handle of a live cached content, or None to send the prompt inline.
+        """
+        if not self.enabled or not system_prompt:
+            return None
+        with self._lock:
+            entry = self._entries.get(self._make_key(model, system_prompt))
+            if entry is None or entry.name is None:
+                return None
+            if entry.expires_at - time.monotonic() < CONTEXT_CACHE_EXPIRY_MARGIN_S:
+                return None
+            return entry.name
+
+    def invalidate(self, name: str) -> None:
+        """Stop referencing a handle the provider rejected and delete its cached content.
+
+        The next refresh creates a new cached content. Deleting the rejected one keeps it
+        from lingering with the provider until its TTL, if it still exists at all.
+
+        Parameters:
+            name (str): Handle of the cached content.
+
+        Returns:
+            None: This function mutates the registry in-place.
+        """
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.name == name:
+                    entry.name = None
+                    entry.retry_at = 0.0
+        if vertexai_client is None:
+            return
+        try:
+            vertexai_client.caches.delete(name=name)
+        except Exception as e:
+            logging.debug(f'Deleting rejected cached content {name} failed: {e}')
+
+    def _create(self, entry: ContextCacheEntry, client: genai.Client) -> None:
+        """Create the cached content of a registered prompt.
+
+        Parameters:
+            entry (ContextCacheEntry): Registered prompt.
+            client (genai.Client): Vertex AI client.
+
+        Returns:
+            None: This function mutates the entry in-place.
+        """
+        tokens = client.models.count_tokens(model=entry.model, contents=entry.system_prompt)
+        if tokens.total_tokens is None or tokens.total_tokens < self.min_tokens:
+            # The prompt is static, so it is not checked again
+            entry.retry_at = float('inf')
+            return
+        cached_content = client.caches.create(
+            model=entry.model,
+            config=CreateCachedContentConfig(
+                system_instruction=entry.system_prompt, ttl=f'{self.ttl}s'
+            ),
+        )
+        with self._lock:
+            entry.expires_at = time.monotonic() + self.ttl
+            entry.name = cached_content.name
+
+    def _extend(self, entry: ContextCacheEntry, name: str, client: genai.Client) -> None:
+        """Extend the lifetime of the cached content of a registered prompt.
+
+        Parameters:
+            entry (ContextCacheEntry): Registered prompt.
+            name (str): Handle of its cached content.
+            client (genai.Client): Vertex AI client.
+
+        Returns:
+            None: This function mutates the entry in-place.
+        """
+        client.caches.update(name=name, config=UpdateCachedContentConfig(ttl=f'{self.ttl}s'))
+        with self._lock:
+            entry.expires_at = time.monotonic() + self.ttl
+
+    def refresh(self) -> None:
+        """Create missing cached contents and extend those expiring before the next refresh.
+
+        Returns:
+            None: This function mutates the registry in-place.
+        """
+        client = vertexai_client
+        if not self.enabled or not ENABLE_AI or client is None:
+            return
+        with self._lock:
+            entries = list(self._entries.values())
+        now = time.monotonic()
+        for entry in entries:
+            try:
+                if entry.name is None:
+                    if now >= entry.retry_at:
+                        self._create(entry, client)
+                elif entry.expires_at - now < self.ttl / 2:
+                    self._extend(entry, entry.name, client)
+            except Exception as e:
+                logging.warning(f'Context caching of a system prompt for {entry.model} failed: {e}')
+                with self._lock:
+                    entry.name = None
+                    entry.retry_at = now + self.ttl
+
+    def clear(self) -> None:
+        """Delete all cached contents with the provider and drop their handles.
+
+        Returns:
+            None: This function mutates the registry in-place.
+        """
+        with self._lock:
+            names = [entry.name for entry in self._entries.values() if entry.name]
+            for entry in self._entries.values():
+                entry.name = None
+                entry.retry_at = 0.0
+        if vertexai_client is None:
+            return
+        for name in names:
+            try:
+                vertexai_client.caches.delete(name=name)
+            except Exception as e:
+                logging.warning(f'Deleting cached content {name} failed: {e}')
+
+
+vertex_context_cache = VertexContextCache(
+    enabled=settings.VERTEX_CONTEXT_CACHE_ENABLED,
+    ttl=settings.VERTEX_CONTEXT_CACHE_TTL_SECONDS,
+    min_tokens=settings.VERTEX_CONTEXT_CACHE_MIN_TOKENS,
+)
+
+
 def generate_content_vertexai(contents: list[Any], model: str = DEFAULT_CHEAP_MODEL) -> str:
     """Generate text content using Gemini on Vertex AI.
 
@@ -84,7 +658,8 @@ def generate_content_vertexai(contents: list[Any], model: str = DEFAULT_CHEAP_MO
         print('None found in Gemini on VertexAI contents')
         return ''
     try:
-        response = vertexai_client.models.generate_content(model=model, contents=contents)
+        with llm_executor.model_slot(model):
+            response = vertexai_client.models.generate_content(model=model, contents=contents)
         return response.text or ''
     except Exception as e:
         print(f'Gemini on VertexAI content generation failed: {e}')
@@ -114,6 +689,288 @@ def upload_audio_vertexai(audio_uri: str) -> Part | None:
 T = TypeVar('T', bound=BaseModel)
 
 
+def _build_audio_request(
+    request_prompt: str,
+    audio_uri: str,
+    system_prompt: str | None,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+) -> tuple[str, list[Any], GenerateContentConfig]:
+    """Build the model, contents and config of a call with text and audio input.
+
+    Parameters:
+        request_prompt (str): User prompt content.
+        audio_uri (str): Audio URI or object key.
+        system_prompt (str | None): Optional system prompt.
+        model (str): Requested model name.
+        max_tokens (int): Maximum output tokens.
+        temperature (float): Sampling temperature.
+
+    Returns:
+        tuple[str, list[Any], GenerateContentConfig]: Selected model, contents and config.
+    """
+    if not audio_uri.startswith('gs'):
+        audio_uri = f'gs://{settings.GCP_BUCKET}/audio/{audio_uri}'
+    part = Part.from_uri(file_uri=audio_uri)
+    selected_model = _resolve_model(model)
+    config = GenerateContentConfig(
+        system_instruction=system_prompt,
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+    )
+    return selected_model, [request_prompt, part], config
+
+
+def _build_structured_request(
+    request_prompt: str,
+    output_model: type[BaseModel],
+    system_prompt: str | None,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    audio_uri: str | None,
+) -> tuple[str, list[Any], GenerateContentConfig]:
+    """Build the model, contents and config of a structured call.
+
+    Parameters:
+        request_prompt (str): User prompt content.
+        output_model (type[BaseModel]): Pydantic model for structured parsing.
+        system_prompt (str | None): Optional system prompt.
+        model (str): Requested model name.
+        temperature (float): Sampling temperature.
+        max_tokens (int): Maximum output tokens.
+        audio_uri (str | None): Optional audio input reference.
+
+    Returns:
+        tuple[str, list[Any], GenerateContentConfig]: Selected model, contents and config.
+    """
+    selected_model = _resolve_model(model)
+    if audio_uri:
+        contents = [request_prompt, Part.from_uri(file_uri=audio_uri)]
+    else:
+        contents = [request_prompt]
+    config = GenerateContentConfig(
+        system_instruction=system_prompt,
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+        response_schema=output_model,
+        response_mime_type='application/json',
+    )
+    return selected_model, contents, config
+
+
+def _parse_structured_response[T: BaseModel](response_text: str | None, output_model: type[T]) -> T:
+    """Parse the text of a structured response.
+
+    Parameters:
+        response_text (str | None): Response text returned by the model.
+        output_model (type[T]): Pydantic model for structured parsing.
+
+    Returns:
+        T: Parsed structured response.
+
+    Raises:
+        ValueError: If the response is empty or cannot be parsed.
+    """
+    if not response_text:
+        raise ValueError('Gemini on VertexAI did not return a valid response')
+    return output_model.model_validate_json(response_text)
+
+
+def _apply_context_cache(
+    selected_model: str, system_prompt: str | None, config: GenerateContentConfig
+) -> tuple[GenerateContentConfig, str | None]:
+    """Reference the cached content of a registered system prompt instead of sending it.
+
+    Parameters:
+        selected_model (str): Model the call is made against.
+        system_prompt (str | None): System prompt of the call.
+        config (GenerateContentConfig): Config with the inline system prompt.
+
+    Returns:
+        tuple[GenerateContentConfig, str | None]: Config to send and the referenced handle,
+            or the unchanged config and None when the prompt is not cached.
+    """
+    handle = vertex_context_cache.get_handle(selected_model, system_prompt)
+    if handle is None:
+        return config, None
+    return config.model_copy(update={'system_instruction': None, 'cached_content': handle}), handle
+
+
+def _apply_timeout(config: GenerateContentConfig, timeout: float) -> GenerateContentConfig:
+    """Bound the HTTP request of a call by a timeout.
+
+    Parameters:
+        config (GenerateContentConfig): Config of the call.
+        timeout (float): Timeout in seconds.
+
+    Returns:
+        GenerateContentConfig: Copy of the config with the timeout set.
+    """
+    return config.model_copy(update={'http_options': HttpOptions(timeout=int(timeout * 1000))})
+
+
+def _is_cached_content_rejection(error: Exception) -> bool:
+    """Return whether the provider rejected the cached content referenced by a call.
+
+    Only a NOT_FOUND or INVALID_ARGUMENT error naming the cached content means that the
+    handle is stale. Timeouts, rate limits and server errors say nothing about the handle.
+
+    Parameters:
+        error (Exception): Error raised by the call.
+
+    Returns:
+        bool: True if the cached content was rejected.
+    """
+    if not isinstance(error, errors.ClientError) or error.code not in (400, 404):
+        return False
+    message = ''.join(char for char in str(error).lower() if char.isalnum())
+    return 'cachedcontent' in message
+
+
+def _send_request(
+    selected_model: str, contents: list[Any], config: GenerateContentConfig
+) -> GenerateContentResponse:
+    """Send a request while holding a model slot.
+
+    The timeout is taken once the slot is held, so the time spent waiting for the slot is
+    not granted to the request again.
+
+    Parameters:
+        selected_model (str): Model the call is made against.
+        contents (list[Any]): Contents of the request.
+        config (GenerateContentConfig): Config of the request.
+
+    Returns:
+        GenerateContentResponse: Response returned by the model.
+
+    Raises:
+        DeadlineExceededError: If the request timed out at the pipeline deadline.
+    """
+    timeout = get_call_timeout(settings.LLM_CALL_TIMEOUT_SECONDS)
+    try:
+        return vertexai_client.models.generate_content(
+            model=selected_model, contents=contents, config=_apply_timeout(config, timeout)
+        )
+    except Exception as e:
+        if timeout < settings.LLM_CALL_TIMEOUT_SECONDS and is_timeout_error(e):
+            raise DeadlineExceededError(f'Pipeline deadline exceeded during the call: {e}') from e
+        raise
+
+
+async def _asend_request(
+    selected_model: str, contents: list[Any], config: GenerateContentConfig
+) -> GenerateContentResponse:
+    """Send a request through the asyncio client while holding a model slot.
+
+    Parameters:
+        selected_model (str): Model the call is made against.
+        contents (list[Any]): Contents of the request.
+        config (GenerateContentConfig): Config of the request.
+
+    Returns:
+        GenerateContentResponse: Response returned by the model.
+
+    Raises:
+        DeadlineExceededError: If the request timed out at the pipeline deadline.
+    """
+    timeout = get_call_timeout(settings.LLM_CALL_TIMEOUT_SECONDS)
+    try:
+        return await vertexai_client.aio.models.generate_content(
+            model=selected_model, contents=contents, config=_apply_timeout(config, timeout)
+        )
+    except Exception as e:
+        if timeout < settings.LLM_CALL_TIMEOUT_SECONDS and is_timeout_error(e):
+            raise DeadlineExceededError(f'Pipeline deadline exceeded during the call: {e}') from e
+        raise
+
+
+def _generate_content(
+    selected_model: str,
+    contents: list[Any],
+    config: GenerateContentConfig,
+    cached_config: GenerateContentConfig,
+    handle: str | None,
+) -> GenerateContentResponse:
+    """Generate content, sending the prompt inline if its cached content was rejected.
+
+    The inline request takes a new model slot and rate limit token.
+
+    Parameters:
+        selected_model (str): Model the call is made against.
+        contents (list[Any]): Contents of the request.
+        config (GenerateContentConfig): Config with the inline system prompt.
+        cached_config (GenerateContentConfig): Config that references the cached content.
+        handle (str | None): Referenced cached content, or None when the prompt is inline.
+
+    Returns:
+        GenerateContentResponse: Response returned by the model.
+    """
+    try:
+        with llm_executor.model_slot(selected_model):
+            return _send_request(selected_model, contents, cached_config)
+    except Exception as e:
+        if handle is None or not _is_cached_content_rejection(e):
+            raise
+        logging.warning(f'Cached content {handle} was rejected, sending prompt inline: {e}')
+        vertex_context_cache.invalidate(handle)
+
+    with llm_executor.model_slot(selected_model):
+        return _send_request(selected_model, contents, config)
+
+
+async def _agenerate_content(
+    selected_model: str,
+    contents: list[Any],
+    config: GenerateContentConfig,
+    cached_config: GenerateContentConfig,
+    handle: str | None,
+) -> GenerateContentResponse:
+    """Generate content through the asyncio client, see `_generate_content`.
+
+    Parameters:
+        selected_model (str): Model the call is made against.
+        contents (list[Any]): Contents of the request.
+        config (GenerateContentConfig): Config with the inline system prompt.
+        cached_config (GenerateContentConfig): Config that references the cached content.
+        handle (str | None): Referenced cached content, or None when the prompt is inline.
+
+    Returns:
+        GenerateContentResponse: Response returned by the model.
+    """
+    try:
+        async with llm_executor.amodel_slot(selected_model):
+            return await _asend_request(selected_model, contents, cached_config)
+    except Exception as e:
+        if handle is None or not _is_cached_content_rejection(e):
+            raise
+        logging.warning(f'Cached content {handle} was rejected, sending prompt inline: {e}')
+        await asyncio.to_thread(vertex_context_cache.invalidate, handle)
+
+    async with llm_executor.amodel_slot(selected_model):
+        return await _asend_request(selected_model, contents, config)
+
+
+def _record_usage(record: LLMCallRecord, response: GenerateContentResponse) -> None:
+    """Copy the token usage reported with a response into the call record.
+
+    Parameters:
+        record (LLMCallRecord): Record of the call.
+        response (GenerateContentResponse): Response returned by the model.
+
+    Returns:
+        None: This function mutates the record in-place.
+    """
+    # Usage metadata is optional, e.g. for responses that were blocked
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is None:
+        return
+    record.input_tokens = int(usage.prompt_token_count or 0)
+    record.cached_input_tokens = int(usage.cached_content_token_count or 0)
+    record.output_tokens = int(usage.candidates_token_count or 0)
+
+
 def call_llm_with_audio(
     request_prompt: str,
     audio_uri: str,
@@ -121,6 +978,7 @@ def call_llm_with_audio(
     model: str = DEFAULT_MODEL,
     max_tokens: int = VERTEXAI_MAX_TOKENS,
     temperature: float = 1.0,
+    operation: str = 'audio',
 ) -> str:
     """Call Gemini on Vertex AI with text and audio input.
 
@@ -131,6 +989,7 @@ def call_llm_with_audio(
         model (str): Model name to use.
         max_tokens (int): Maximum output tokens.
         temperature (float): Sampling temperature.
+        operation (str): Logical operation the call is recorded under.
 
     Returns:
         str: Generated response text, or an empty string on failure.
@@ -138,27 +997,57 @@ def call_llm_with_audio(
     if not ENABLE_AI or vertexai_client is None:
         return ''
     try:
-        if not audio_uri.startswith('gs'):
-            audio_uri = f'gs://{settings.GCP_BUCKET}/audio/{audio_uri}'
-        part = Part.from_uri(file_uri=audio_uri)
-        selected_model = (
-            DEFAULT_CHEAP_MODEL if FORCE_CHEAP_MODEL else (model or DEFAULT_CHEAP_MODEL)
-        )
-        response = vertexai_client.models.generate_content(
-            model=selected_model,
-            contents=[request_prompt, part],
-            config=GenerateContentConfig(
-                system_instruction=system_prompt,
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            ),
+        selected_model, contents, config = _build_audio_request(
+            request_prompt, audio_uri, system_prompt, model, max_tokens, temperature
         )
+        breaker = circuit_breakers.get(selected_model)
+        with llm_metrics.track(operation, selected_model) as record, breaker.guard():
+            with llm_executor.model_slot(selected_model):
+                response = _send_request(selected_model, contents, config)
+            _record_usage(record, response)
+        return response.text or ''
+    except Exception as e:
+        logging.error(f"LLM call {operation} with audio file '{audio_uri}' failed: {e}")
+        return ''
+
+
+async def acall_llm_with_audio(
+    request_prompt: str,
+    audio_uri: str,
+    system_prompt: str | None = None,
+    model: str = DEFAULT_MODEL,
+    max_tokens: int = VERTEXAI_MAX_TOKENS,
+    temperature: float = 1.0,
+    operation: str = 'audio',
+) -> str:
+    """Call Gemini on Vertex AI with text and audio input without blocking a thread.
 
-        if not response.text:
-            return ''
-        return response.text
+    Parameters:
+        request_prompt (str): User prompt content.
+        audio_uri (str): Audio URI or object key.
+        system_prompt (str | None): Optional system prompt.
+        model (str): Model name to use.
+        max_tokens (int): Maximum output tokens.
+        temperature (float): Sampling temperature.
+        operation (str): Logical operation the call is recorded under.
+
+    Returns:
+        str: Generated response text, or an empty string on failure.
+    """
+    if not ENABLE_AI or vertexai_client is None:
+        return ''
+    try:
+        selected_model, contents, config = _build_audio_request(
+            request_prompt, audio_uri, system_prompt, model, max_tokens, temperature
+        )
+        breaker = circuit_breakers.get(selected_model)
+        with llm_metrics.track(operation, selected_model) as record, breaker.guard():
+            async with llm_executor.amodel_slot(selected_model):
+                response = await _asend_request(selected_model, contents, config)
+            _record_usage(record, response)
+        return response.text or ''
     except Exception as e:
-        print(f"Error uploading audio file '{audio_uri}': {e}")
+        logging.error(f"LLM call {operation} with audio file '{audio_uri}' failed: {e}")
         return ''
 
 
@@ -171,6 +1060,8 @@ def call_structured_llm(
     max_tokens: int = VERTEXAI_MAX_TOKENS,
     audio_uri: str | None = None,
     mock_response: T | None = None,
+    cache: bool = False,
+    operation: str = 'unknown',
 ) -> T:
     """Call Gemini on Vertex AI and parse a structured response.
 
@@ -183,6 +1074,8 @@ def call_structured_llm(
         max_tokens (int): Maximum output tokens.
         audio_uri (str | None): Optional audio input reference.
         mock_response (T | None): Fallback response when AI is disabled.
+        cache (bool): Serve identical calls from the response cache, for deterministic calls.
+        operation (str): Logical operation the call is recorded under, e.g. 'scoring'.
 
     Returns:
         T: Parsed structured response.
@@ -195,28 +1088,113 @@ def call_structured_llm(
             raise ValueError('AI is disabled and no mock response provided')
         return mock_response
 
-    selected_model = DEFAULT_CHEAP_MODEL if FORCE_CHEAP_MODEL else (model or DEFAULT_CHEAP_MODEL)
-    if audio_uri:
-        contents = [request_prompt, Part.from_uri(file_uri=audio_uri)]
-    else:
-        contents = [request_prompt]
-    response = vertexai_client.models.generate_content(
-        model=selected_model,
-        contents=contents,
-        config=GenerateContentConfig(
-            system_instruction=system_prompt,
-            temperature=temperature,
-            max_output_tokens=max_tokens,
-            response_schema=output_model,
-            response_mime_type='application/json',
-        ),
+    selected_model, contents, config = _build_structured_request(
+        request_prompt, output_model, system_prompt, model, temperature, max_tokens, audio_uri
     )
+    cache_key = None
+    if cache:
+        cache_key = llm_response_cache.make_key(
+            selected_model,
+            system_prompt,
+            request_prompt,
+            output_model,
+            audio_uri,
+            temperature,
+            max_tokens,
+        )
+        cached_response = llm_response_cache.get(cache_key)
+        if cached_response is not None:
+            llm_metrics.record_cache_hit(operation, selected_model)
+            return output_model.model_validate_json(cached_response)
 
-    if not response.text:
-        raise ValueError('Gemini on VertexAI did not return a valid response')
+    cached_config, handle = _apply_context_cache(selected_model, system_prompt, config)
+    generate = partial(_generate_content, selected_model, contents, config, cached_config, handle)
+    with llm_metrics.track(operation, selected_model) as record:
+        start = time.monotonic()
+        with circuit_breakers.get(selected_model).guard():
+            response = run_hedged(
+                generate, hedge_policy.get_delay(operation, selected_model), hedge_pool
+            )
+        hedge_policy.observe(operation, selected_model, time.monotonic() - start)
+        _record_usage(record, response)
+        result = _parse_structured_response(response.text, output_model)
+    if cache_key:
+        # Only responses that parsed are cached, so a bad response is retried
+        llm_response_cache.set(cache_key, response.text)
+    return result
 
-    json_response = response.text
-    try:
-        return output_model.model_validate_json(json_response)
-    except Exception:
-        raise
+
+async def acall_structured_llm[T: BaseModel](
+    request_prompt: str,
+    output_model: type[T],
+    system_prompt: str | None = None,
+    model: str = DEFAULT_MODEL,
+    temperature: float = 1,
+    max_tokens: int = VERTEXAI_MAX_TOKENS,
+    audio_uri: str | None = None,
+    mock_response: T | None = None,
+    cache: bool = False,
+    operation: str = 'unknown',
+) -> T:
+    """Call Gemini on Vertex AI through the asyncio client and parse a structured response.
+
+    Behaves like `call_structured_llm`, but awaits the model instead of blocking a thread,
+    so many calls can be fanned out with `asyncio.gather` on one event loop.
+
+    Parameters:
+        request_prompt (str): User prompt content.
+        output_model (type[T]): Pydantic model for structured parsing.
+        system_prompt (str | None): Optional system prompt.
+        model (str): Model name to use.
+        temperature (float): Sampling temperature.
+        max_tokens (int): Maximum output tokens.
+        audio_uri (str | None): Optional audio input reference.
+        mock_response (T | None): Fallback response when AI is disabled.
+        cache (bool): Serve identical calls from the response cache, for deterministic calls.
+        operation (str): Logical operation the call is recorded under, e.g. 'scoring'.
+
+    Returns:
+        T: Parsed structured response.
+
+    Raises:
+        ValueError: If AI is disabled without a mock response or parsing fails.
+    """
+    if not ENABLE_AI or vertexai_client is None:
+        if not mock_response:
+            raise ValueError('AI is disabled and no mock response provided')
+        return mock_response
+
+    selected_model, contents, config = _build_structured_request(
+        request_prompt, output_model, system_prompt, model, temperature, max_tokens, audio_uri
+    )
+    cache_key = None
+    if cache:
+        cache_key = llm_response_cache.make_key(
+            selected_model,
+            system_prompt,
+            request_prompt,
+            output_model,
+            audio_uri,
+            temperature,
+            max_tokens,
+        )
+        cached_response = await llm_response_cache.aget(cache_key)
+        if cached_response is not None:
+            llm_metrics.record_cache_hit(operation, selected_model)
+            return output_model.model_validate_json(cached_response)
+
+    cached_config, handle = _apply_context_cache(selected_model, system_prompt, config)
+    generate = partial(_agenerate_content, selected_model, contents, config, cached_config, handle)
+    with llm_metrics.track(operation, selected_model) as record:
+        start = time.monotonic()
+        with circuit_breakers.get(selected_model).guard():
+            response = await arun_hedged(
+                generate, hedge_policy.get_delay(operation, selected_model)
+            )
+        hedge_policy.observe(operation, selected_model, time.monotonic() - start)
+        _record_usage(record, response)
+        result = _parse_structured_response(response.text, output_model)
+    if cache_key:
+        # Only responses that parsed are cached, so a bad response is retried
+        await llm_response_cache.aset(cache_key, response.text)
+    return result
@@ -1888,6 +1888,7 @@ def get_dummy_app_configs() -> list[AppConfig]:
     """
     return [
         AppConfig(key='defaultDailyUserSessionLimit', value='10', type=ConfigType.int),
+        AppConfig(key='scenarioPreparationReuseEnabled', value='true', type=ConfigType.boolean),
     ]
 
 
@@ -1,6 +1,10 @@
 """Dependency providers for auth."""
 
+import copy
+import hashlib
+import hmac
 import logging
+import time
 from datetime import datetime
 from typing import Annotated, Any, NoReturn, TypedDict
 from uuid import UUID
@@ -10,16 +14,41 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pytz import UTC
 from pytz import timezone as pytz_timezone
+from sqlalchemy import case, event, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import Session as DBSession
-from sqlmodel import select
+from sqlmodel import col, select
 
 from app.config import Settings
 from app.dependencies.database import get_db_session
 from app.models import UserProfile
 from app.models.user_profile import AccountRole
+from app.services.ttl_cache import TTLCache
 
 settings = Settings()
 security = HTTPBearer(auto_error=not (settings.stage == 'dev' and settings.DEV_MODE_SKIP_AUTH))
+metrics_security = HTTPBearer(auto_error=False)
+
+# Verified JWT payloads keyed by the SHA-256 digest of the token, each kept until its `exp`
+jwt_payload_cache = TTLCache(maxsize=settings.JWT_CACHE_MAX_SIZE, ttl=0)
+
+# Column values of recently authenticated user profiles keyed by user ID. ORM flushes evict
+# a profile through the mapper events below, bulk statements have to pop it themselves.
+user_profile_cache = TTLCache(
+    maxsize=settings.USER_PROFILE_CACHE_MAX_SIZE, ttl=settings.USER_PROFILE_CACHE_TTL_SECONDS
+)
+
+# Columns that role and daily quota checks depend on, always read from the database because
+# other workers change them while this worker has the profile cached
+FRESH_PROFILE_COLUMNS = (
+    'account_role',
+    'daily_session_limit',
+    'sessions_created_today',
+    'last_session_date',
+)
 
 
 class JWTPayload(TypedDict, total=False):
@@ -101,10 +130,17 @@ def verify_jwt(
         )
 
     token = credentials.credentials
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    cached_payload = jwt_payload_cache.get(token_hash)
+    if cached_payload is not None:
+        return JWTPayload(**cached_payload)
+    logging.debug('JWT cache miss, hit rate %.2f', jwt_payload_cache.hit_rate)
+
     try:
         payload = jwt.decode(
             token, settings.SUPABASE_JWT_SECRET, algorithms=['HS256'], audience='authenticated'
         )
+        _cache_jwt_payload(token_hash, payload)
         return payload
     except jwt.ExpiredSignatureError as err:
         logging.info('JWT token expired')
@@ -123,6 +159,27 @@ def verify_jwt(
         ) from e
 
 
+def _cache_jwt_payload(token_hash: str, payload: JWTPayload) -> None:
+    """Remember a verified JWT payload until the token expires.
+
+    Tokens without an expiration claim are not cached, since they would never be
+    validated again.
+
+    Parameters:
+        token_hash (str): SHA-256 hex digest of the raw token.
+        payload (JWTPayload): Decoded and validated JWT payload.
+
+    Returns:
+        None: This function mutates the JWT payload cache in-place.
+    """
+    exp = payload.get('exp')
+    if exp is None:
+        return
+    ttl = exp - time.time()
+    if ttl > 0:
+        jwt_payload_cache.set(token_hash, payload, ttl=ttl)
+
+
 def require_user(
     token: Annotated[JWTPayload, Depends(verify_jwt)],
     db: Annotated[DBSession, Depends(get_db_session)],
@@ -142,11 +199,7 @@ def require_user(
     Raises:
         HTTPException: If authentication or authorization fails.
     """
-    user_id = token.get('sub') or _forbidden('Cannot find user', 'JWT payload missing "sub" claim')
-
-    user = db.exec(
-        select(UserProfile).where(UserProfile.id == UUID(user_id))
-    ).first() or _forbidden('Cannot find user', 'User not found for ID %s', user_id)
+    user = _get_user_profile(token, db, request)
 
     if user.account_role.value not in ALLOWED_ROLES:
         _forbidden(
@@ -155,9 +208,8 @@ def require_user(
             user.account_role,
             *ALLOWED_ROLES,
         )
-    timezone = request.state.timezone
 
-    _update_login_streak(db, user, timezone)
+    _record_login(db, user, request)
 
     return user
 
@@ -180,20 +232,105 @@ def require_admin(
     Raises:
         HTTPException: If authentication or authorization fails.
     """
-    user_id = token.get('sub') or _forbidden('Cannot find user', 'JWT payload missing "sub" claim')
-
-    user = db.exec(
-        select(UserProfile).where(UserProfile.id == UUID(user_id))
-    ).first() or _forbidden('Cannot find user', 'User not found for ID %s', user_id)
+    user = _get_user_profile(token, db, request)
 
     if user.account_role is not AccountRole.admin:
         _forbidden('Admin access required', 'User role %s is not admin', user.account_role.value)
-    timezone = request.state.timezone
-    _update_login_streak(db, user, timezone)
+
+    _record_login(db, user, request)
 
     return user
 
 
+def require_metrics_token(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(metrics_security)],
+) -> None:
+    """Ensures the request carries the configured metrics scrape token.
+
+    Parameters:
+        credentials (HTTPAuthorizationCredentials | None): Bearer token credentials.
+
+    Returns:
+        None: The request may proceed.
+
+    Raises:
+        HTTPException: 404 when no metrics token is configured, 401 when the token is
+            missing or wrong.
+    """
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Not Found')
+    if credentials is None or not hmac.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail='Authentication required'
+        )
+
+
+def _get_user_profile(token: JWTPayload, db: DBSession, request: Request) -> UserProfile:
+    """Resolve the user profile of the JWT subject.
+
+    The profile is shared by all dependencies of a request through `request.state` and
+    served from the process-wide profile cache when possible. On a warm cache only the
+    columns of the role and quota checks are read, with a narrow query by primary key.
+
+    Parameters:
+        token (JWTPayload): Decoded JWT payload.
+        db (DBSession): Database session the profile is attached to.
+        request (Request): Incoming request used to share the profile.
+
+    Returns:
+        UserProfile: The user profile attached to the database session.
+
+    Raises:
+        HTTPException: If the 'sub' claim is missing or the user does not exist.
+    """
+    user_id = token.get('sub') or _forbidden('Cannot find user', 'JWT payload missing "sub" claim')
+    user_uuid = UUID(user_id)
+
+    user: UserProfile | None = getattr(request.state, 'user_profile', None)
+    if user is not None and user.id == user_uuid:
+        return user
+
+    values = user_profile_cache.get(user_uuid)
+    fresh_values = None
+    if values is not None:
+        fresh_values = db.exec(
+            select(*(col(getattr(UserProfile, column)) for column in FRESH_PROFILE_COLUMNS)).where(
+                col(UserProfile.id) == user_uuid
+            )
+        ).first()
+    if fresh_values is not None:
+        user = UserProfile(**(copy.deepcopy(values) | dict(fresh_values._mapping)))
+        make_transient_to_detached(user)
+        user = db.merge(user, load=False)
+    else:
+        user = db.exec(
+            select(UserProfile).where(UserProfile.id == user_uuid)
+        ).first() or _forbidden('Cannot find user', 'User not found for ID %s', user_id)
+        user_profile_cache.set(user_uuid, _column_values(user))
+
+    request.state.user_profile = user
+    return user
+
+
+def _record_login(db: DBSession, user_profile: UserProfile, request: Request) -> None:
+    """Update the login streak once per request.
+
+    Parameters:
+        db (DBSession): Database session used for the update.
+        user_profile (UserProfile): Authenticated user profile.
+        request (Request): Incoming request for timezone context.
+
+    Returns:
+        None: This function updates the user profile in the database if needed.
+    """
+    if getattr(request.state, 'login_recorded', False):
+        return
+    _update_login_streak(db, user_profile, request.state.timezone)
+    request.state.login_recorded = True
+
+
 def _update_login_streak(db: DBSession, user_profile: UserProfile, timezone: str) -> None:
     """
     Updates the login streak for a user based on their last login time and the current time in the
@@ -205,6 +342,9 @@ def _update_login_streak(db: DBSession, user_profile: UserProfile, timezone: str
       greater than 1 day, the streak is reset.
     The last login time is updated only if the streak is incremented or reset.
 
+    Both the streak and the daily session counter reset are written with a single UPDATE and
+    the new values are applied to the loaded profile, so it is not reloaded afterwards.
+
     Args:
         db (Session): The database session used to commit changes to the user profile.
         user_profile (UserProfile): The user profile object containing login streak information.
@@ -217,7 +357,11 @@ def _update_login_streak(db: DBSession, user_profile: UserProfile, timezone: str
     Notes:
         - The last login time is stored in UTC for consistency across the database.
         - The streak is calculated based on calendar days in the user's timezone.
+        - The daily counter is reset in SQL, so an increment committed concurrently by another
+          request on the same day is not lost.
     """
+    changes: dict[str, Any] = {}
+
     # Check if the last_logged_in date is available
     if user_profile.last_logged_in:
         user_timezone = pytz_timezone(timezone)
@@ -227,23 +371,69 @@ def _update_login_streak(db: DBSession, user_profile: UserProfile, timezone: str
         days_difference = (now.date() - last_logged_in.date()).days
 
         if days_difference == 1:
-            user_profile.current_streak_days += 1
+            changes['current_streak_days'] = user_profile.current_streak_days + 1
         elif days_difference > 1:
-            user_profile.current_streak_days = 1
+            changes['current_streak_days'] = 1
 
         if days_difference != 0:
-            user_profile.last_logged_in = datetime.now(UTC)  # Store in UTC for consistency
-
-            # Commit changes to the database
-            db.add(user_profile)
-            db.commit()
-            db.refresh(user_profile)
+            changes['last_logged_in'] = datetime.now(UTC)  # Store in UTC for consistency
 
     # Reset daily session counter if it's a new day
     today = datetime.now(UTC).date()
-    if user_profile.last_session_date != today:
-        user_profile.sessions_created_today = 0
-        user_profile.last_session_date = today
-        db.add(user_profile)
-        db.commit()
-        db.refresh(user_profile)
+    if not changes and user_profile.last_session_date == today:
+        return
+
+    changes['last_session_date'] = today
+    changes['updated_at'] = datetime.now(UTC)
+    values = _column_values(user_profile) | changes
+
+    values['sessions_created_today'] = db.exec(
+        update(UserProfile)
+        .where(col(UserProfile.id) == user_profile.id)
+        .values(
+            sessions_created_today=case(
+                (col(UserProfile.last_session_date) != today, 0),
+                else_=col(UserProfile.sessions_created_today),
+            ),
+            **changes,
+        )
+        .returning(col(UserProfile.sessions_created_today))
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+    db.commit()
+
+    # Apply the written values instead of reloading the expired profile
+    for key, value in values.items():
+        set_committed_value(user_profile, key, value)
+    user_profile_cache.set(user_profile.id, values)
+
+
+def _column_values(user_profile: UserProfile) -> dict[str, Any]:
+    """Snapshot the column values of a user profile.
+
+    Parameters:
+        user_profile (UserProfile): Loaded user profile.
+
+    Returns:
+        dict[str, Any]: Column values keyed by attribute name.
+    """
+    # Copied so that in-place changes to JSON columns do not leak into the cache
+    return copy.deepcopy(
+        {attr.key: getattr(user_profile, attr.key) for attr in sa_inspect(UserProfile).column_attrs}
+    )
+
+
+@event.listens_for(UserProfile, 'after_update')
+@event.listens_for(UserProfile, 'after_delete')
+def evict_cached_user_profile(mapper: Mapper, connection: Connection, target: UserProfile) -> None:
+    """Drop a user profile from the cache when it is updated or deleted through the ORM.
+
+    Parameters:
+        mapper (Mapper): SQLAlchemy mapper for the model.
+        connection (Connection): Active database connection.
+        target (UserProfile): Model instance being persisted.
+
+    Returns:
+        None: This function mutates the profile cache in-place.
+    """
+    user_profile_cache.pop(target.id)
@@ -4,6 +4,7 @@ import logging
 import sys
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 import sentry_sdk
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -17,7 +18,8 @@ from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoin
 from starlette.responses import Response
 
 from app.config import settings
-from app.dependencies.database import get_db_session
+from app.connections.vertexai_client import vertex_context_cache
+from app.dependencies.database import engine, get_db_session
 from app.routers import (
     admin_dashboard_stats_route,
     app_config_route,
@@ -25,6 +27,7 @@ from app.routers import (
     conversation_category_route,
     conversation_scenario_route,
     live_feedback_route,
+    metrics_route,
     realtime_session_route,
     review_route,
     session_turn_route,
@@ -32,7 +35,9 @@ from app.routers import (
     signed_urls_route,
     user_profile_route,
 )
+from app.services.app_config_service import start_app_config_listener
 from app.services.data_retention_service import cleanup_old_session_turns
+from app.services.llm_response_cache import llm_response_cache
 
 if settings.stage == 'prod' and settings.SENTRY_DSN:
     sentry_sdk.init(
@@ -82,9 +87,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
         AsyncGenerator[None]: Async lifespan context manager.
     """
     scheduler.add_job(scheduled_cleanup, 'cron', hour=3, minute=0)
+    scheduler.add_job(llm_response_cache.evict_expired, 'interval', hours=1)
+    # Runs at startup, then often enough to extend cached prompts before they expire
+    scheduler.add_job(
+        vertex_context_cache.refresh,
+        'interval',
+        seconds=settings.VERTEX_CONTEXT_CACHE_TTL_SECONDS // 4,
+        next_run_time=datetime.now(),
+    )
     scheduler.start()
+    app_config_listener = start_app_config_listener(engine)
     yield
+    if app_config_listener:
+        app_config_listener.stop()
     scheduler.shutdown()
+    vertex_context_cache.clear()
 
 
 app = FastAPI(title='CoachAI', debug=settings.stage == 'dev', lifespan=lifespan)
@@ -130,3 +147,4 @@ app.include_router(review_route.router)
 app.include_router(realtime_session_route.router)
 app.include_router(signed_urls_route.router)
 app.include_router(live_feedback_route.router)
+app.include_router(metrics_route.router)
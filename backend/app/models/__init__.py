@@ -5,6 +5,7 @@ from app.models.conversation_scenario import (
     ConversationScenario,
 )
 from app.models.live_feedback_model import LiveFeedback
+from app.models.llm_response_cache_entry import LLMResponseCacheEntry
 from app.models.review import Review
 from app.models.scenario_preparation import (
     ScenarioPreparation,
@@ -32,4 +33,5 @@ __all__ = [
     'AdminDashboardStats',
     'Review',
     'LiveFeedback',
+    'LLMResponseCacheEntry',
 ]
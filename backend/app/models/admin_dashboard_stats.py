@@ -2,14 +2,24 @@
 
 from uuid import UUID, uuid4
 
+from sqlalchemy import UniqueConstraint
 from sqlmodel import Field
 
 from app.models.camel_case import CamelModel
 
 
 class AdminDashboardStats(CamelModel, table=True):
-    """Database model for admin dashboard stats."""
+    """Database model for admin dashboard stats.
+
+    The counters are spread over several shard rows so that concurrent writers do not
+    serialize on a single row, the dashboard totals are the sums over all shards.
+    """
+
+    __table_args__ = (UniqueConstraint('shard', name='uq_admindashboardstats_shard'),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
+    shard: int = Field(default=0)
     total_trainings: int = Field(default=0)
     score_sum: float = Field(default=0)
+    preparations_generated: int = Field(default=0)
+    preparations_reused: int = Field(default=0)
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import event
+from sqlalchemy import Index, event
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm.mapper import Mapper
 from sqlmodel import Field, Relationship
@@ -24,6 +24,11 @@ if TYPE_CHECKING:
 class ConversationScenario(CamelModel, table=True):
     """Database model for conversation scenario."""
 
+    __table_args__ = (
+        Index('ix_conversationscenario_user_id', 'user_id'),
+        Index('ix_conversationscenario_category_id', 'category_id'),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key='userprofile.id', nullable=False, ondelete='CASCADE')
     category_id: str | None = Field(
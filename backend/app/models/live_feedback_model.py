@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field
 
 from app.models.camel_case import CamelModel
@@ -11,6 +12,8 @@ from app.models.camel_case import CamelModel
 class LiveFeedback(CamelModel, table=True):
     """Database model for live feedback."""
 
+    __table_args__ = (Index('ix_livefeedback_session_id_created_at', 'session_id', 'created_at'),)
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     session_id: UUID = Field(foreign_key='session.id', ondelete='CASCADE')
     heading: str
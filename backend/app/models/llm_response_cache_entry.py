@@ -0,0 +1,20 @@
+"""Database model definitions for llm response cache entry."""
+
+from datetime import UTC, datetime
+
+from sqlmodel import Field
+
+from app.models.camel_case import CamelModel
+
+
+class LLMResponseCacheEntry(CamelModel, table=True):
+    """Database model for a cached structured LLM response.
+
+    The key is a hash over everything that determines the response, so identical
+    deterministic calls share one entry until it expires.
+    """
+
+    key: str = Field(primary_key=True)
+    response: str = Field(nullable=False)
+    expires_at: datetime = Field(index=True)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
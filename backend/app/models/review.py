@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from app.models.camel_case import CamelModel
@@ -16,6 +17,13 @@ if TYPE_CHECKING:
 class Review(CamelModel, table=True):
     """Database model for review."""
 
+    __table_args__ = (
+        # Supports keyset pagination of the admin review list
+        Index('ix_review_created_at_id', 'created_at', 'id'),
+        Index('ix_review_session_id_user_id', 'session_id', 'user_id'),
+        Index('ix_review_user_id', 'user_id'),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key='userprofile.id', ondelete='CASCADE')
     session_id: UUID | None = Field(foreign_key='session.id', default=None, ondelete='CASCADE')
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import event
+from sqlalchemy import Index, event
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm.mapper import Mapper
 from sqlmodel import JSON, Column, Field, Relationship
@@ -17,7 +17,16 @@ if TYPE_CHECKING:
 
 
 class ScenarioPreparation(CamelModel, table=True):
-    """Database model for scenario preparation."""
+    """Database model for scenario preparation.
+
+    The content hash identifies the generation inputs, so a completed preparation can be
+    reused for other scenarios with the same inputs.
+    """
+
+    __table_args__ = (
+        Index('ix_scenariopreparation_scenario_id', 'scenario_id'),
+        Index('ix_scenariopreparation_content_hash', 'content_hash'),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     scenario_id: UUID = Field(foreign_key='conversationscenario.id', ondelete='CASCADE')
@@ -26,6 +35,7 @@ class ScenarioPreparation(CamelModel, table=True):
     key_concepts: list[dict] = Field(default_factory=list, sa_column=Column(JSON))
     prep_checklist: list[str] = Field(default_factory=list, sa_column=Column(JSON))
     status: ScenarioPreparationStatus = Field(default=ScenarioPreparationStatus.pending)
+    content_hash: str | None = Field(default=None)
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import event
+from sqlalchemy import Index, event
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm.mapper import Mapper
 from sqlmodel import Field, Relationship
@@ -22,6 +22,12 @@ if TYPE_CHECKING:
 class Session(CamelModel, table=True):
     """Database model for session."""
 
+    __table_args__ = (
+        # Supports keyset pagination of the session history
+        Index('ix_session_created_at_id', 'created_at', 'id'),
+        Index('ix_session_scenario_id', 'scenario_id'),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     scenario_id: UUID = Field(foreign_key='conversationscenario.id', ondelete='CASCADE')
     scheduled_at: datetime | None = None
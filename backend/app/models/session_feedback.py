@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import event
+from sqlalchemy import Index, event
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm.mapper import Mapper
 from sqlmodel import JSON, Column, Field, Relationship
@@ -20,6 +20,8 @@ from app.enums.feedback_status import FeedbackStatus
 class SessionFeedback(CamelModel, table=True):
     """Database model for session feedback."""
 
+    __table_args__ = (Index('ix_sessionfeedback_session_id', 'session_id'),)
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     session_id: UUID = Field(foreign_key='session.id', ondelete='CASCADE')
     scores: dict = Field(default_factory=dict, sa_column=Column(JSON))
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 
 from app.enums.speaker import SpeakerType
@@ -16,6 +17,18 @@ if TYPE_CHECKING:
 class SessionTurn(CamelModel, table=True):
     """Database model for session turn."""
 
+    __table_args__ = (
+        # Turns are always read per session, ordered by one of the two offsets
+        Index('ix_sessionturn_session_id_start_offset_ms', 'session_id', 'start_offset_ms'),
+        Index(
+            'ix_sessionturn_session_id_full_audio_start_offset_ms',
+            'session_id',
+            'full_audio_start_offset_ms',
+        ),
+        # Used by the data retention job
+        Index('ix_sessionturn_created_at', 'created_at'),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     session_id: UUID = Field(foreign_key='session.id', ondelete='CASCADE')
     speaker: SpeakerType
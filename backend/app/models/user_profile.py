@@ -4,7 +4,7 @@ from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import event
+from sqlalchemy import DDL, Index, event
 from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Mapper
 from sqlmodel import JSON, Column, Field, Relationship
@@ -26,6 +26,16 @@ if TYPE_CHECKING:
 class UserProfile(CamelModel, table=True):  # `table=True` makes it a database table
     """Database model for user profile."""
 
+    # Trigram index for the admin email substring search (LIKE '%...%')
+    __table_args__ = (
+        Index(
+            'ix_userprofile_email_trgm',
+            'email',
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+        ),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     full_name: str = Field(max_length=100)
     email: str = Field(max_length=100, unique=True)
@@ -68,6 +78,14 @@ class UserProfile(CamelModel, table=True):  # `table=True` makes it a database t
     daily_session_limit: int | None = Field(default=None, nullable=True)
 
 
+# The trigram operator class needs pg_trgm when the schema is created without migrations
+event.listen(
+    UserProfile.__table__,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql'),
+)
+
+
 @event.listens_for(UserProfile, 'before_update')
 def update_timestamp(mapper: Mapper, connection: Connection, target: 'UserProfile') -> None:
     """Update the updated_at timestamp before persistence.
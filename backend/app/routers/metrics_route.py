@@ -0,0 +1,24 @@
+"""API routes for metrics route."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.dependencies.auth import require_metrics_token
+from app.services.metrics_service import render_metrics
+
+router = APIRouter(prefix='/metrics', tags=['Metrics'])
+
+
+@router.get(
+    '',
+    response_class=PlainTextResponse,
+    dependencies=[Depends(require_metrics_token)],
+    include_in_schema=False,
+)
+def get_metrics() -> PlainTextResponse:
+    """Return LLM and prompt metrics in the Prometheus text exposition format.
+
+    Returns:
+        PlainTextResponse: Metrics payload.
+    """
+    return PlainTextResponse(render_metrics(), media_type='text/plain; version=0.0.4')
@@ -3,10 +3,10 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from sqlmodel import Session as DBSession
+from sqlmodel.ext.asyncio.session import AsyncSession as AsyncDBSession
 
 from app.dependencies.auth import require_user
-from app.dependencies.database import get_db_session
+from app.dependencies.database import get_async_db_session
 from app.dependencies.sessions import require_session_access, require_sessions_left_today
 from app.models.session import Session
 from app.models.user_profile import UserProfile
@@ -16,12 +16,12 @@ router = APIRouter(prefix='/realtime-sessions', tags=['realtime-session'])
 
 
 def get_realtime_session_service(
-    db_session: Annotated[DBSession, Depends(get_db_session)],
+    db_session: Annotated[AsyncDBSession, Depends(get_async_db_session)],
 ) -> RealtimeSessionService:
     """Dependency factory to inject the RealtimeSessionService.
 
     Parameters:
-        db_session (DBSession): Database session dependency.
+        db_session (AsyncDBSession): Async database session dependency.
 
     Returns:
         RealtimeSessionService: Service instance.
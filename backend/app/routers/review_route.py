@@ -41,19 +41,23 @@ def get_reviews(
     page: int | None = Query(None),
     page_size: int = Query(8),
     sort: str = Query('newest'),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
 ) -> list[ReviewRead] | PaginatedReviewRead:
     """Retrieve user reviews with optional pagination, statistics and sorting.
 
     Parameters:
         service (ReviewService): Service dependency.
-        page (int | None): Page number (1-based).
+        page (int | None): Page number (1-based), ignored when a cursor is given.
         page_size (int): Items per page.
         sort (str): Sorting strategy.
+        cursor (str | None): Cursor token (nextCursor) of the previous page.
+        include_total (bool): Whether to count all reviews for the totals.
 
     Returns:
         list[ReviewRead] | PaginatedReviewRead: Review payload(s).
     """
-    return service.get_reviews(page, page_size, sort)
+    return service.get_reviews(page, page_size, sort, cursor, include_total)
 
 
 @router.post('', response_model=ReviewConfirm)
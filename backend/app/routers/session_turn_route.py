@@ -5,9 +5,10 @@ from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, UploadFile
 from sqlmodel import Session as DBSession
+from sqlmodel.ext.asyncio.session import AsyncSession as AsyncDBSession
 
 from app.dependencies.auth import require_user
-from app.dependencies.database import get_db_session
+from app.dependencies.database import get_async_db_session, get_db_session
 from app.enums.speaker import SpeakerType
 from app.models.user_profile import UserProfile
 from app.schemas.session_turn import SessionTurnCreate, SessionTurnRead
@@ -20,16 +21,18 @@ router = APIRouter(
 
 def get_session_turn_service(
     db_session: Annotated[DBSession, Depends(get_db_session)],
+    async_db_session: Annotated[AsyncDBSession, Depends(get_async_db_session)],
 ) -> SessionTurnService:
     """Provide SessionTurnService via dependency injection.
 
     Parameters:
         db_session (DBSession): Database session dependency.
+        async_db_session (AsyncDBSession): Async database session dependency.
 
     Returns:
         SessionTurnService: Service instance.
     """
-    return SessionTurnService(db_session)
+    return SessionTurnService(db_session, async_db=async_db_session)
 
 
 @router.post('', response_model=SessionTurnRead)
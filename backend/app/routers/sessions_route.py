@@ -57,6 +57,8 @@ def get_sessions(
     scenario_id: UUID | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
 ) -> PaginatedSessionRead:
     """Return paginated sessions for a user or scenario.
 
@@ -64,13 +66,17 @@ def get_sessions(
         user_profile (UserProfile): Authenticated user profile.
         service (SessionService): Service dependency.
         scenario_id (UUID | None): Optional scenario filter.
-        page (int): Page number (1-based).
+        page (int): Page number (1-based), ignored when a cursor is given.
         page_size (int): Items per page.
+        cursor (str | None): Cursor token (nextCursor) of the previous page.
+        include_total (bool): Whether to count all sessions for the totals.
 
     Returns:
         PaginatedSessionRead: Paginated session list.
     """
-    return service.fetch_paginated_sessions(user_profile, page, page_size, scenario_id)
+    return service.fetch_paginated_sessions(
+        user_profile, page, page_size, scenario_id, cursor, include_total
+    )
 
 
 @router.post('', response_model=SessionRead, dependencies=[Depends(require_sessions_left_today)])
@@ -14,3 +14,12 @@ class AdminDashboardStatsRead(CamelModel):
     total_reviews: int = Field(..., description='Number of reviews')
     score_sum: float = Field(..., description='Sum of all scores')
     default_daily_session_limit: int
+    scenario_preparations_generated: int = Field(
+        0, description='Scenario preparations generated after a reuse lookup miss'
+    )
+    scenario_preparations_reused: int = Field(
+        0, description='Scenario preparations cloned from an equal completed preparation'
+    )
+    scenario_preparation_reuse_rate: float = Field(
+        0.0, description='Share of scenario preparation lookups that were reused'
+    )
@@ -84,6 +84,19 @@ class RecommendationsRead(CamelModel):
     )
 
 
+class FusedFeedbackRead(CamelModel):
+    """Combined examples, achieved goals and recommendations of a single LLM call."""
+
+    positive_examples: list[PositiveExample] = Field(..., description='List of positive examples')
+    negative_examples: list[NegativeExample] = Field(..., description='List of negative examples')
+    goals_achieved: list[str] = Field(
+        ..., description='List of training objectives achieved in the session'
+    )
+    recommendations: list[Recommendation] = Field(
+        ..., description='List of improvement recommendations'
+    )
+
+
 # Schema for reading a session's feedback metrics
 class SessionFeedbackRead(CamelModel):
     """Schema for session feedback read."""
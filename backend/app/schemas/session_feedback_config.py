@@ -17,6 +17,7 @@ class SessionFeedbackSystemPromptSet(CamelModel):
     session_examples: str
     goals_achieved: str
     recommendations: str
+    fused_feedback: str
 
 
 class SessionFeedbackMockSet(CamelModel):
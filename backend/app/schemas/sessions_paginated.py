@@ -35,6 +35,7 @@ class PaginatedSessionRead(CamelModel):
 
     page: int
     limit: int
-    total_pages: int
-    total_sessions: int
+    total_pages: int | None
+    total_sessions: int | None
     sessions: list[SessionItem]
+    next_cursor: str | None = None
@@ -1,69 +1,226 @@
 """Service layer for admin dashboard service."""
 
+import logging
+import threading
+import time
+from collections.abc import Callable, Generator
+
+from sqlalchemy import text
 from sqlmodel import Session as DBSession
 from sqlmodel import func, select
 
-from app.models.admin_dashboard_stats import AdminDashboardStats
+from app.config import settings
+from app.dependencies.database import db_session_scope, get_db_session
 from app.models.review import Review
 from app.models.user_profile import UserProfile
 from app.schemas.admin_dashboard_stats import AdminDashboardStatsRead
+from app.services.admin_stats_service import AdminStatsService
 from app.services.app_config_service import AppConfigService
 
 
+class AdminDashboardCache:
+    """Process-local stale-while-revalidate cache of the admin dashboard counts.
+
+    A fresh payload is returned as is. Once the TTL has passed, the stale payload is still
+    returned immediately while a single background thread reloads it, so only the very
+    first load of a process waits for the database. Every invalidation bumps the version,
+    so a refresh that raced with an invalidation is not stored.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Parameters:
+            ttl (float): Seconds after which the cached payload is refreshed in the background.
+        """
+        self.ttl = ttl
+        self.version = 0
+        self._payload: AdminDashboardStatsRead | None = None
+        self._loaded_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        load: Callable[[], AdminDashboardStatsRead],
+        refresh: Callable[[], AdminDashboardStatsRead],
+    ) -> AdminDashboardStatsRead:
+        """Return the cached payload, loading or refreshing it as necessary.
+
+        Parameters:
+            load (Callable[[], AdminDashboardStatsRead]): Loads the payload in the caller's
+                session when nothing is cached yet.
+            refresh (Callable[[], AdminDashboardStatsRead]): Loads the payload in its own
+                session from the background thread.
+
+        Returns:
+            AdminDashboardStatsRead: Cached or freshly loaded payload.
+        """
+        payload = self._payload
+        if payload is None:
+            version = self.version
+            payload = load()
+            self._store(payload, version)
+            return payload
+
+        if time.monotonic() - self._loaded_at >= self.ttl:
+            with self._lock:
+                start_refresh = not self._refreshing
+                self._refreshing = True
+                version = self.version
+            if start_refresh:
+                threading.Thread(
+                    target=self._refresh,
+                    args=(refresh, version),
+                    name='admin-dashboard-refresh',
+                    daemon=True,
+                ).start()
+        return payload
+
+    def invalidate(self) -> None:
+        """Drop the cached payload so that the next read loads it again.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        with self._lock:
+            self.version += 1
+            self._payload = None
+
+    def _store(self, payload: AdminDashboardStatsRead, version: int) -> None:
+        """Store a freshly loaded payload unless the cache was invalidated meanwhile.
+
+        Parameters:
+            payload (AdminDashboardStatsRead): Loaded payload.
+            version (int): Cache version at the time the load started.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        with self._lock:
+            if version != self.version:
+                return
+            self._payload = payload
+            self._loaded_at = time.monotonic()
+
+    def _refresh(self, refresh: Callable[[], AdminDashboardStatsRead], version: int) -> None:
+        """Reload the payload in the background, keeping the stale one on failure.
+
+        Parameters:
+            refresh (Callable[[], AdminDashboardStatsRead]): Loads the payload.
+            version (int): Cache version at the time the refresh was started.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        try:
+            self._store(refresh(), version)
+        except Exception as e:
+            logging.warning(f'Admin dashboard refresh failed, serving stale stats: {e}')
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+admin_dashboard_cache = AdminDashboardCache(ttl=settings.ADMIN_DASHBOARD_CACHE_TTL_SECONDS)
+
+
 class AdminDashboardService:
     """Service for assembling admin dashboard statistics."""
 
-    def __init__(self, db: DBSession) -> None:
+    def __init__(
+        self,
+        db: DBSession,
+        session_generator_func: Callable[[], Generator[DBSession]] = get_db_session,
+    ) -> None:
         """Initialize the service with a database session.
 
         Parameters:
             db (DBSession): Database session used for queries.
+            session_generator_func (Callable[[], Generator[DBSession]]): DB session generator
+                used by the background refresh of the cached statistics.
         """
         self.db = db
+        self.session_generator_func = session_generator_func
         self.app_config_service = AppConfigService(db)
 
-    def _get_user_count(self) -> int:
-        """Return the total number of user profiles.
+    def _estimate_row_count(self, db: DBSession, table_name: str) -> int | None:
+        """Return the planner's row estimate of a table on Postgres.
+
+        Parameters:
+            db (DBSession): Database session used for the lookup.
+            table_name (str): Name of the table.
+
+        Returns:
+            int | None: Estimated row count, or None when no estimate is available.
+        """
+        if db.get_bind().dialect.name != 'postgresql':
+            return None
+        estimate = db.execute(
+            text('SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)'),
+            {'table_name': table_name},
+        ).scalar()
+        # reltuples is -1 for tables that have never been vacuumed or analyzed
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    def _get_row_count(self, db: DBSession, model: type[UserProfile] | type[Review]) -> int:
+        """Return the row count of a table, estimated where the database supports it.
+
+        Parameters:
+            db (DBSession): Database session used for the lookup.
+            model (type[UserProfile] | type[Review]): Model of the counted table.
 
         Returns:
-            int: Total user count.
+            int: Row count.
         """
-        return self.db.exec(select(func.count()).select_from(UserProfile)).one()
+        estimate = self._estimate_row_count(db, model.__tablename__)
+        if estimate is not None:
+            return estimate
+        return db.exec(select(func.count()).select_from(model)).one()
+
+    def _load_stats(self, db: DBSession) -> AdminDashboardStatsRead:
+        """Load the dashboard counts from the database.
 
-    def _get_review_count(self) -> int:
-        """Return the total number of reviews.
+        Parameters:
+            db (DBSession): Database session used for the queries.
 
         Returns:
-            int: Total review count.
+            AdminDashboardStatsRead: Dashboard counts without the session limit.
         """
-        return self.db.exec(select(func.count()).select_from(Review)).one()
+        admin_stats_service = AdminStatsService(db)
+        total_trainings, score_sum = admin_stats_service.get_totals()
+        generated, reused = admin_stats_service.get_preparation_totals()
+        lookups = generated + reused
+        return AdminDashboardStatsRead(
+            total_users=self._get_row_count(db, UserProfile),
+            total_trainings=total_trainings,
+            total_reviews=self._get_row_count(db, Review),
+            score_sum=score_sum,
+            default_daily_session_limit=0,
+            scenario_preparations_generated=generated,
+            scenario_preparations_reused=reused,
+            scenario_preparation_reuse_rate=reused / lookups if lookups else 0.0,
+        )
 
-    def _get_admin_stats(self) -> AdminDashboardStats:
-        """Load or initialize admin aggregate statistics.
+    def _refresh_stats(self) -> AdminDashboardStatsRead:
+        """Load the dashboard counts in a session of their own.
 
         Returns:
-            AdminDashboardStats: Persisted stats record.
+            AdminDashboardStatsRead: Dashboard counts without the session limit.
         """
-        stats = self.db.exec(select(AdminDashboardStats)).first()
-        if not stats:
-            stats = AdminDashboardStats()
-            self.db.add(stats)
-            self.db.commit()
-            self.db.refresh(stats)
-        return stats
+        with db_session_scope(self.session_generator_func) as db:
+            return self._load_stats(db)
 
     def get_admin_dashboard_stats(self) -> AdminDashboardStatsRead:
-        """Return computed admin dashboard statistics.
+        """Return admin dashboard statistics.
+
+        The counts are served from the process-wide dashboard cache and may be up to
+        `ADMIN_DASHBOARD_CACHE_TTL_SECONDS` old. The session limit is always read from the
+        config cache, so config changes show up immediately.
 
         Returns:
             AdminDashboardStatsRead: Aggregated dashboard metrics.
         """
-        stats = self._get_admin_stats()
-
-        return AdminDashboardStatsRead(
-            total_users=self._get_user_count(),
-            total_trainings=stats.total_trainings,
-            total_reviews=self._get_review_count(),
-            score_sum=stats.score_sum,
-            default_daily_session_limit=self.app_config_service.get_default_daily_session_limit(),
-        )
+        stats = admin_dashboard_cache.get(lambda: self._load_stats(self.db), self._refresh_stats)
+        session_limit = self.app_config_service.get_default_daily_session_limit()
+        return stats.model_copy(update={'default_daily_session_limit': session_limit})
@@ -0,0 +1,103 @@
+"""Service layer for admin stats service."""
+
+import random
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session as DBSession
+from sqlmodel import func, select
+
+from app.models.admin_dashboard_stats import AdminDashboardStats
+
+ADMIN_STATS_SHARDS = 16
+
+
+class AdminStatsService:
+    """Service for the sharded admin dashboard counters.
+
+    Each increment is a single upsert into a randomly chosen shard row, so concurrent
+    session completions rarely touch the same row and never lose updates. Reads sum the
+    shards, which stays cheap because there are at most `ADMIN_STATS_SHARDS` rows.
+    """
+
+    def __init__(self, db: DBSession) -> None:
+        """Initialize the service with a database session.
+
+        Parameters:
+            db (DBSession): Database session used for queries and updates.
+        """
+        self.db = db
+
+    def increment(
+        self,
+        total_trainings: int = 0,
+        score_sum: float = 0.0,
+        preparations_generated: int = 0,
+        preparations_reused: int = 0,
+    ) -> None:
+        """Add to the admin counters within the current transaction.
+
+        The change becomes visible when the caller commits the session.
+
+        Parameters:
+            total_trainings (int): Number of trainings to add.
+            score_sum (float): Score to add to the score sum.
+            preparations_generated (int): Number of generated scenario preparations to add.
+            preparations_reused (int): Number of reused scenario preparations to add.
+
+        Returns:
+            None: This function updates a shard row in the database.
+        """
+        insert = (
+            postgresql.insert if self.db.get_bind().dialect.name == 'postgresql' else sqlite.insert
+        )
+        statement = insert(AdminDashboardStats).values(
+            id=uuid4(),
+            shard=random.randrange(ADMIN_STATS_SHARDS),
+            total_trainings=total_trainings,
+            score_sum=score_sum,
+            preparations_generated=preparations_generated,
+            preparations_reused=preparations_reused,
+        )
+        self.db.exec(
+            statement.on_conflict_do_update(
+                index_elements=[AdminDashboardStats.shard],
+                set_={
+                    'total_trainings': AdminDashboardStats.total_trainings
+                    + statement.excluded.total_trainings,
+                    'score_sum': AdminDashboardStats.score_sum + statement.excluded.score_sum,
+                    'preparations_generated': AdminDashboardStats.preparations_generated
+                    + statement.excluded.preparations_generated,
+                    'preparations_reused': AdminDashboardStats.preparations_reused
+                    + statement.excluded.preparations_reused,
+                },
+            )
+        )
+
+    def get_totals(self) -> tuple[int, float]:
+        """Return the admin counters summed over all shards.
+
+        Returns:
+            tuple[int, float]: Total trainings and score sum.
+        """
+        total_trainings, score_sum = self.db.exec(
+            select(
+                func.coalesce(func.sum(AdminDashboardStats.total_trainings), 0),
+                func.coalesce(func.sum(AdminDashboardStats.score_sum), 0.0),
+            )
+        ).one()
+        return int(total_trainings), float(score_sum)
+
+    def get_preparation_totals(self) -> tuple[int, int]:
+        """Return the scenario preparation counters summed over all shards.
+
+        Returns:
+            tuple[int, int]: Generated and reused scenario preparations.
+        """
+        generated, reused = self.db.exec(
+            select(
+                func.coalesce(func.sum(AdminDashboardStats.preparations_generated), 0),
+                func.coalesce(func.sum(AdminDashboardStats.preparations_reused), 0),
+            )
+        ).one()
+        return int(generated), int(reused)
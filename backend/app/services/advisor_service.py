@@ -2,23 +2,27 @@
 
 import logging
 from collections.abc import Callable, Generator
-from contextlib import suppress
 from datetime import UTC, datetime
+from functools import partial
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException
 from sqlmodel import Session as DBSession
 from sqlmodel import select
 
+from app.config import settings
 from app.connections.vertexai_client import call_structured_llm
+from app.dependencies.database import db_session_scope, log_pool_occupancy
 from app.enums.feedback_status import FeedbackStatus
 from app.enums.language import LanguageCode
-from app.models.conversation_scenario import DifficultyLevel
+from app.models.conversation_scenario import ConversationScenario, DifficultyLevel
 from app.models.session_feedback import SessionFeedback
 from app.models.user_profile import UserProfile
 from app.schemas import ConversationScenarioCreate
 from app.schemas.advisor_response import AdvisorResponse
 from app.schemas.user_profile import ScenarioAdvice
+from app.services.llm_resilience import deadline_scope
+from app.services.prompt_budget import history_section, prompt_budget
 
 mock_persona = """
                 Personality:
@@ -180,73 +184,28 @@ def get_mock_session_feedback() -> SessionFeedback:
     )
 
 
-class AdvisorService:
-    """Service for generating next-scenario advice from session feedback."""
-
-    def generate_and_store_advice(
-        self,
-        session_feedback_id: UUID,
-        user_profile_id: UUID,
-        session_generator_func: Callable[[], Generator[DBSession]],
-    ) -> None:
-        """Generate advice and store it on the user's profile.
-
-        Parameters:
-            session_feedback_id (UUID): Session feedback identifier.
-            user_profile_id (UUID): User profile identifier.
-            session_generator_func (Callable[[], Generator[DBSession]]): DB session generator.
-
-        Returns:
-            None: This function persists advice to the database.
-
-        Raises:
-            HTTPException: If the session feedback cannot be found.
-        """
-        session_gen = session_generator_func()
-        try:
-            db_session: DBSession = next(session_gen)
-
-            statement = select(SessionFeedback).where(SessionFeedback.id == session_feedback_id)
-            session_feedback = db_session.exec(statement).one_or_none()
-
-            if session_feedback is None:
-                logging.error(f'Session feedback with ID {session_feedback_id} not found.')
-                raise HTTPException(status_code=404, detail='Session feedback not found.')
-
-            logging.info(f'Generating advice for session feedback ID: {session_feedback.id}')
-            scenario_advice = self._generate_advice(session_feedback=session_feedback)
-            statement = select(UserProfile).where(UserProfile.id == user_profile_id)
-            user_profile = db_session.exec(statement).one_or_none()
-            if user_profile is None:
-                logging.error(f'User profile with ID {user_profile_id} not found.')
-                return
-
-            user_profile.scenario_advice = scenario_advice.model_dump()
-            db_session.add(user_profile)
-            db_session.commit()
-            logging.info(f'Advice generated and stored for user profile ID: {user_profile.id}')
-        finally:
-            with suppress(StopIteration):
-                next(session_gen)
-
-    def _generate_advice(self, session_feedback: SessionFeedback) -> ScenarioAdvice:
-        """Generate scenario advice based on session feedback.
-
-        Parameters:
-            session_feedback (SessionFeedback): Feedback data to analyze.
-
-        Returns:
-            ScenarioAdvice: Suggested scenario guidance.
-        """
-        language_code = LanguageCode.en
-        try:
-            previous_scenario = session_feedback.session.scenario
-            language_code = session_feedback.session.scenario.language_code
-        except Exception as e:
-            print(f'No previous scenario for generating advice found: {e}')
-            previous_scenario = None
+def build_advice_prompt(
+    session_feedback: SessionFeedback,
+    previous_scenario: ConversationScenario | None,
+    language_code: LanguageCode,
+    example_positive: str,
+    example_negative: str,
+    recommendations: str,
+) -> str:
+    """Build the prompt for scenario advice generation.
+
+    Parameters:
+        session_feedback (SessionFeedback): Feedback data to analyze.
+        previous_scenario (ConversationScenario | None): Scenario of the feedback session.
+        language_code (LanguageCode): Language of the generated scenario.
+        example_positive (str): Examples of what the employee did well.
+        example_negative (str): Examples of what the employee did badly.
+        recommendations (str): Recommendations how the employee can improve.
 
-        prompt = f"""
+    Returns:
+        str: Constructed prompt string.
+    """
+    return f"""
         Analyze the following feedback from an HR employee's conversation training session. Using
         this, generate a new conversation scenario for which you choose fittingly the welcoming
         message, conversation category, situational facts, difficulty level and persona, who the
@@ -260,10 +219,10 @@ class AdvisorService:
         {previous_scenario.category_id if previous_scenario else 'No previous scenario available'}
         Difficulty of previous scenario:
         {
-            previous_scenario.difficulty_level.name
-            if previous_scenario
-            else ('No previous scenario available')
-        }
+        previous_scenario.difficulty_level.name
+        if previous_scenario
+        else ('No previous scenario available')
+    }
         Employee scores (out of 5)
         {session_feedback.scores}
         Overall score (out of 5)
@@ -271,11 +230,11 @@ class AdvisorService:
         Achieved goals:
         {' '.join(session_feedback.goals_achieved)}
         Examples of what the employee did well:
-        {session_feedback.example_positive}
+        {example_positive}
         Examples of what the employee did badly:
-        {session_feedback.example_negative}
+        {example_negative}
         Recommendations how the employee can improve:
-        {session_feedback.recommendations}
+        {recommendations}
 
         ### Instructions
         Format your output as an 'AdvisorResponse' object.
@@ -368,14 +327,108 @@ class AdvisorService:
 
         Do NOT only generate the given examples.
         Do NOT include markdown, explanation, or code formatting.
+    """
+
+
+class AdvisorService:
+    """Service for generating next-scenario advice from session feedback."""
+
+    def generate_and_store_advice(
+        self,
+        session_feedback_id: UUID,
+        user_profile_id: UUID,
+        session_generator_func: Callable[[], Generator[DBSession]],
+    ) -> None:
+        """Generate advice and store it on the user's profile.
+
+        Parameters:
+            session_feedback_id (UUID): Session feedback identifier.
+            user_profile_id (UUID): User profile identifier.
+            session_generator_func (Callable[[], Generator[DBSession]]): DB session generator.
+
+        Returns:
+            None: This function persists advice to the database.
+
+        Raises:
+            HTTPException: If the session feedback cannot be found.
         """
+        # Read phase: load the feedback together with its scenario, then release the connection
+        with db_session_scope(session_generator_func) as db_session:
+            statement = select(SessionFeedback).where(SessionFeedback.id == session_feedback_id)
+            session_feedback = db_session.exec(statement).one_or_none()
 
-        advisor_response = call_structured_llm(
-            system_prompt='You are an expert communication coach analyzing previous feedback '
+            if session_feedback is None:
+                logging.error(f'Session feedback with ID {session_feedback_id} not found.')
+                raise HTTPException(status_code=404, detail='Session feedback not found.')
+
+            # Touch the relationships so they stay available once the session is closed
+            if session_feedback.session is not None:
+                _ = session_feedback.session.scenario
+
+        # LLM phase: no database connection is held while the advice is generated
+        log_pool_occupancy('advisor generation')
+        logging.info(f'Generating advice for session feedback ID: {session_feedback.id}')
+        with deadline_scope(settings.ADVISOR_DEADLINE_SECONDS):
+            scenario_advice = self._generate_advice(session_feedback=session_feedback)
+
+        # Write phase: store the advice on the user's profile
+        with db_session_scope(session_generator_func) as db_session:
+            statement = select(UserProfile).where(UserProfile.id == user_profile_id)
+            user_profile = db_session.exec(statement).one_or_none()
+            if user_profile is None:
+                logging.error(f'User profile with ID {user_profile_id} not found.')
+                return
+
+            user_profile.scenario_advice = scenario_advice.model_dump()
+            db_session.add(user_profile)
+            db_session.commit()
+            logging.info(f'Advice generated and stored for user profile ID: {user_profile_id}')
+
+    def _generate_advice(self, session_feedback: SessionFeedback) -> ScenarioAdvice:
+        """Generate scenario advice based on session feedback.
+
+        Parameters:
+            session_feedback (SessionFeedback): Feedback data to analyze.
+
+        Returns:
+            ScenarioAdvice: Suggested scenario guidance.
+        """
+        language_code = LanguageCode.en
+        try:
+            previous_scenario = session_feedback.session.scenario
+            language_code = session_feedback.session.scenario.language_code
+        except Exception as e:
+            print(f'No previous scenario for generating advice found: {e}')
+            previous_scenario = None
+
+        system_prompt = (
+            'You are an expert communication coach analyzing previous feedback '
             f'and training scenario. Always respond in {language_code} language using the'
-            ' specified output model format.',
+            ' specified output model format.'
+        )
+        # Earlier sessions can leave long example lists, the first entries are kept
+        prompt = prompt_budget.build(
+            'advisor',
+            partial(build_advice_prompt, session_feedback, previous_scenario, language_code),
+            [
+                history_section(
+                    str(session_feedback.example_positive), 'example_positive', strategy='head'
+                ),
+                history_section(
+                    str(session_feedback.example_negative), 'example_negative', strategy='head'
+                ),
+                history_section(
+                    str(session_feedback.recommendations), 'recommendations', strategy='head'
+                ),
+            ],
+            system_prompt=system_prompt,
+        )
+
+        advisor_response = call_structured_llm(
+            system_prompt=system_prompt,
             request_prompt=prompt,
             output_model=AdvisorResponse,
+            operation='advisor',
             mock_response=get_mock_advisor_response(),
         )
 
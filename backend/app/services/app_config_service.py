@@ -1,17 +1,162 @@
 """Service layer for app config service."""
 
+import logging
+import select as io_select
+import threading
+import time
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session as DBSession
 from sqlmodel import Session as DBsession
-from sqlmodel import select
+from sqlmodel import create_engine, select
 
+from app.config import settings
 from app.dependencies.database import get_db_session
 from app.enums.config_type import ConfigType
 from app.models.app_config import AppConfig
 from app.schemas.app_config import AppConfigCreate, AppConfigRead
 
+APP_CONFIG_CHANNEL = 'app_config_changed'
+
+
+class AppConfigCache:
+    """Process-local cache of all configuration values.
+
+    The values are loaded with one query on first use and kept until they are invalidated
+    by a write in this process, by a change notification from another worker, or by the
+    fallback TTL when no notifications arrive. Every invalidation bumps the version, so a
+    load that raced with a write is not stored.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Parameters:
+            ttl (float): Seconds after which the values are reloaded even without invalidation.
+        """
+        self.ttl = ttl
+        self.version = 0
+        self._values: dict[str, str] | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_values(self, db: DBSession) -> dict[str, str]:
+        """Return all configuration values, loading them if necessary.
+
+        Parameters:
+            db (DBSession): Database session used when the values have to be loaded.
+
+        Returns:
+            dict[str, str]: Configuration values keyed by configuration key.
+        """
+        values = self._values
+        if values is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return values
+
+        version = self.version
+        values = dict(db.exec(select(AppConfig.key, AppConfig.value)).all())
+        with self._lock:
+            if version == self.version:
+                self._values = values
+                self._loaded_at = time.monotonic()
+        return values
+
+    def invalidate(self) -> None:
+        """Drop the cached values so that the next read reloads them.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        with self._lock:
+            self.version += 1
+            self._values = None
+
+
+app_config_cache = AppConfigCache(ttl=settings.APP_CONFIG_CACHE_TTL_SECONDS)
+
+
+class AppConfigChangeListener(threading.Thread):
+    """Background thread invalidating the config cache on Postgres change notifications.
+
+    Writers send a NOTIFY on `APP_CONFIG_CHANNEL` in the same transaction as their change,
+    so every worker drops its cached values once the change is committed. The listening
+    connection is opened outside of the application pool, so it never takes a connection
+    away from requests.
+    """
+
+    def __init__(self, engine: Engine, poll_interval: float = 5.0) -> None:
+        """Initialize the listener.
+
+        Parameters:
+            engine (Engine): Engine of the application database, only its URL is used.
+            poll_interval (float): Seconds to wait for a notification before checking for stop.
+        """
+        super().__init__(name='app-config-listener', daemon=True)
+        self.engine = create_engine(engine.url, poolclass=NullPool)
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Listen for notifications until stopped, reconnecting after connection errors.
+
+        Returns:
+            None: This function runs until `stop` is called.
+        """
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logging.warning(f'App config listener failed, reconnecting: {e}')
+                self._stop_event.wait(self.poll_interval)
+
+    def stop(self) -> None:
+        """Ask the listener to stop after the current poll.
+
+        Returns:
+            None: This function signals the thread to exit.
+        """
+        self._stop_event.set()
+
+    def _listen(self) -> None:
+        """Open a dedicated connection, LISTEN on the channel and process notifications.
+
+        Returns:
+            None: This function returns when the listener is stopped.
+        """
+        with self.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            conn.exec_driver_sql(f'LISTEN {APP_CONFIG_CHANNEL}')
+            # Changes may have been missed while the connection was down
+            app_config_cache.invalidate()
+            dbapi_connection = conn.connection.dbapi_connection
+            while not self._stop_event.is_set():
+                readable, _, _ = io_select.select([dbapi_connection], [], [], self.poll_interval)
+                if not readable:
+                    continue
+                dbapi_connection.poll()
+                if dbapi_connection.notifies:
+                    dbapi_connection.notifies.clear()
+                    app_config_cache.invalidate()
+
+
+def start_app_config_listener(engine: Engine) -> AppConfigChangeListener | None:
+    """Start the change listener when the database supports LISTEN/NOTIFY.
+
+    Parameters:
+        engine (Engine): Engine of the application database.
+
+    Returns:
+        AppConfigChangeListener | None: Running listener, or None for other databases.
+    """
+    if engine.dialect.name != 'postgresql':
+        return None
+    listener = AppConfigChangeListener(engine)
+    listener.start()
+    return listener
+
 
 class AppConfigService:
     """Service for managing application configuration records."""
@@ -54,7 +199,7 @@ class AppConfigService:
 
         db_app_config = AppConfig(**app_config.model_dump())
         self.db.add(db_app_config)
-        self.db.commit()
+        self._commit_config_change()
         self.db.refresh(db_app_config)
         return AppConfigRead(**db_app_config.model_dump())
 
@@ -82,7 +227,7 @@ class AppConfigService:
         self._validate_config_value(app_config.value, app_config.type)
 
         self.db.add(app_config)
-        self.db.commit()
+        self._commit_config_change()
         self.db.refresh(app_config)
         return AppConfigRead(**app_config.model_dump())
 
@@ -119,7 +264,7 @@ class AppConfigService:
             self.db.add(app_config)
             updated_configs.append(app_config)
 
-        self.db.commit()
+        self._commit_config_change()
 
         # Refresh all updated configs
         for config in updated_configs:
@@ -144,9 +289,21 @@ class AppConfigService:
             raise HTTPException(status_code=404, detail='AppConfig not found')
 
         self.db.delete(app_config)
-        self.db.commit()
+        self._commit_config_change()
         return {'message': 'AppConfig deleted successfully'}
 
+    def _commit_config_change(self) -> None:
+        """Commit a configuration change and invalidate the cached values of all workers.
+
+        Returns:
+            None: This function commits the session and invalidates the config cache.
+        """
+        if self.db.get_bind().dialect.name == 'postgresql':
+            # Delivered to the listening workers only once the transaction commits
+            self.db.execute(text("SELECT pg_notify(:channel, '')"), {'channel': APP_CONFIG_CHANNEL})
+        self.db.commit()
+        app_config_cache.invalidate()
+
     def _validate_config_value(self, value: str, config_type: ConfigType) -> None:
         """Validate if the value can be typecasted to the specified ConfigType.
 
@@ -174,7 +331,7 @@ class AppConfigService:
             ) from None
 
     def get_value(self, key: str) -> str | None:
-        """Fetch a configuration value by key.
+        """Fetch a configuration value by key from the process-wide config cache.
 
         Parameters:
             key (str): Configuration key.
@@ -182,8 +339,7 @@ class AppConfigService:
         Returns:
             str | None: Stored configuration value, if present.
         """
-        statement = select(AppConfig.value).where(AppConfig.key == key)
-        return self.db.scalar(statement)
+        return app_config_cache.get_values(self.db).get(key)
 
     def get_default_daily_session_limit(self) -> int:
         """Return the default daily session limit for users.
@@ -206,6 +362,15 @@ class AppConfigService:
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             ) from err
 
+    def is_scenario_preparation_reuse_enabled(self) -> bool:
+        """Return whether completed scenario preparations may be reused across users.
+
+        Returns:
+            bool: False only when the admin toggle is set to 'false'.
+        """
+        value = self.get_value('scenarioPreparationReuseEnabled')
+        return value is None or value.lower() != 'false'
+
 
 def get_app_config_service(
     db_session: Annotated[DBSession, Depends(get_db_session)],
@@ -0,0 +1,132 @@
+"""Service layer for bulk deletion service."""
+
+from dataclasses import dataclass, field
+
+from sqlalchemy import ColumnElement, delete, union
+from sqlalchemy.sql import Select
+from sqlmodel import Session as DBSession
+from sqlmodel import col, select
+
+from app.connections.gcs_client import get_gcs_audio_manager
+from app.models.conversation_scenario import ConversationScenario
+from app.models.session import Session
+from app.models.session_feedback import SessionFeedback
+from app.models.session_turn import SessionTurn
+
+
+@dataclass
+class BulkDeletionResult:
+    """Outcome of a bulk deletion.
+
+    Parameters:
+        scenarios (int): Number of deleted conversation scenarios.
+        sessions (int): Number of deleted sessions.
+        audios (list[str]): Audio blob names removed from storage.
+    """
+
+    scenarios: int = 0
+    sessions: int = 0
+    audios: list[str] = field(default_factory=list)
+
+
+class BulkDeletionService:
+    """Service for deleting scenarios and sessions together with their audio files.
+
+    Rows are removed with set-based DELETE statements and the ON DELETE CASCADE foreign
+    keys take care of turns, feedback, live feedback, reviews and preparations. Audio
+    keys are collected with a single query beforehand and the blobs are deleted
+    concurrently once the transaction is committed.
+    """
+
+    def __init__(self, db: DBSession) -> None:
+        """Initialize the service with a database session.
+
+        Parameters:
+            db (DBSession): Database session used for queries and deletes.
+        """
+        self.db = db
+        self.gcs_manager = get_gcs_audio_manager()
+
+    def delete_scenarios(self, *conditions: ColumnElement[bool]) -> BulkDeletionResult:
+        """Delete all conversation scenarios matching the conditions.
+
+        Parameters:
+            *conditions (ColumnElement[bool]): Filters on ConversationScenario columns.
+
+        Returns:
+            BulkDeletionResult: Deleted row counts and removed audio files.
+        """
+        scenario_ids = select(ConversationScenario.id).where(*conditions)
+        session_ids = select(Session.id).where(col(Session.scenario_id).in_(scenario_ids))
+        audio_keys = self._collect_audio_keys(session_ids)
+
+        deleted_sessions = self.db.exec(
+            delete(Session)
+            .where(col(Session.scenario_id).in_(scenario_ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        deleted_scenarios = self.db.exec(
+            delete(ConversationScenario)
+            .where(*conditions)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+
+        return BulkDeletionResult(
+            scenarios=deleted_scenarios,
+            sessions=deleted_sessions,
+            audios=self._delete_audio_files(audio_keys),
+        )
+
+    def delete_sessions(self, *conditions: ColumnElement[bool]) -> BulkDeletionResult:
+        """Delete all sessions matching the conditions.
+
+        Parameters:
+            *conditions (ColumnElement[bool]): Filters on Session columns.
+
+        Returns:
+            BulkDeletionResult: Deleted row counts and removed audio files.
+        """
+        audio_keys = self._collect_audio_keys(select(Session.id).where(*conditions))
+
+        deleted_sessions = self.db.exec(
+            delete(Session).where(*conditions).execution_options(synchronize_session=False)
+        ).rowcount
+        self.db.commit()
+
+        return BulkDeletionResult(
+            sessions=deleted_sessions, audios=self._delete_audio_files(audio_keys)
+        )
+
+    def _collect_audio_keys(self, session_ids: Select) -> list[str]:
+        """Fetch turn and stitched audio blob names of the given sessions in one query.
+
+        Parameters:
+            session_ids (Select): Subquery selecting the affected session IDs.
+
+        Returns:
+            list[str]: Distinct audio blob names.
+        """
+        statement = union(
+            select(SessionTurn.audio_uri).where(
+                col(SessionTurn.session_id).in_(session_ids), col(SessionTurn.audio_uri) != ''
+            ),
+            select(SessionFeedback.full_audio_filename).where(
+                col(SessionFeedback.session_id).in_(session_ids),
+                col(SessionFeedback.full_audio_filename) != '',
+            ),
+        )
+        return list(self.db.execute(statement).scalars().all())
+
+    def _delete_audio_files(self, audio_keys: list[str]) -> list[str]:
+        """Remove audio blobs from storage.
+
+        Parameters:
+            audio_keys (list[str]): Audio blob names to delete.
+
+        Returns:
+            list[str]: Blob names that were removed.
+        """
+        if not audio_keys or self.gcs_manager is None:
+            return []
+        return self.gcs_manager.delete_documents(audio_keys)
@@ -5,8 +5,9 @@ from math import ceil
 from uuid import UUID
 
 from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import case
 from sqlmodel import Session as DBSession
-from sqlmodel import func, select
+from sqlmodel import col, func, select
 
 from app.dependencies.database import get_db_session
 from app.enums.account_role import AccountRole
@@ -25,12 +26,16 @@ from app.schemas.conversation_scenario import (
     PaginatedConversationScenarioSummary,
 )
 from app.schemas.scenario_preparation import ScenarioPreparationCreate, ScenarioPreparationRead
+from app.services.admin_stats_service import AdminStatsService
+from app.services.app_config_service import AppConfigService
+from app.services.bulk_deletion_service import BulkDeletionService
 from app.services.scenario_preparation.scenario_preparation_service import (
+    clone_preparation,
+    compute_preparation_content_hash,
     create_pending_preparation,
+    find_reusable_preparation,
     generate_scenario_preparation,
 )
-from app.services.session_service import SessionService
-from app.services.session_turn_service import SessionTurnService
 
 
 class ConversationScenarioService:
@@ -102,11 +107,30 @@ class ConversationScenarioService:
             user_profile.scenario_advice = {}
             self.db.commit()
 
+        preparation_request = self._build_preparation_request(new_conversation_scenario, category)
+        content_hash = None
+        if AppConfigService(self.db).is_scenario_preparation_reuse_enabled():
+            content_hash = compute_preparation_content_hash(preparation_request)
+            reusable_preparation = find_reusable_preparation(content_hash, self.db)
+            AdminStatsService(self.db).increment(
+                preparations_generated=0 if reusable_preparation else 1,
+                preparations_reused=1 if reusable_preparation else 0,
+            )
+            if reusable_preparation:
+                # Equal inputs were already prepared for another scenario, copy the result
+                clone_preparation(reusable_preparation, new_conversation_scenario.id, self.db)
+                return ConversationScenarioConfirm(
+                    message='Conversation scenario created, preparation reused.',
+                    scenario_id=new_conversation_scenario.id,
+                )
+
         # Initialize preparation
-        prep = create_pending_preparation(new_conversation_scenario.id, self.db)
+        prep = create_pending_preparation(new_conversation_scenario.id, self.db, content_hash)
 
         # Start background task for preparation
-        self._start_preparation_task(prep.id, new_conversation_scenario, category, background_tasks)
+        background_tasks.add_task(
+            generate_scenario_preparation, prep.id, preparation_request, get_db_session
+        )
 
         return ConversationScenarioConfirm(
             message='Conversation scenario created, preparation started.',
@@ -196,6 +220,7 @@ class ConversationScenarioService:
             PaginatedConversationScenarioSummary: Paginated scenario summaries.
         """
 
+        last_session_at = func.max(Session.started_at)
         stmt = (
             select(
                 ConversationScenario.id.label('scenario_id'),  # type: ignore
@@ -209,7 +234,9 @@ class ConversationScenarioService:
                 ).label('category_name'),
                 func.count(func.distinct(Session.id)).label('total_sessions'),
                 func.avg(SessionFeedback.overall_score).label('average_score'),
-                func.max(Session.started_at).label('last_session_at'),
+                last_session_at.label('last_session_at'),
+                # Evaluated after grouping, so every row carries the number of scenarios
+                func.count().over().label('scenario_count'),
             )
             # scenario → category (may be NULL)
             .join(
@@ -220,21 +247,32 @@ class ConversationScenarioService:
             .join(Session, Session.scenario_id == ConversationScenario.id, isouter=True)
             # session  → feedback (may be zero)
             .join(SessionFeedback, SessionFeedback.session_id == Session.id, isouter=True)
+            .where(ConversationScenario.user_id == user_profile.id)
             .group_by(
                 ConversationScenario.id,
                 ConversationScenario.language_code,
                 ConversationCategory.name,
                 ConversationScenario.custom_category_label,
             )
-            .order_by(func.max(Session.started_at).desc())
+            .order_by(last_session_at.desc(), ConversationScenario.id.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
         )
 
-        stmt = stmt.where(ConversationScenario.user_id == user_profile.id)
-
         rows = self.db.exec(stmt).all()
-        scenario_count = len(rows)
-
-        print(f'Total scenarios found: {scenario_count}')
+        if rows:
+            scenario_count = rows[0].scenario_count
+        else:
+            # Past the last page the window count is not available, fall back to a plain count
+            scenario_count = self.db.exec(
+                select(func.count())
+                .select_from(ConversationScenario)
+                .join(
+                    ConversationCategory,
+                    ConversationScenario.category_id == ConversationCategory.id,
+                )
+                .where(ConversationScenario.user_id == user_profile.id)
+            ).one()
 
         if scenario_count == 0:
             return PaginatedConversationScenarioSummary(
@@ -262,7 +300,7 @@ class ConversationScenarioService:
                     last_session_at=row.last_session_at,
                     average_score=row.average_score,
                 )
-                for row in rows[(page - 1) * page_size : page * page_size]
+                for row in rows
             ],
         )
 
@@ -290,30 +328,12 @@ class ConversationScenarioService:
         if scenario.user_id != user_id:
             raise HTTPException(status_code=403, detail='Not authorized to delete this scenario.')
 
-        to_be_deleted_session_turns = []
-        session_ids = []
-        for session in scenario.sessions:
-            session_ids.append(session.id)
-            for turn in session.session_turns:
-                if turn.audio_uri:
-                    to_be_deleted_session_turns.append(turn)
-
-        # Delete session turns with audio URIs
-        session_turn_service = SessionTurnService(self.db)
-        deleted_audios = session_turn_service.delete_session_turns(to_be_deleted_session_turns)
-
-        # Delete the full audio from session feedback if it exists
-        session_service = SessionService(self.db)
-        for session_id in session_ids:
-            deleted_full_audio = session_service.delete_full_audio_from_session_feedback(session_id)
-            if deleted_full_audio:
-                deleted_audios.append(deleted_full_audio)
-
-        self.db.delete(scenario)
-        self.db.commit()
+        result = BulkDeletionService(self.db).delete_scenarios(
+            col(ConversationScenario.id) == scenario_id
+        )
         return {
-            'message': f'Deleted {len(session_ids)} sessions for user ID {user_id}',
-            'audios': deleted_audios,
+            'message': f'Deleted {result.sessions} sessions for user ID {user_id}',
+            'audios': result.audios,
         }
 
     def clear_all_conversation_scenarios(self, user_profile: UserProfile) -> dict:
@@ -327,46 +347,18 @@ class ConversationScenarioService:
             dict: Deletion summary and deleted audio list.
         """
         user_id = user_profile.id
-        statement = select(ConversationScenario).where(ConversationScenario.user_id == user_id)
-        scenarios = self.db.exec(statement).all()
-        if not scenarios:
+        result = BulkDeletionService(self.db).delete_scenarios(
+            col(ConversationScenario.user_id) == user_id
+        )
+        if not result.scenarios:
             return {
                 'message': f'No scenario found for user ID {user_id}',
                 'audios': [],
             }
 
-        to_be_deleted_session_turns = []
-        session_ids = []
-        total_deleted_scenarios = 0
-        for scenario in scenarios:
-            for session in scenario.sessions:
-                session_ids.append(session.id)
-                for turn in session.session_turns:
-                    if turn.audio_uri:
-                        to_be_deleted_session_turns.append(turn)
-
-        # Delete session turns with audio URIs
-        session_turn_service = SessionTurnService(self.db)
-        deleted_audios = session_turn_service.delete_session_turns(to_be_deleted_session_turns)
-
-        # Delete the full audio from session feedback if it exists
-        session_service = SessionService(self.db)
-        for session_id in session_ids:
-            deleted_full_audio = session_service.delete_full_audio_from_session_feedback(session_id)
-            if deleted_full_audio:
-                deleted_audios.append(deleted_full_audio)
-
-        self.db.commit()
-
-        # Let the database handle cascade deletes by just deleting the scenarios
-        for scenario in scenarios:
-            self.db.delete(scenario)
-            total_deleted_scenarios += 1
-        self.db.commit()
-
         return {
-            'message': f'Deleted {total_deleted_scenarios} scenario for user ID {user_id}',
-            'audios': deleted_audios,
+            'message': f'Deleted {result.scenarios} scenario for user ID {user_id}',
+            'audios': result.audios,
         }
 
     def get_scenario_summary(
@@ -391,37 +383,45 @@ class ConversationScenarioService:
         Raises:
             HTTPException: If the scenario is missing or unauthorized.
         """
-        scenario = self.db.get(ConversationScenario, scenario_id)
-        if not scenario:
+        # Grouping by the primary key lets the scenario columns be selected as they are
+        row = self.db.exec(
+            select(
+                ConversationScenario,
+                ConversationCategory.name,
+                func.count(func.distinct(Session.id)),
+                func.avg(
+                    case(
+                        (
+                            col(SessionFeedback.status) == FeedbackStatus.completed,
+                            SessionFeedback.overall_score,
+                        )
+                    )
+                ),
+                func.max(Session.started_at),
+            )
+            .outerjoin(
+                ConversationCategory,
+                col(ConversationScenario.category_id) == ConversationCategory.id,
+            )
+            .outerjoin(Session, col(Session.scenario_id) == ConversationScenario.id)
+            .outerjoin(SessionFeedback, col(SessionFeedback.session_id) == Session.id)
+            .where(ConversationScenario.id == scenario_id)
+            .group_by(col(ConversationScenario.id), ConversationCategory.name)
+        ).one_or_none()
+        if not row:
             raise HTTPException(status_code=404, detail='Conversation scenario not found')
 
+        scenario, category_name, total_sessions, average_score, last_session_at = row
         if scenario.user_id != user_profile.id and user_profile.account_role != AccountRole.admin:
             raise HTTPException(
                 status_code=403,
                 detail='You do not have permission to access this scenario.',
             )
 
-        total_sessions = len(scenario.sessions) if scenario.sessions else 0
-        average_score = (
-            sum(
-                [
-                    session.feedback.overall_score
-                    for session in scenario.sessions
-                    if session.feedback and session.feedback.status == FeedbackStatus.completed
-                ]
-            )
-            / total_sessions
-            if total_sessions > 0
-            else None
-        )
-        category_name = (
-            scenario.category.name if scenario.category else scenario.custom_category_label or ''
-        )
-
         return ConversationScenarioReadDetail(
             scenario_id=scenario.id,
             language_code=scenario.language_code,
-            category_name=category_name,
+            category_name=category_name or scenario.custom_category_label or '',
             category_id=scenario.category_id,
             total_sessions=total_sessions,
             average_score=average_score,
@@ -429,10 +429,7 @@ class ConversationScenarioService:
             persona=scenario.persona,
             situational_facts=scenario.situational_facts,
             difficulty_level=scenario.difficulty_level,
-            last_session_at=max(
-                (session.started_at for session in scenario.sessions if session.started_at),
-                default=None,
-            ),
+            last_session_at=last_session_at,
         )
 
     def _validate_category(self, category_id: str | None) -> ConversationCategory | None:
@@ -502,25 +499,21 @@ class ConversationScenarioService:
                 return scenario.id
         return None
 
-    def _start_preparation_task(
+    def _build_preparation_request(
         self,
-        prep_id: UUID,
         conversation_scenario: ConversationScenario,
         category: ConversationCategory | None,
-        background_tasks: BackgroundTasks,
-    ) -> None:
-        """Start background task to generate scenario preparation.
+    ) -> ScenarioPreparationCreate:
+        """Build the request for generating the preparation of a scenario.
 
         Parameters:
-            prep_id (UUID): Preparation record identifier.
             conversation_scenario (ConversationScenario): Scenario context.
             category (ConversationCategory | None): Category context.
-            background_tasks (BackgroundTasks): Background task manager.
 
         Returns:
-            None: This function schedules background work.
+            ScenarioPreparationCreate: Preparation request payload.
         """
-        new_preparation = ScenarioPreparationCreate(
+        return ScenarioPreparationCreate(
             category=category.name if category else '',
             persona=conversation_scenario.persona,
             situational_facts=conversation_scenario.situational_facts,
@@ -528,6 +521,3 @@ class ConversationScenarioService:
             num_checkpoints=3,  # Example value, adjust as needed
             language_code=conversation_scenario.language_code,
         )
-        background_tasks.add_task(
-            generate_scenario_preparation, prep_id, new_preparation, get_db_session
-        )
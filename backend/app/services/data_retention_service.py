@@ -1,43 +1,178 @@
 """Service layer for data retention service."""
 
 import logging
+import time
 from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from sqlalchemy import delete, update
 from sqlmodel import Session as DBSession
-from sqlmodel import select
+from sqlmodel import col, select, tuple_
 
 from app.connections.gcs_client import get_gcs_audio_manager
 from app.models.session_feedback import SessionFeedback
 from app.models.session_turn import SessionTurn
+from app.services.google_cloud_storage_service import GCSManager
 
+RETENTION_DAYS = 90
+CLEANUP_CHUNK_SIZE = 500
 
-def cleanup_old_session_turns(db: DBSession) -> None:
+
+@dataclass
+class RetentionCleanupReport:
+    """Progress and throughput of a data retention cleanup run.
+
+    Parameters:
+        chunks (int): Number of committed chunks.
+        turns_deleted (int): Number of deleted session turns.
+        feedback_cleared (int): Number of feedback rows whose full audio was cleared.
+        audios_deleted (int): Number of audio blobs removed from storage.
+        duration_s (float): Wall-clock duration of the run in seconds.
+    """
+
+    chunks: int = 0
+    turns_deleted: int = 0
+    feedback_cleared: int = 0
+    audios_deleted: int = 0
+    duration_s: float = 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        """Return the deletion throughput of the run.
+
+        Returns:
+            float: Deleted session turns per second.
+        """
+        return self.turns_deleted / self.duration_s if self.duration_s else 0.0
+
+
+def cleanup_old_session_turns(
+    db: DBSession, chunk_size: int = CLEANUP_CHUNK_SIZE, max_chunks: int | None = None
+) -> RetentionCleanupReport:
     """Clean up old session_turn records and related GCS files.
     Delete session_turn records older than 90 days.
 
+    Turns are processed oldest-first in chunks of at most chunk_size rows, each chunk in
+    its own transaction, so memory use and lock duration stay bounded. Every committed
+    chunk is final, so an interrupted run simply resumes with the remaining rows.
+
     Parameters:
         db (DBSession): Database session used for cleanup.
+        chunk_size (int): Maximum number of turns deleted per transaction.
+        max_chunks (int | None): Stop after this many chunks, None processes everything.
 
     Returns:
-        None: This function deletes records and related audio files.
+        RetentionCleanupReport: Counts and throughput of the run.
     """
-    threshold = datetime.now(UTC) - timedelta(days=90)
-    turns = db.exec(select(SessionTurn).where(SessionTurn.created_at <= threshold)).all()
-    if not turns:
-        return
-    delete_session_turns_and_audio_files(db, turns)
-    logging.info(f'Deleted {len(turns)} old session_turn records older than 90 days.')
+    threshold = datetime.now(UTC) - timedelta(days=RETENTION_DAYS)
+    gcs = get_gcs_audio_manager()
+    report = RetentionCleanupReport()
+    start = time.perf_counter()
+    last_key: tuple[datetime, UUID] | None = None
+
+    while max_chunks is None or report.chunks < max_chunks:
+        statement = (
+            select(SessionTurn.id, SessionTurn.audio_uri, SessionTurn.created_at)
+            .where(col(SessionTurn.created_at) <= threshold)
+            .order_by(col(SessionTurn.created_at), col(SessionTurn.id))
+            .limit(chunk_size)
+        )
+        if last_key:
+            statement = statement.where(
+                tuple_(col(SessionTurn.created_at), col(SessionTurn.id)) > tuple_(*last_key)
+            )
+        rows = db.exec(statement).all()
+        if not rows:
+            break
+
+        feedback_cleared, audios_deleted = _delete_turn_chunk(
+            db, gcs, [row.id for row in rows], [row.audio_uri for row in rows]
+        )
+        last_key = (rows[-1].created_at, rows[-1].id)
+
+        report.chunks += 1
+        report.turns_deleted += len(rows)
+        report.feedback_cleared += feedback_cleared
+        report.audios_deleted += audios_deleted
+        report.duration_s = time.perf_counter() - start
+        logging.info(
+            f'Retention cleanup chunk {report.chunks}: {report.turns_deleted} turns deleted '
+            f'so far ({report.turns_per_second:.1f} turns/s).'
+        )
+
+    report.duration_s = time.perf_counter() - start
+    if report.turns_deleted:
+        logging.info(
+            f'Deleted {report.turns_deleted} old session_turn records older than '
+            f'{RETENTION_DAYS} days in {report.chunks} chunks ({report.duration_s:.1f}s, '
+            f'{report.turns_per_second:.1f} turns/s, {report.feedback_cleared} feedback audio '
+            f'references cleared, {report.audios_deleted} audio files deleted).'
+        )
+    return report
+
+
+def _delete_turn_chunk(
+    db: DBSession, gcs: GCSManager | None, turn_ids: list[UUID], audio_uris: list[str]
+) -> tuple[int, int]:
+    """Delete one chunk of session turns together with their audio files.
+
+    The feedback rows referencing the chunk's audio are looked up with a single query.
+    Blobs are deleted before the commit, so a crash in between only leaves rows that the
+    next run picks up again.
+
+    Parameters:
+        db (DBSession): Database session used for deletion.
+        gcs (GCSManager | None): Audio storage manager, None when storage is unavailable.
+        turn_ids (list[UUID]): Identifiers of the turns to delete.
+        audio_uris (list[str]): Audio blob names of the turns.
+
+    Returns:
+        tuple[int, int]: Number of cleared feedback rows and deleted audio blobs.
+    """
+    audio_uris = [audio_uri for audio_uri in audio_uris if audio_uri]
+    feedbacks = (
+        db.exec(
+            select(SessionFeedback.id, SessionFeedback.full_audio_filename).where(
+                col(SessionFeedback.full_audio_filename).in_(audio_uris)
+            )
+        ).all()
+        if audio_uris
+        else []
+    )
+
+    deleted_audios = []
+    if gcs:
+        deleted_audios = gcs.delete_documents(
+            audio_uris + [feedback.full_audio_filename for feedback in feedbacks]
+        )
+
+    try:
+        if feedbacks:
+            db.exec(
+                update(SessionFeedback)
+                .where(col(SessionFeedback.id).in_([feedback.id for feedback in feedbacks]))
+                .values(full_audio_filename='', updated_at=datetime.now(UTC))
+                .execution_options(synchronize_session=False)
+            )
+        db.exec(
+            delete(SessionTurn)
+            .where(col(SessionTurn.id).in_(turn_ids))
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(feedbacks), len(deleted_audios)
 
 
 def delete_session_turns_and_audio_files(db: DBSession, turns: Sequence[SessionTurn]) -> None:
     """Delete session_turn records and associated GCS audio files.
-    For each turn:
-    1. Delete the GCS file referenced by audio_uri.
-    2. Check if session_feedback references this audio_uri and delete the GCS file if
-         it exists, then clear the full_audio_filename field.
-    3. Delete the session_turn record.
+    The GCS files referenced by the turns' audio_uri are deleted, session_feedback rows
+    referencing one of them get their full audio deleted and full_audio_filename cleared,
+    then the session_turn records are deleted.
 
     Parameters:
         db (DBSession): Database session used for deletion.
@@ -46,38 +181,14 @@ def delete_session_turns_and_audio_files(db: DBSession, turns: Sequence[SessionT
     Returns:
         None: This function deletes records and updates feedback entries.
     """
-
-    gcs = get_gcs_audio_manager()
-    for turn in turns:
-        audio_uri = turn.audio_uri
-        # 1. Delete GCS file (audio_uri)
-        if gcs and audio_uri:
-            try:
-                gcs.delete_document(audio_uri)
-            except Exception as e:
-                logging.warning(f'Failed to delete GCS audio file {audio_uri}: {e}')
-        # 2. Check if session_feedback references this audio_uri
-        feedbacks = db.exec(
-            select(SessionFeedback).where(SessionFeedback.full_audio_filename == audio_uri)
-        ).all()
-        for feedback in feedbacks:
-            # Delete GCS file (if not deleted above, GCSManager internally checks for existence)
-            if gcs and feedback.full_audio_filename:
-                try:
-                    gcs.delete_document(feedback.full_audio_filename)
-                except Exception as e:
-                    logging.warning(
-                        f'Failed to delete GCS feedback audio {feedback.full_audio_filename}: {e}'
-                    )
-            # Clear full_audio_filename field
-            feedback.full_audio_filename = ''
-            db.add(feedback)
-        # 3. Delete session_turn record
-        try:
-            db.delete(turn)
-        except Exception as e:
-            logging.warning(f'Failed to delete session_turn {turn.id}: {e}')
-    db.commit()
+    if not turns:
+        return
+    _delete_turn_chunk(
+        db,
+        get_gcs_audio_manager(),
+        [turn.id for turn in turns],
+        [turn.audio_uri for turn in turns],
+    )
 
 
 def delete_session_turns_by_session_id(db: DBSession, session_id: UUID) -> None:
@@ -90,11 +201,15 @@ def delete_session_turns_by_session_id(db: DBSession, session_id: UUID) -> None:
     Returns:
         None: This function deletes records and related audio files.
     """
-    turns = db.exec(select(SessionTurn).where(SessionTurn.session_id == session_id)).all()
-    if not turns:
+    rows = db.exec(
+        select(SessionTurn.id, SessionTurn.audio_uri).where(SessionTurn.session_id == session_id)
+    ).all()
+    if not rows:
         return
-    delete_session_turns_and_audio_files(db, turns)
-    logging.info(f'Deleted {len(turns)} session_turn records for session {session_id}.')
+    _delete_turn_chunk(
+        db, get_gcs_audio_manager(), [row.id for row in rows], [row.audio_uri for row in rows]
+    )
+    logging.info(f'Deleted {len(rows)} session_turn records for session {session_id}.')
 
 
 def delete_full_audio_for_feedback_by_session_id(db: DBSession, session_id: UUID) -> None:
@@ -1,10 +1,13 @@
 """Service layer for google cloud storage service."""
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from typing import BinaryIO, Literal
 
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 from google.oauth2 import service_account
 
@@ -191,6 +194,38 @@ class GCSManager:
         else:
             logging.warning(f'Blob does not exist: {blob_name}')
 
+    def delete_documents(self, filenames: Iterable[str], max_workers: int = 16) -> list[str]:
+        """Delete several documents concurrently under the current prefix.
+
+        Each blob is deleted with a single request instead of an existence check followed
+        by a delete. Missing blobs are skipped with a warning, other failures are logged.
+
+        Parameters:
+            filenames (Iterable[str]): Blob filenames relative to the prefix.
+            max_workers (int): Maximum number of concurrent delete requests.
+
+        Returns:
+            list[str]: Filenames whose blobs no longer exist in the bucket.
+        """
+        unique_filenames = list(dict.fromkeys(filename for filename in filenames if filename))
+        if not unique_filenames:
+            return []
+
+        def delete_blob(filename: str) -> str | None:
+            blob_name = f'{self.prefix}{filename}'
+            try:
+                self.bucket.blob(blob_name).delete()
+            except NotFound:
+                logging.warning(f'Blob does not exist: {blob_name}')
+            except Exception as e:
+                logging.error(f'Failed to delete blob {blob_name}: {e}')
+                return None
+            return filename
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_filenames))) as executor:
+            results = list(executor.map(delete_blob, unique_filenames))
+        return [filename for filename in results if filename is not None]
+
     def download_to_bytesio(self, filename: str) -> BinaryIO:
         """Download a single file into a BytesIO object.
 
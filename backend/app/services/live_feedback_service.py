@@ -1,20 +1,29 @@
 """Service layer for live feedback service."""
 
-import concurrent.futures
 import json
 import logging
 from collections.abc import Callable, Generator
-from contextlib import suppress
+from functools import partial
 from uuid import UUID
 
 from sqlmodel import Session as DBSession
 from sqlmodel import select
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from app.connections.vertexai_client import call_structured_llm
+from app.config import settings
+from app.connections.vertexai_client import call_structured_llm, llm_executor
+from app.dependencies.database import db_session_scope, log_pool_occupancy
 from app.models import SessionTurn
 from app.models.live_feedback_model import LiveFeedback
 from app.schemas.live_feedback_schema import LiveFeedbackLlmOutput, LiveFeedbackRead
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_resilience import deadline_scope, stop_at_deadline, time_until
+from app.services.prompt_budget import (
+    history_section,
+    hr_context_section,
+    prompt_budget,
+    transcript_section,
+)
 from app.services.voice_analysis_service import analyze_voice
 
 
@@ -59,61 +68,21 @@ def format_feedback_lines(feedback_items: list[LiveFeedbackRead]) -> list[str]:
     ]
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
-def safe_generate_live_feedback_item(
-    session_turn_context: SessionTurn,
-    previous_feedback: str = '',
-    hr_docs_context: str = '',
-    language: str = 'en',
-) -> LiveFeedbackLlmOutput:
-    """Retry-safe wrapper for generating a live feedback item.
+def build_live_feedback_prompt(
+    hr_docs_context: str, transcript: str, voice_analysis: str, previous_feedback: str
+) -> str:
+    """Build the prompt for live feedback generation.
 
     Parameters:
-        session_turn_context (SessionTurn): Current session turn context.
-        previous_feedback (str): Prior feedback history.
         hr_docs_context (str): HR document context.
-        language (str): Language code for responses.
-
-    Returns:
-        LiveFeedbackLlmOutput: Generated feedback output.
-    """
-    if previous_feedback is None:
-        previous_feedback = []
-    return generate_live_feedback_item(
-        session_turn_context.audio_uri,
-        session_turn_context.text,
-        previous_feedback,
-        hr_docs_context,
-        language,
-    )
-
-
-def generate_live_feedback_item(
-    user_audio_path: str = None,
-    transcript: str = 'No transcript available',
-    previous_feedback: str = 'No previous feedback available',
-    hr_docs_context: str = 'No hr document context available',
-    language: str = 'en',
-) -> LiveFeedbackLlmOutput:
-    """Generate a live feedback item using LLM analysis.
-
-    Parameters:
-        user_audio_path (str | None): Path or URI to the user audio.
         transcript (str): Transcript text for the turn.
+        voice_analysis (str): Voice analysis of the turn audio.
         previous_feedback (str): Prior feedback context.
-        hr_docs_context (str): HR document context.
-        language (str): Language code for responses.
 
     Returns:
-        LiveFeedbackLlmOutput: Generated feedback item.
+        str: Constructed prompt string.
     """
-    voice_analysis = ''
-    if user_audio_path:
-        voice_analysis = analyze_voice(user_audio_path)
-    if not voice_analysis:
-        voice_analysis = 'No voice analysis available.'
-
-    user_prompt = f"""
+    return f"""
     Analyze the provided HR documents, the transcript, and voice analysis from a
     single turn of an HR professional's training conversation.
     Based on the these, assess the HR professional’s tone and speech content.
@@ -164,14 +133,87 @@ def generate_live_feedback_item(
     
     """
 
+
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('live_feedback'),
+)
+def safe_generate_live_feedback_item(
+    session_turn_context: SessionTurn,
+    previous_feedback: str = '',
+    hr_docs_context: str = '',
+    language: str = 'en',
+) -> LiveFeedbackLlmOutput:
+    """Retry-safe wrapper for generating a live feedback item.
+
+    Parameters:
+        session_turn_context (SessionTurn): Current session turn context.
+        previous_feedback (str): Prior feedback history.
+        hr_docs_context (str): HR document context.
+        language (str): Language code for responses.
+
+    Returns:
+        LiveFeedbackLlmOutput: Generated feedback output.
+    """
+    if previous_feedback is None:
+        previous_feedback = []
+    return generate_live_feedback_item(
+        session_turn_context.audio_uri,
+        session_turn_context.text,
+        previous_feedback,
+        hr_docs_context,
+        language,
+    )
+
+
+def generate_live_feedback_item(
+    user_audio_path: str = None,
+    transcript: str = 'No transcript available',
+    previous_feedback: str = 'No previous feedback available',
+    hr_docs_context: str = 'No hr document context available',
+    language: str = 'en',
+) -> LiveFeedbackLlmOutput:
+    """Generate a live feedback item using LLM analysis.
+
+    Parameters:
+        user_audio_path (str | None): Path or URI to the user audio.
+        transcript (str): Transcript text for the turn.
+        previous_feedback (str): Prior feedback context.
+        hr_docs_context (str): HR document context.
+        language (str): Language code for responses.
+
+    Returns:
+        LiveFeedbackLlmOutput: Generated feedback item.
+    """
+    voice_analysis = ''
+    if user_audio_path:
+        voice_analysis = analyze_voice(user_audio_path)
+    if not voice_analysis:
+        voice_analysis = 'No voice analysis available.'
+
+    system_prompt = (
+        'You are an expert communication coach analyzing a single speaking turn.'
+        f'Your response should always be in the language represented '
+        f'by the ISO code "{language}"'
+    )
+    user_prompt = prompt_budget.build(
+        'live_feedback',
+        partial(build_live_feedback_prompt, voice_analysis=voice_analysis),
+        [
+            hr_context_section(hr_docs_context),
+            transcript_section(transcript),
+            # Previous feedback is ordered newest-first, so the head is the most recent
+            history_section(previous_feedback, 'previous_feedback', strategy='head'),
+        ],
+        system_prompt=system_prompt,
+    )
+
     return call_structured_llm(
         request_prompt=user_prompt,
-        system_prompt=(
-            'You are an expert communication coach analyzing a single speaking turn.'
-            f'Your response should always be in the language represented '
-            f'by the ISO code "{language}"'
-        ),
+        system_prompt=system_prompt,
         output_model=LiveFeedbackLlmOutput,
+        operation='live_feedback',
         mock_response=LiveFeedbackLlmOutput(heading='Tone', feedback_text='Speak more calmly.'),
     )
 
@@ -195,56 +237,57 @@ def generate_and_store_live_feedback(
     Returns:
         LiveFeedback | None: Stored feedback record or None on failure.
     """
-    session_gen = session_generator_func()
-    try:
-        db_session: DBSession = next(session_gen)
-
+    # Read phase: fetch the feedback history and release the connection right away
+    with db_session_scope(session_generator_func) as db_session:
         feedback_items = fetch_live_feedback_for_session(db_session, session_id, None)
         db_session.commit()
-        formatted_lines = format_feedback_lines(feedback_items)
-        previous_feedback = '\n'.join(formatted_lines)
-
-        if not any(
-            [
-                session_turn_context.audio_uri,
-                session_turn_context.text,
-                hr_docs_context,
-                previous_feedback,
-            ]
-        ):
+    formatted_lines = format_feedback_lines(feedback_items)
+    previous_feedback = '\n'.join(formatted_lines)
+
+    if not any(
+        [
+            session_turn_context.audio_uri,
+            session_turn_context.text,
+            hr_docs_context,
+            previous_feedback,
+        ]
+    ):
+        return None
+
+    # LLM phase: no database connection is held while the model call is in flight
+    log_pool_occupancy('live feedback generation')
+    with deadline_scope(settings.LIVE_FEEDBACK_DEADLINE_SECONDS) as deadline:
+        future_live_feedback = llm_executor.submit(
+            safe_generate_live_feedback_item,
+            session_turn_context,
+            previous_feedback,
+            hr_docs_context,
+            language,
+        )
+
+    try:
+        # Live feedback that arrives late is of no use to the running session
+        live_feedback_item = future_live_feedback.result(timeout=time_until(deadline))
+    except Exception as e:
+        logging.error('Failed to generate live feedback: %s', e)
+        return None
+
+    # Write phase: store the generated item in a fresh short-lived session
+    with db_session_scope(session_generator_func) as db_session:
+        try:
+            live_feedback_item_db = LiveFeedback(
+                session_id=session_id,
+                heading=live_feedback_item.heading,
+                feedback_text=live_feedback_item.feedback_text,
+            )
+            db_session.add(live_feedback_item_db)
+            db_session.commit()
+            db_session.refresh(live_feedback_item_db)
+            return live_feedback_item_db
+        except Exception as e:
+            logging.error('Failed to store live feedback: %s', e)
+            db_session.rollback()
             return None
-        else:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_live_feedback = executor.submit(
-                    safe_generate_live_feedback_item,
-                    session_turn_context,
-                    previous_feedback,
-                    hr_docs_context,
-                    language,
-                )
-
-                try:
-                    live_feedback_item = future_live_feedback.result()
-                except Exception as e:
-                    print('[ERROR] Failed to generate live feedback:', e)
-                    return None
-            try:
-                live_feedback_item_db = LiveFeedback(
-                    session_id=session_id,
-                    heading=live_feedback_item.heading,
-                    feedback_text=live_feedback_item.feedback_text,
-                )
-                db_session.add(live_feedback_item_db)
-                db_session.commit()
-                db_session.refresh(live_feedback_item_db)
-                return live_feedback_item_db
-            except Exception as e:
-                logging.info('[ERROR] Failed to store live feedback:', e)
-                db_session.rollback()
-                return None
-    finally:
-        with suppress(StopIteration):
-            next(session_gen)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,232 @@
+"""Service layer for llm metrics."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+
+import sentry_sdk
+from tenacity import RetryCallState
+
+# Upper bounds of the latency histogram, LLM calls take from a few hundred ms to minutes
+LATENCY_BUCKETS_S = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0, 160.0)
+
+
+@dataclass
+class LLMCallStats:
+    """Statistics of the LLM calls of one operation against one model.
+
+    Parameters:
+        calls (int): Number of calls made against the model.
+        failures (int): Number of calls that raised, including unparsable responses.
+        cache_hits (int): Number of calls served from the response cache.
+        input_tokens (int): Input tokens reported by the provider.
+        cached_input_tokens (int): Input tokens served from cached content.
+        output_tokens (int): Output tokens reported by the provider.
+        latency_sum_s (float): Total latency of all calls in seconds.
+        latency_buckets (list[int]): Number of calls per latency bucket, not cumulative.
+    """
+
+    calls: int = 0
+    failures: int = 0
+    cache_hits: int = 0
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+    latency_sum_s: float = 0.0
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_S))
+
+
+@dataclass
+class LLMCallRecord:
+    """Token usage of a single call, filled in by the caller once the response arrived.
+
+    Parameters:
+        input_tokens (int): Input tokens reported by the provider.
+        cached_input_tokens (int): Input tokens served from cached content.
+        output_tokens (int): Output tokens reported by the provider.
+    """
+
+    input_tokens: int = 0
+    cached_input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class LLMMetrics:
+    """Process-wide statistics of LLM calls labeled by logical operation and model.
+
+    Every call is timed from the moment it asks for a model slot until its response is
+    parsed, so the latency includes waiting for the rate limits. Each call is also
+    reported as a Sentry span, which is a no-op when Sentry is not initialized.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self._stats: dict[tuple[str, str], LLMCallStats] = {}
+        self._retries: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, operation: str, model: str) -> LLMCallStats:
+        """Return the statistics of an operation and model, creating them on first use.
+
+        Must be called while holding the lock.
+
+        Parameters:
+            operation (str): Logical operation, e.g. 'scoring'.
+            model (str): Model the call is made against.
+
+        Returns:
+            LLMCallStats: Statistics of the operation and model.
+        """
+        return self._stats.setdefault((operation, model), LLMCallStats())
+
+    @contextmanager
+    def track(self, operation: str, model: str) -> Iterator[LLMCallRecord]:
+        """Time an LLM call and record its outcome and token usage.
+
+        Parameters:
+            operation (str): Logical operation, e.g. 'scoring'.
+            model (str): Model the call is made against.
+
+        Returns:
+            Iterator[LLMCallRecord]: Record the caller fills with the token usage.
+        """
+        record = LLMCallRecord()
+        failed = False
+        start = time.perf_counter()
+        with sentry_sdk.start_span(op='llm.call', name=f'llm {operation}') as span:
+            span.set_tag('llm.operation', operation)
+            span.set_data('llm.model', model)
+            try:
+                yield record
+            except BaseException:
+                failed = True
+                span.set_status('internal_error')
+                raise
+            finally:
+                latency = time.perf_counter() - start
+                span.set_data('llm.input_tokens', record.input_tokens)
+                span.set_data('llm.cached_input_tokens', record.cached_input_tokens)
+                span.set_data('llm.output_tokens', record.output_tokens)
+                self._observe(operation, model, latency, record, failed)
+
+    def _observe(
+        self, operation: str, model: str, latency: float, record: LLMCallRecord, failed: bool
+    ) -> None:
+        """Add a finished call to the statistics.
+
+        Parameters:
+            operation (str): Logical operation.
+            model (str): Model the call was made against.
+            latency (float): Latency of the call in seconds.
+            record (LLMCallRecord): Token usage of the call.
+            failed (bool): Whether the call raised.
+
+        Returns:
+            None: This function mutates the statistics in-place.
+        """
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_S) if latency <= bound),
+            None,
+        )
+        with self._lock:
+            stats = self._get(operation, model)
+            stats.calls += 1
+            stats.failures += int(failed)
+            stats.input_tokens += record.input_tokens
+            stats.cached_input_tokens += record.cached_input_tokens
+            stats.output_tokens += record.output_tokens
+            stats.latency_sum_s += latency
+            if bucket is not None:
+                stats.latency_buckets[bucket] += 1
+        logging.debug(
+            'LLM call %s on %s took %.2fs, %d input / %d output tokens%s',
+            operation,
+            model,
+            latency,
+            record.input_tokens,
+            record.output_tokens,
+            ', failed' if failed else '',
+        )
+
+    def record_cache_hit(self, operation: str, model: str) -> None:
+        """Count a call that was served from the response cache.
+
+        Parameters:
+            operation (str): Logical operation.
+            model (str): Model the call would have been made against.
+
+        Returns:
+            None: This function mutates the statistics in-place.
+        """
+        with self._lock:
+            self._get(operation, model).cache_hits += 1
+
+    def record_retry(self, operation: str) -> None:
+        """Count a retry of an operation.
+
+        Parameters:
+            operation (str): Logical operation.
+
+        Returns:
+            None: This function mutates the statistics in-place.
+        """
+        with self._lock:
+            self._retries[operation] = self._retries.get(operation, 0) + 1
+
+    def retry_callback(self, operation: str) -> Callable[[RetryCallState], None]:
+        """Return a tenacity `before_sleep` callback that counts the retries of an operation.
+
+        Parameters:
+            operation (str): Logical operation.
+
+        Returns:
+            Callable[[RetryCallState], None]: Callback for `retry(before_sleep=...)`.
+        """
+
+        def before_sleep(retry_state: RetryCallState) -> None:
+            self.record_retry(operation)
+            logging.warning(
+                'Retrying %s after attempt %d failed: %s',
+                operation,
+                retry_state.attempt_number,
+                retry_state.outcome.exception() if retry_state.outcome else None,
+            )
+
+        return before_sleep
+
+    def get_stats(self) -> dict[tuple[str, str], LLMCallStats]:
+        """Return a snapshot of the call statistics.
+
+        Returns:
+            dict[tuple[str, str], LLMCallStats]: Statistics per operation and model.
+        """
+        with self._lock:
+            return {
+                key: replace(stats, latency_buckets=list(stats.latency_buckets))
+                for key, stats in self._stats.items()
+            }
+
+    def get_retries(self) -> dict[str, int]:
+        """Return a snapshot of the retry counts.
+
+        Returns:
+            dict[str, int]: Number of retries per operation.
+        """
+        with self._lock:
+            return dict(self._retries)
+
+    def reset(self) -> None:
+        """Drop all recorded statistics.
+
+        Returns:
+            None: This function mutates the statistics in-place.
+        """
+        with self._lock:
+            self._stats.clear()
+            self._retries.clear()
+
+
+llm_metrics = LLMMetrics()
@@ -0,0 +1,447 @@
+"""Service layer for llm resilience."""
+
+import asyncio
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Literal
+
+import httpx
+from tenacity import RetryCallState
+
+from app.config import settings
+
+# Retrying needs time for the fixed 1 s wait of the wrappers plus a minimal attempt
+RETRY_MIN_REMAINING_S = 2.0
+HEDGE_LATENCY_QUANTILE = 0.95
+
+CircuitState = Literal['closed', 'open', 'half_open']
+
+# Monotonic deadline of the running pipeline, copied into the tasks of the LLM executor
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    'llm_deadline', default=None
+)
+
+
+class LLMUnavailableError(RuntimeError):
+    """Raised without calling the model while the circuit of the model is open."""
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when an LLM call runs out of the time left until the pipeline deadline."""
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[float]:
+    """Run a pipeline under a deadline that its LLM calls derive their timeouts from.
+
+    Nested scopes can only shorten the deadline of the enclosing scope.
+
+    Parameters:
+        seconds (float): Time budget of the pipeline.
+
+    Returns:
+        Iterator[float]: Yields the monotonic deadline.
+    """
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        deadline = min(deadline, outer)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def time_until(deadline: float) -> float:
+    """Return the seconds left until a deadline.
+
+    Parameters:
+        deadline (float): Monotonic deadline.
+
+    Returns:
+        float: Remaining seconds, 0 once the deadline has passed.
+    """
+    return max(0.0, deadline - time.monotonic())
+
+
+def remaining_time() -> float | None:
+    """Return the seconds left until the deadline of the running pipeline.
+
+    Returns:
+        float | None: Remaining seconds, or None outside of a deadline scope.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else time_until(deadline)
+
+
+def get_call_timeout(default: float) -> float:
+    """Return the timeout of the next LLM call.
+
+    Parameters:
+        default (float): Timeout of a call outside of a deadline scope.
+
+    Returns:
+        float: Timeout in seconds, bounded by the remaining pipeline time.
+
+    Raises:
+        DeadlineExceededError: If the deadline of the pipeline has already passed.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return default
+    if remaining <= 0:
+        raise DeadlineExceededError('Pipeline deadline exceeded before the LLM call')
+    return min(default, remaining)
+
+
+def stop_at_deadline(retry_state: RetryCallState) -> bool:
+    """Tenacity stop condition for the retry-safe LLM wrappers.
+
+    Retrying is pointless while the circuit of the model is open, or when the deadline of
+    the pipeline leaves no time for another attempt.
+
+    Parameters:
+        retry_state (RetryCallState): State of the retried call.
+
+    Returns:
+        bool: Whether to stop retrying.
+    """
+    if retry_state.outcome is not None and isinstance(
+        retry_state.outcome.exception(), LLMUnavailableError
+    ):
+        return True
+    remaining = remaining_time()
+    return remaining is not None and remaining < RETRY_MIN_REMAINING_S
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """Return whether an LLM call failed because its request timed out.
+
+    Parameters:
+        error (BaseException): Error raised by the call.
+
+    Returns:
+        bool: True for timeouts of the HTTP client or of a wait.
+    """
+    return isinstance(error, TimeoutError | httpx.TimeoutException)
+
+
+class CircuitBreaker:
+    """Circuit breaker of a single model.
+
+    The circuit opens after a number of consecutive failed calls, so further calls fail
+    fast instead of piling up on an unhealthy provider. Once the reset timeout has
+    passed, a single probe call is let through: its success closes the circuit, its
+    failure opens it again.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize a closed circuit.
+
+        Parameters:
+            name (str): Model the circuit protects.
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a probe call.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the circuit.
+
+        Returns:
+            CircuitState: 'closed', 'open' or 'half_open'.
+        """
+        with self._lock:
+            return self._get_state()
+
+    def _get_state(self) -> CircuitState:
+        """Return the state of the circuit, must be called while holding the lock.
+
+        Returns:
+            CircuitState: 'closed', 'open' or 'half_open'.
+        """
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return 'open'
+        return 'half_open'
+
+    def allow(self) -> bool:
+        """Return whether a call may be made, reserving the probe call when half open.
+
+        Returns:
+            bool: False while the circuit is open or another probe call is in flight.
+        """
+        with self._lock:
+            state = self._get_state()
+            if state == 'closed':
+                return True
+            if state == 'open' or self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call.
+
+        Returns:
+            None: This function mutates the circuit in-place.
+        """
+        with self._lock:
+            if self._opened_at is not None:
+                logging.info('LLM circuit of %s closed after a successful probe call', self.name)
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call and open the circuit at the threshold or on a failed probe.
+
+        Returns:
+            None: This function mutates the circuit in-place.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._probe_in_flight or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probe_in_flight:
+                    logging.warning(
+                        'LLM circuit of %s opened after %d consecutive failures',
+                        self.name,
+                        self._failures,
+                    )
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Let another probe call through after a probe call ended without a result.
+
+        Returns:
+            None: This function mutates the circuit in-place.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Fail fast while the circuit is open, else record the outcome of the call.
+
+        A call that ran out of pipeline time is not counted as a failure, as it says more
+        about the deadline than about the health of the provider.
+
+        Returns:
+            Iterator[None]: Yields once the call may be made.
+
+        Raises:
+            LLMUnavailableError: If the circuit is open.
+        """
+        if not self.allow():
+            raise LLMUnavailableError(f'{self.name} is unavailable, its circuit is open')
+        try:
+            yield
+        except DeadlineExceededError:
+            self.release_probe()
+            raise
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # A cancelled call says nothing about the health of the provider
+            self.release_probe()
+            raise
+        self.record_success()
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers per model, created on first use."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize an empty registry.
+
+        Parameters:
+            failure_threshold (int): Consecutive failures that open a circuit.
+            reset_timeout (float): Seconds a circuit stays open before a probe call.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model: str) -> CircuitBreaker:
+        """Return the circuit breaker of a model.
+
+        Parameters:
+            model (str): Model the call is made against.
+
+        Returns:
+            CircuitBreaker: Circuit breaker of the model.
+        """
+        with self._lock:
+            if model not in self._breakers:
+                self._breakers[model] = CircuitBreaker(
+                    model, self.failure_threshold, self.reset_timeout
+                )
+            return self._breakers[model]
+
+    def get_states(self) -> dict[str, CircuitState]:
+        """Return the state of every circuit.
+
+        Returns:
+            dict[str, CircuitState]: State per model.
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {model: breaker.state for model, breaker in breakers.items()}
+
+
+class HedgePolicy:
+    """Decides after which delay a slow LLM call gets a hedged duplicate.
+
+    Recent latencies are kept per operation and model. Once enough samples are known, a
+    call that is still running after the p95 latency is duplicated, and whichever
+    response arrives first is used.
+    """
+
+    def __init__(self, enabled: bool, window: int, min_samples: int) -> None:
+        """Initialize the policy without latency samples.
+
+        Parameters:
+            enabled (bool): Whether calls are hedged at all.
+            window (int): Number of recent latencies kept per key.
+            min_samples (int): Samples needed before calls of a key are hedged.
+        """
+        self.enabled = enabled
+        self.window = window
+        self.min_samples = min_samples
+        self._latencies: dict[tuple[str, str], deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation: str, model: str, latency: float) -> None:
+        """Record the latency of a successful call.
+
+        Parameters:
+            operation (str): Logical operation.
+            model (str): Model the call was made against.
+            latency (float): Latency in seconds.
+
+        Returns:
+            None: This function mutates the samples in-place.
+        """
+        with self._lock:
+            samples = self._latencies.setdefault((operation, model), deque(maxlen=self.window))
+            samples.append(latency)
+
+    def get_delay(self, operation: str, model: str) -> float | None:
+        """Return the delay after which a call is hedged.
+
+        Parameters:
+            operation (str): Logical operation.
+            model (str): Model the call is made against.
+
+        Returns:
+            float | None: p95 latency of the key, or None if calls are not hedged.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            samples = sorted(self._latencies.get((operation, model), ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[math.ceil(HEDGE_LATENCY_QUANTILE * len(samples)) - 1]
+
+
+def run_hedged[R](call: Callable[[], R], delay: float | None, executor: ThreadPoolExecutor) -> R:
+    """Run a blocking call and start a duplicate if it is still running after a delay.
+
+    The slower call cannot be cancelled, it ends with its own request timeout.
+
+    Parameters:
+        call (Callable[[], R]): Call to run.
+        delay (float | None): Delay before the duplicate is started, None to not hedge.
+        executor (ThreadPoolExecutor): Pool the calls run on.
+
+    Returns:
+        R: Result of the first call that succeeded.
+
+    Raises:
+        Exception: The error of the last call if both calls failed.
+    """
+    if delay is None:
+        return call()
+    primary = executor.submit(contextvars.copy_context().run, call)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+
+    logging.info('Hedging LLM call still running after %.2fs', delay)
+    hedge = executor.submit(contextvars.copy_context().run, call)
+    pending: set[Future[R]] = {primary, hedge}
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+async def arun_hedged[R](call: Callable[[], Awaitable[R]], delay: float | None) -> R:
+    """Await a call and start a duplicate if it is still running after a delay.
+
+    Parameters:
+        call (Callable[[], Awaitable[R]]): Call to await.
+        delay (float | None): Delay before the duplicate is started, None to not hedge.
+
+    Returns:
+        R: Result of the first call that succeeded, the other call is cancelled.
+
+    Raises:
+        Exception: The error of the last call if both calls failed.
+    """
+    if delay is None:
+        return await call()
+    primary = asyncio.ensure_future(call())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result()
+
+    logging.info('Hedging LLM call still running after %.2fs', delay)
+    pending = {primary, asyncio.ensure_future(call())}
+    error: BaseException | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.LLM_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.LLM_CIRCUIT_BREAKER_RESET_SECONDS,
+)
+hedge_policy = HedgePolicy(
+    enabled=settings.LLM_HEDGING_ENABLED,
+    window=settings.LLM_HEDGING_WINDOW,
+    min_samples=settings.LLM_HEDGING_MIN_SAMPLES,
+)
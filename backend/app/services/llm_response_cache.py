@@ -0,0 +1,353 @@
+"""Service layer for llm response cache."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime, timedelta
+from typing import Protocol
+
+from pydantic import BaseModel
+from sqlmodel import Session as DBSession
+from sqlmodel import col, delete, select
+
+from app.config import settings
+from app.dependencies.database import db_session_scope, get_db_session
+from app.models.llm_response_cache_entry import LLMResponseCacheEntry
+from app.services.ttl_cache import TTLCache
+
+
+class LLMResponseCacheBackend(Protocol):
+    """Storage of cached LLM responses.
+
+    Parameters:
+        blocking (bool): Whether lookups do IO and should run off the event loop.
+    """
+
+    blocking: bool
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response of a key, or None when missing or expired."""
+        ...
+
+    def set(self, key: str, response: str, ttl: float) -> None:
+        """Store a response for a key."""
+        ...
+
+    def evict_expired(self) -> int:
+        """Remove expired responses and return how many were removed."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all responses."""
+        ...
+
+
+class InMemoryLLMResponseCacheBackend:
+    """Process-local, size-bounded LRU storage of cached LLM responses."""
+
+    blocking = False
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize an empty storage.
+
+        Parameters:
+            maxsize (int): Maximum number of responses, the least recently used one is evicted.
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=0)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response of a key.
+
+        Parameters:
+            key (str): Cache key.
+
+        Returns:
+            str | None: Cached response, or None when missing or expired.
+        """
+        return self._cache.get(key)
+
+    def set(self, key: str, response: str, ttl: float) -> None:
+        """Store a response for a key.
+
+        Parameters:
+            key (str): Cache key.
+            response (str): Raw response text.
+            ttl (float): Time to live in seconds.
+
+        Returns:
+            None: This function mutates the storage in-place.
+        """
+        self._cache.set(key, response, ttl=ttl)
+
+    def evict_expired(self) -> int:
+        """Expired responses are evicted on lookup and by the LRU bound.
+
+        Returns:
+            int: Always 0.
+        """
+        return 0
+
+    def clear(self) -> None:
+        """Remove all responses.
+
+        Returns:
+            None: This function mutates the storage in-place.
+        """
+        self._cache.clear()
+
+
+class PostgresLLMResponseCacheBackend:
+    """Database storage of cached LLM responses shared by all workers."""
+
+    blocking = True
+
+    def __init__(
+        self, session_generator_func: Callable[[], Generator[DBSession]] = get_db_session
+    ) -> None:
+        """Initialize the storage.
+
+        Parameters:
+            session_generator_func (Callable[[], Generator[DBSession]]): DB session generator,
+                every operation uses its own short-lived session.
+        """
+        self.session_generator_func = session_generator_func
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response of a key.
+
+        Parameters:
+            key (str): Cache key.
+
+        Returns:
+            str | None: Cached response, or None when missing or expired.
+        """
+        with db_session_scope(self.session_generator_func) as db:
+            return db.exec(
+                select(LLMResponseCacheEntry.response).where(
+                    LLMResponseCacheEntry.key == key,
+                    col(LLMResponseCacheEntry.expires_at) > datetime.now(UTC),
+                )
+            ).first()
+
+    def set(self, key: str, response: str, ttl: float) -> None:
+        """Store a response for a key, replacing an existing entry.
+
+        Parameters:
+            key (str): Cache key.
+            response (str): Raw response text.
+            ttl (float): Time to live in seconds.
+
+        Returns:
+            None: This function writes the entry to the database.
+        """
+        now = datetime.now(UTC)
+        with db_session_scope(self.session_generator_func) as db:
+            db.merge(
+                LLMResponseCacheEntry(
+                    key=key,
+                    response=response,
+                    expires_at=now + timedelta(seconds=ttl),
+                    created_at=now,
+                )
+            )
+            db.commit()
+
+    def evict_expired(self) -> int:
+        """Delete all expired responses.
+
+        Returns:
+            int: Number of deleted responses.
+        """
+        with db_session_scope(self.session_generator_func) as db:
+            result = db.exec(
+                delete(LLMResponseCacheEntry).where(
+                    col(LLMResponseCacheEntry.expires_at) <= datetime.now(UTC)
+                )
+            )
+            db.commit()
+            return result.rowcount
+
+    def clear(self) -> None:
+        """Delete all responses.
+
+        Returns:
+            None: This function deletes the entries from the database.
+        """
+        with db_session_scope(self.session_generator_func) as db:
+            db.exec(delete(LLMResponseCacheEntry))
+            db.commit()
+
+
+class LLMResponseCache:
+    """Content-addressed cache of structured LLM responses.
+
+    Callers opt in per call, which only makes sense for deterministic calls. The key covers
+    everything that determines the response, so a repeated call with identical inputs skips
+    the network. Storage errors are logged and treated as misses, so a broken cache never
+    fails an LLM call.
+    """
+
+    def __init__(self, backend: LLMResponseCacheBackend, ttl: float) -> None:
+        """Initialize the cache.
+
+        Parameters:
+            backend (LLMResponseCacheBackend): Storage of the responses.
+            ttl (float): Time to live of a response in seconds.
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str | None,
+        request_prompt: str,
+        output_model: type[BaseModel],
+        audio_uri: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Return the cache key of a structured call.
+
+        Parameters:
+            model (str): Model the call is made against.
+            system_prompt (str | None): System prompt.
+            request_prompt (str): User prompt content.
+            output_model (type[BaseModel]): Pydantic model of the response.
+            audio_uri (str | None): Audio input reference.
+            temperature (float): Sampling temperature.
+            max_tokens (int): Maximum output tokens.
+
+        Returns:
+            str: SHA-256 hex digest over all inputs.
+        """
+        payload = json.dumps(
+            [
+                model,
+                system_prompt,
+                request_prompt,
+                output_model.model_json_schema(),
+                audio_uri,
+                temperature,
+                max_tokens,
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response of a key and count the hit or miss.
+
+        Parameters:
+            key (str): Cache key.
+
+        Returns:
+            str | None: Cached response, or None on a miss.
+        """
+        try:
+            response = self.backend.get(key)
+        except Exception as e:
+            logging.warning(f'LLM response cache lookup failed: {e}')
+            response = None
+        with self._lock:
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        outcome = 'miss' if response is None else 'hit'
+        logging.debug('LLM response cache %s, hit rate %.2f', outcome, self.hit_rate)
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response for a key.
+
+        Parameters:
+            key (str): Cache key.
+            response (str): Raw response text.
+
+        Returns:
+            None: This function writes the response to the backend.
+        """
+        try:
+            self.backend.set(key, response, self.ttl)
+        except Exception as e:
+            logging.warning(f'LLM response cache write failed: {e}')
+
+    async def aget(self, key: str) -> str | None:
+        """Return the cached response of a key without blocking the event loop.
+
+        Parameters:
+            key (str): Cache key.
+
+        Returns:
+            str | None: Cached response, or None on a miss.
+        """
+        if self.backend.blocking:
+            return await asyncio.to_thread(self.get, key)
+        return self.get(key)
+
+    async def aset(self, key: str, response: str) -> None:
+        """Store a response for a key without blocking the event loop.
+
+        Parameters:
+            key (str): Cache key.
+            response (str): Raw response text.
+
+        Returns:
+            None: This function writes the response to the backend.
+        """
+        if self.backend.blocking:
+            await asyncio.to_thread(self.set, key, response)
+        else:
+            self.set(key, response)
+
+    def evict_expired(self) -> int:
+        """Remove expired responses from the backend.
+
+        Returns:
+            int: Number of removed responses.
+        """
+        return self.backend.evict_expired()
+
+    def clear(self) -> None:
+        """Remove all responses and reset the hit and miss counters.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups that were served from the cache.
+
+        Returns:
+            float: Hit rate between 0 and 1.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def create_llm_response_cache() -> LLMResponseCache:
+    """Create the response cache with the configured backend.
+
+    Returns:
+        LLMResponseCache: Cache using the in-memory or Postgres backend.
+    """
+    if settings.LLM_RESPONSE_CACHE_BACKEND == 'postgres':
+        backend: LLMResponseCacheBackend = PostgresLLMResponseCacheBackend()
+    else:
+        backend = InMemoryLLMResponseCacheBackend(maxsize=settings.LLM_RESPONSE_CACHE_MAX_SIZE)
+    return LLMResponseCache(backend, ttl=settings.LLM_RESPONSE_CACHE_TTL_SECONDS)
+
+
+llm_response_cache = create_llm_response_cache()
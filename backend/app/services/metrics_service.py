@@ -0,0 +1,248 @@
+"""Service layer for metrics service."""
+
+from app.connections.vertexai_client import llm_executor
+from app.dependencies.auth import jwt_payload_cache, user_profile_cache
+from app.dependencies.database import async_engine, engine, get_pool_stats
+from app.services.llm_metrics import LATENCY_BUCKETS_S, LLMCallStats, llm_metrics
+from app.services.llm_resilience import circuit_breakers
+from app.services.llm_response_cache import llm_response_cache
+from app.services.prompt_budget import prompt_budget
+
+Sample = tuple[dict[str, str], float]
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape a label value for the Prometheus text format.
+
+    Parameters:
+        value (str): Raw label value.
+
+    Returns:
+        str: Escaped label value.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_sample(name: str, labels: dict[str, str], value: float) -> str:
+    """Format a single sample line.
+
+    Parameters:
+        name (str): Metric name including a histogram suffix.
+        labels (dict[str, str]): Label names and values.
+        value (float): Sample value.
+
+    Returns:
+        str: Sample line.
+    """
+    if labels:
+        formatted = ','.join(f'{key}="{_escape_label_value(val)}"' for key, val in labels.items())
+        name = f'{name}{{{formatted}}}'
+    return f'{name} {value}'
+
+
+def _format_metric(name: str, metric_type: str, help_text: str, samples: list[Sample]) -> list[str]:
+    """Format a counter or gauge with its HELP and TYPE lines.
+
+    Parameters:
+        name (str): Metric name.
+        metric_type (str): 'counter' or 'gauge'.
+        help_text (str): Description of the metric.
+        samples (list[Sample]): Labels and value per sample.
+
+    Returns:
+        list[str]: Lines of the metric.
+    """
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}']
+    lines.extend(_format_sample(name, labels, value) for labels, value in samples)
+    return lines
+
+
+def _format_latency_histogram(call_stats: list[tuple[tuple[str, str], LLMCallStats]]) -> list[str]:
+    """Format the LLM call latency histogram.
+
+    Parameters:
+        call_stats (list[tuple[tuple[str, str], LLMCallStats]]): Statistics per operation
+            and model.
+
+    Returns:
+        list[str]: Lines of the histogram.
+    """
+    name = 'llm_call_duration_seconds'
+    lines = [
+        f'# HELP {name} Latency of LLM calls including waiting for the rate limits.',
+        f'# TYPE {name} histogram',
+    ]
+    for (operation, model), stats in call_stats:
+        labels = {'operation': operation, 'model': model}
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS_S, stats.latency_buckets, strict=True):
+            cumulative += count
+            lines.append(
+                _format_sample(f'{name}_bucket', {**labels, 'le': f'{bound:g}'}, cumulative)
+            )
+        lines.append(_format_sample(f'{name}_bucket', {**labels, 'le': '+Inf'}, stats.calls))
+        lines.append(_format_sample(f'{name}_sum', labels, stats.latency_sum_s))
+        lines.append(_format_sample(f'{name}_count', labels, stats.calls))
+    return lines
+
+
+def render_metrics() -> str:
+    """Render the LLM call, executor, circuit breaker, cache, DB pool and prompt metrics.
+
+    Returns:
+        str: Metrics in the Prometheus text exposition format.
+    """
+    call_stats = sorted(llm_metrics.get_stats().items())
+    executor_metrics = llm_executor.get_metrics()
+    budget_stats = sorted(prompt_budget.get_stats().items())
+    pool_stats = {'sync': get_pool_stats(engine), 'async': get_pool_stats(async_engine.sync_engine)}
+
+    def per_call(attribute: str) -> list[Sample]:
+        return [
+            ({'operation': operation, 'model': model}, getattr(stats, attribute))
+            for (operation, model), stats in call_stats
+        ]
+
+    def per_call_site(attribute: str) -> list[Sample]:
+        return [({'call_site': site}, getattr(stats, attribute)) for site, stats in budget_stats]
+
+    def per_pool(attribute: str) -> list[Sample]:
+        return [({'engine': name}, getattr(stats, attribute)) for name, stats in pool_stats.items()]
+
+    lines = [
+        *_format_metric('llm_calls_total', 'counter', 'LLM calls made.', per_call('calls')),
+        *_format_metric(
+            'llm_call_failures_total', 'counter', 'LLM calls that failed.', per_call('failures')
+        ),
+        *_format_metric(
+            'llm_call_retries_total',
+            'counter',
+            'Retries of LLM operations.',
+            [({'operation': op}, count) for op, count in sorted(llm_metrics.get_retries().items())],
+        ),
+        *_format_metric(
+            'llm_call_cache_hits_total',
+            'counter',
+            'LLM calls served from the response cache.',
+            per_call('cache_hits'),
+        ),
+        *_format_metric(
+            'llm_input_tokens_total',
+            'counter',
+            'Input tokens reported by the provider.',
+            per_call('input_tokens'),
+        ),
+        *_format_metric(
+            'llm_cached_input_tokens_total',
+            'counter',
+            'Input tokens served from cached content.',
+            per_call('cached_input_tokens'),
+        ),
+        *_format_metric(
+            'llm_output_tokens_total',
+            'counter',
+            'Output tokens reported by the provider.',
+            per_call('output_tokens'),
+        ),
+        *_format_latency_histogram(call_stats),
+        *_format_metric(
+            'llm_response_cache_lookups_total',
+            'counter',
+            'Lookups of the LLM response cache.',
+            [
+                ({'result': 'hit'}, llm_response_cache.hits),
+                ({'result': 'miss'}, llm_response_cache.misses),
+            ],
+        ),
+        *_format_metric(
+            'jwt_cache_lookups_total',
+            'counter',
+            'Lookups of the verified JWT payload cache.',
+            [
+                ({'result': 'hit'}, jwt_payload_cache.hits),
+                ({'result': 'miss'}, jwt_payload_cache.misses),
+            ],
+        ),
+        *_format_metric(
+            'user_profile_cache_lookups_total',
+            'counter',
+            'Lookups of the authenticated user profile cache.',
+            [
+                ({'result': 'hit'}, user_profile_cache.hits),
+                ({'result': 'miss'}, user_profile_cache.misses),
+            ],
+        ),
+        *_format_metric(
+            'llm_executor_queued_tasks',
+            'gauge',
+            'Tasks waiting for a thread of the LLM executor.',
+            [({}, executor_metrics.queued)],
+        ),
+        *_format_metric(
+            'llm_executor_running_tasks',
+            'gauge',
+            'Tasks running on the LLM executor.',
+            [({}, executor_metrics.running)],
+        ),
+        *_format_metric(
+            'llm_model_waiting_calls',
+            'gauge',
+            'Calls waiting for a model slot or rate limit token.',
+            [({'model': m}, load.waiting) for m, load in sorted(executor_metrics.models.items())],
+        ),
+        *_format_metric(
+            'llm_model_in_flight_calls',
+            'gauge',
+            'Calls running against a model.',
+            [({'model': m}, load.in_flight) for m, load in sorted(executor_metrics.models.items())],
+        ),
+        *_format_metric(
+            'llm_circuit_open',
+            'gauge',
+            'Whether calls to a model fail fast, 1 while its circuit is open or half open.',
+            [
+                ({'model': model}, int(state != 'closed'))
+                for model, state in sorted(circuit_breakers.get_states().items())
+            ],
+        ),
+        *_format_metric(
+            'db_pool_size', 'gauge', 'Persistent connections of the DB pool.', per_pool('size')
+        ),
+        *_format_metric(
+            'db_pool_checked_out_connections',
+            'gauge',
+            'DB connections currently checked out of the pool.',
+            per_pool('checked_out'),
+        ),
+        *_format_metric(
+            'db_pool_overflow_connections',
+            'gauge',
+            'DB connections currently open beyond the pool size.',
+            per_pool('overflow'),
+        ),
+        *_format_metric(
+            'llm_prompts_total',
+            'counter',
+            'Prompts built within the budget.',
+            per_call_site('calls'),
+        ),
+        *_format_metric(
+            'llm_prompts_trimmed_total',
+            'counter',
+            'Prompts that had to be trimmed to fit the budget.',
+            per_call_site('trimmed_calls'),
+        ),
+        *_format_metric(
+            'llm_prompt_tokens_total',
+            'counter',
+            'Estimated tokens of the built prompts.',
+            per_call_site('prompt_tokens'),
+        ),
+        *_format_metric(
+            'llm_prompt_trimmed_tokens_total',
+            'counter',
+            'Estimated tokens removed from prompts to fit the budget.',
+            per_call_site('trimmed_tokens'),
+        ),
+    ]
+    return '\n'.join(lines) + '\n'
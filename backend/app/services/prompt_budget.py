@@ -0,0 +1,321 @@
+"""Service layer for prompt budget."""
+
+import logging
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Literal
+
+from app.config import settings
+
+# Rough size of a token for the Gemini tokenizers on English and German text
+CHARS_PER_TOKEN = 4
+OMISSION_MARKER = '[... {omitted} lines omitted ...]'
+TRUNCATION_MARKER = '[... truncated ...]'
+
+# Sections with a higher priority are kept longer when a prompt is over budget
+PRIORITY_HISTORY = 0
+PRIORITY_CONTEXT = 1
+PRIORITY_TRANSCRIPT = 2
+
+TrimStrategy = Literal['head', 'tail', 'middle']
+
+
+def count_tokens(*texts: str | None) -> int:
+    """Estimate the number of tokens of texts without calling the model provider.
+
+    Parameters:
+        *texts (str | None): Texts to count, None counts as empty.
+
+    Returns:
+        int: Estimated number of tokens.
+    """
+    return sum(-(-len(text) // CHARS_PER_TOKEN) for text in texts if text)
+
+
+@dataclass
+class PromptSection:
+    """Variable section of a prompt that may be trimmed to fit the budget.
+
+    Parameters:
+        name (str): Name of the section, the keyword argument of the prompt builder.
+        text (str): Content of the section.
+        priority (int): Sections with a lower priority are trimmed first.
+        strategy (TrimStrategy): Which part is kept, the start ('head'), the end ('tail') or
+            both ends ('middle').
+        max_tokens (int | None): Upper bound of the section regardless of the total budget.
+        min_tokens (int): Size the section is never trimmed below for the total budget.
+    """
+
+    name: str
+    text: str
+    priority: int
+    strategy: TrimStrategy
+    max_tokens: int | None = None
+    min_tokens: int = 0
+
+
+@dataclass
+class PromptBudgetStats:
+    """Token statistics of the prompts of one call site.
+
+    Parameters:
+        calls (int): Number of prompts built.
+        trimmed_calls (int): Number of prompts that had to be trimmed.
+        prompt_tokens (int): Estimated tokens of all prompts after trimming.
+        trimmed_tokens (int): Estimated tokens removed by trimming.
+    """
+
+    calls: int = 0
+    trimmed_calls: int = 0
+    prompt_tokens: int = 0
+    trimmed_tokens: int = 0
+
+
+def transcript_section(text: str | None, name: str = 'transcript') -> PromptSection:
+    """Return a transcript section, which keeps its start and end when trimmed.
+
+    Parameters:
+        text (str | None): Transcript.
+        name (str): Keyword argument of the prompt builder.
+
+    Returns:
+        PromptSection: Transcript section.
+    """
+    return PromptSection(name, text or '', PRIORITY_TRANSCRIPT, 'middle')
+
+
+def hr_context_section(text: str, name: str = 'hr_docs_context') -> PromptSection:
+    """Return an HR document context section, which keeps the best ranked excerpts.
+
+    Parameters:
+        text (str): HR document context.
+        name (str): Keyword argument of the prompt builder.
+
+    Returns:
+        PromptSection: HR document context section.
+    """
+    return PromptSection(
+        name, text, PRIORITY_CONTEXT, 'head', max_tokens=settings.PROMPT_HR_CONTEXT_MAX_TOKENS
+    )
+
+
+def history_section(text: str, name: str, strategy: TrimStrategy = 'tail') -> PromptSection:
+    """Return a history section, which keeps the most recent entries.
+
+    Parameters:
+        text (str): History, e.g. previous feedback.
+        name (str): Keyword argument of the prompt builder.
+        strategy (TrimStrategy): 'tail' for oldest-first and 'head' for newest-first history.
+
+    Returns:
+        PromptSection: History section.
+    """
+    return PromptSection(
+        name, text, PRIORITY_HISTORY, strategy, max_tokens=settings.PROMPT_HISTORY_MAX_TOKENS
+    )
+
+
+def _keep_head(lines: list[str], max_chars: int) -> list[str]:
+    """Keep the leading lines that fit into a number of characters.
+
+    Parameters:
+        lines (list[str]): Lines of the text.
+        max_chars (int): Maximum number of characters including line breaks.
+
+    Returns:
+        list[str]: Kept lines, a first line that is too long is cut.
+    """
+    kept: list[str] = []
+    used = 0
+    for line in lines:
+        if used + len(line) + 1 > max_chars:
+            if not kept and max_chars > 0:
+                kept.append(line[:max_chars])
+            break
+        kept.append(line)
+        used += len(line) + 1
+    return kept
+
+
+def _keep_tail(lines: list[str], max_chars: int) -> list[str]:
+    """Keep the trailing lines that fit into a number of characters.
+
+    Parameters:
+        lines (list[str]): Lines of the text.
+        max_chars (int): Maximum number of characters including line breaks.
+
+    Returns:
+        list[str]: Kept lines, a last line that is too long is cut.
+    """
+    kept = _keep_head([line[::-1] for line in reversed(lines)], max_chars)
+    return [line[::-1] for line in reversed(kept)]
+
+
+def trim_text(text: str, max_tokens: int, strategy: TrimStrategy) -> str:
+    """Trim a text to a number of tokens at line boundaries.
+
+    Parameters:
+        text (str): Text to trim.
+        max_tokens (int): Maximum number of tokens of the result.
+        strategy (TrimStrategy): Which part of the text is kept.
+
+    Returns:
+        str: The text itself if it fits, else the kept lines with a marker where text was
+            left out.
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+    lines = text.splitlines()
+    marker_chars = max(len(OMISSION_MARKER.format(omitted=len(lines))), len(TRUNCATION_MARKER))
+    max_chars = max_tokens * CHARS_PER_TOKEN - marker_chars - 1
+    if max_chars <= 0:
+        return ''
+
+    if strategy == 'head':
+        head, tail = _keep_head(lines, max_chars), []
+    elif strategy == 'tail':
+        head, tail = [], _keep_tail(lines, max_chars)
+    else:
+        head = _keep_head(lines, max_chars // 2)
+        tail = _keep_tail(lines[len(head) :], max_chars - sum(len(line) + 1 for line in head))
+    omitted = len(lines) - len(head) - len(tail)
+    # Without omitted lines, a single line was too long and was cut
+    marker = OMISSION_MARKER.format(omitted=omitted) if omitted else TRUNCATION_MARKER
+    return '\n'.join([*head, marker, *tail])
+
+
+class PromptBudget:
+    """Keeps prompts below a token budget by trimming their variable sections.
+
+    Every section is first trimmed to its own upper bound. If the prompt is still over
+    budget, sections are trimmed in order of increasing priority, each down to its lower
+    bound, until the prompt fits. Token statistics are recorded per call site.
+    """
+
+    def __init__(self, max_tokens: int) -> None:
+        """Initialize the budget.
+
+        Parameters:
+            max_tokens (int): Maximum estimated tokens of the system and user prompt.
+        """
+        self.max_tokens = max_tokens
+        self._stats: dict[str, PromptBudgetStats] = {}
+        self._lock = threading.Lock()
+
+    def fit(
+        self, call_site: str, sections: list[PromptSection], reserved_tokens: int = 0
+    ) -> dict[str, str]:
+        """Trim prompt sections to fit the budget.
+
+        Parameters:
+            call_site (str): Name of the calling prompt builder for the statistics.
+            sections (list[PromptSection]): Variable sections of the prompt.
+            reserved_tokens (int): Tokens of the fixed parts of the prompt.
+
+        Returns:
+            dict[str, str]: Possibly trimmed text per section name.
+        """
+        texts = {section.name: section.text for section in sections}
+        tokens = {section.name: count_tokens(section.text) for section in sections}
+        original_tokens = sum(tokens.values())
+
+        for section in sections:
+            if section.max_tokens is not None and tokens[section.name] > section.max_tokens:
+                texts[section.name] = trim_text(section.text, section.max_tokens, section.strategy)
+                tokens[section.name] = count_tokens(texts[section.name])
+
+        overflow = reserved_tokens + sum(tokens.values()) - self.max_tokens
+        for section in sorted(sections, key=lambda s: s.priority):
+            if overflow <= 0:
+                break
+            target = max(section.min_tokens, tokens[section.name] - overflow)
+            if target >= tokens[section.name]:
+                continue
+            texts[section.name] = trim_text(texts[section.name], target, section.strategy)
+            trimmed = count_tokens(texts[section.name])
+            overflow -= tokens[section.name] - trimmed
+            tokens[section.name] = trimmed
+
+        self._record(call_site, reserved_tokens, original_tokens, tokens)
+        return texts
+
+    def build(
+        self,
+        call_site: str,
+        build_prompt: Callable[..., str],
+        sections: list[PromptSection],
+        system_prompt: str | None = None,
+    ) -> str:
+        """Build a prompt whose variable sections are trimmed to fit the budget.
+
+        Parameters:
+            call_site (str): Name of the calling prompt builder for the statistics.
+            build_prompt (Callable[..., str]): Prompt builder taking the sections as keyword
+                arguments.
+            sections (list[PromptSection]): Variable sections of the prompt.
+            system_prompt (str | None): System prompt sent along, counted as fixed part.
+
+        Returns:
+            str: Built prompt.
+        """
+        fixed_prompt = build_prompt(**{section.name: '' for section in sections})
+        texts = self.fit(call_site, sections, count_tokens(system_prompt, fixed_prompt))
+        return build_prompt(**texts)
+
+    def _record(
+        self,
+        call_site: str,
+        reserved_tokens: int,
+        original_tokens: int,
+        tokens: dict[str, int],
+    ) -> None:
+        """Record the token statistics of a prompt.
+
+        Parameters:
+            call_site (str): Name of the calling prompt builder.
+            reserved_tokens (int): Tokens of the fixed parts of the prompt.
+            original_tokens (int): Tokens of the sections before trimming.
+            tokens (dict[str, int]): Tokens per section after trimming.
+
+        Returns:
+            None: This function mutates the statistics in-place.
+        """
+        trimmed_tokens = original_tokens - sum(tokens.values())
+        prompt_tokens = reserved_tokens + sum(tokens.values())
+        with self._lock:
+            stats = self._stats.setdefault(call_site, PromptBudgetStats())
+            stats.calls += 1
+            stats.prompt_tokens += prompt_tokens
+            if trimmed_tokens > 0:
+                stats.trimmed_calls += 1
+                stats.trimmed_tokens += trimmed_tokens
+        logging.debug('Prompt of %s: %d tokens, sections %s', call_site, prompt_tokens, tokens)
+        if trimmed_tokens > 0:
+            logging.info(
+                'Prompt of %s trimmed by %d tokens to fit %d tokens',
+                call_site,
+                trimmed_tokens,
+                self.max_tokens,
+            )
+
+    def get_stats(self) -> dict[str, PromptBudgetStats]:
+        """Return a snapshot of the token statistics per call site.
+
+        Returns:
+            dict[str, PromptBudgetStats]: Statistics per call site.
+        """
+        with self._lock:
+            return {call_site: replace(stats) for call_site, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Drop all recorded statistics.
+
+        Returns:
+            None: This function mutates the statistics in-place.
+        """
+        with self._lock:
+            self._stats.clear()
+
+
+prompt_budget = PromptBudget(max_tokens=settings.PROMPT_MAX_TOKENS)
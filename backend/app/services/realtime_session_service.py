@@ -6,10 +6,12 @@ import os
 
 import httpx
 from fastapi import HTTPException, status
-from sqlmodel import Session as DBSession
-from sqlmodel import select
+from sqlalchemy import update
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession as AsyncDBSession
 
 from app.config import settings
+from app.dependencies.auth import user_profile_cache
 from app.enums.language import LANGUAGE_NAME
 from app.models.conversation_category import ConversationCategory
 from app.models.conversation_scenario import ConversationScenario
@@ -22,11 +24,11 @@ MODEL = 'gpt-realtime-mini-2025-12-15' if settings.FORCE_CHEAP_MODEL else 'gpt-r
 class RealtimeSessionService:
     """Service for creating OpenAI realtime sessions."""
 
-    def __init__(self, db: DBSession) -> None:
-        """Initialize the service with a database session.
+    def __init__(self, db: AsyncDBSession) -> None:
+        """Initialize the service with an async database session.
 
         Parameters:
-            db (DBSession): Database session used for queries and updates.
+            db (AsyncDBSession): Async database session used for queries and updates.
         """
         self.db = db
 
@@ -113,25 +115,26 @@ class RealtimeSessionService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail='OPENAI_API_KEY not set'
             )
 
-        conversation_scenario = self.db.exec(
-            select(ConversationScenario).where(ConversationScenario.id == session.scenario_id)
+        row = (
+            await self.db.exec(
+                select(ConversationScenario, ConversationCategory)
+                .outerjoin(
+                    ConversationCategory,
+                    col(ConversationScenario.category_id) == ConversationCategory.id,
+                )
+                .where(ConversationScenario.id == session.scenario_id)
+            )
         ).first()
-        if not conversation_scenario:
+        if not row:
             raise HTTPException(
                 status_code=404, detail='No conversation scenario found for this session'
             )
 
-        conversation_category = None
-        if conversation_scenario.category_id:
-            conversation_category = self.db.exec(
-                select(ConversationCategory).where(
-                    ConversationCategory.id == conversation_scenario.category_id
-                )
-            ).first()
-            if not conversation_category:
-                raise HTTPException(
-                    status_code=404, detail='No conversation category found for this scenario'
-                )
+        conversation_scenario, conversation_category = row
+        if conversation_scenario.category_id and not conversation_category:
+            raise HTTPException(
+                status_code=404, detail='No conversation category found for this scenario'
+            )
 
         if conversation_category:
             conversation_category_name = conversation_category.id
@@ -246,9 +249,13 @@ class RealtimeSessionService:
             except httpx.HTTPStatusError as e:
                 raise HTTPException(status_code=response.status_code, detail=str(e)) from e
 
-            user_profile.sessions_created_today += 1
-            self.db.add(user_profile)
-            self.db.commit()
+            await self.db.exec(
+                update(UserProfile)
+                .where(col(UserProfile.id) == user_profile.id)
+                .values(sessions_created_today=UserProfile.sessions_created_today + 1)
+            )
+            await self.db.commit()
+            user_profile_cache.pop(user_profile.id)
 
             data = response.json()
             data['persona_name'] = conversation_scenario.persona_name
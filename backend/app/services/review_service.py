@@ -1,13 +1,14 @@
 """Service layer for review service."""
 
 from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy import case, func
 from sqlalchemy import select as sqlalchemy_select
 from sqlmodel import Session as DBSession
-from sqlmodel import asc, desc, select
+from sqlmodel import asc, col, desc, select, tuple_
 
 from app.enums.account_role import AccountRole
 from app.models.conversation_scenario import ConversationScenario
@@ -21,6 +22,10 @@ from app.schemas.review import (
     ReviewRead,
     ReviewStatistics,
 )
+from app.services.utils import decode_cursor, encode_cursor
+
+# Sort orders that support keyset pagination on (created_at, id)
+CURSOR_SORTS = ('newest', 'oldest')
 
 
 class ReviewService:
@@ -39,6 +44,7 @@ class ReviewService:
         sort: str = 'newest',
         limit: int | None = None,
         offset: int | None = None,
+        after: tuple[datetime, UUID] | None = None,
     ) -> Sequence[tuple[Review, UserProfile]]:
         """Query reviews joined with user profiles.
 
@@ -46,26 +52,39 @@ class ReviewService:
             sort (str): Sorting strategy (newest, oldest, highest, lowest).
             limit (int | None): Max number of records to return.
             offset (int | None): Offset for pagination.
+            after (tuple[datetime, UUID] | None): Keyset position of the last seen review,
+                only supported for the date based sorts.
 
         Returns:
             Sequence[tuple[Review, UserProfile]]: Joined review and user rows.
         """
         sort_mapping = {
-            'newest': desc(Review.created_at),
-            'oldest': asc(Review.created_at),
-            'highest': desc(Review.rating),
-            'lowest': asc(Review.rating),
+            'newest': (desc(Review.created_at), desc(Review.id)),
+            'oldest': (asc(Review.created_at), asc(Review.id)),
+            'highest': (desc(Review.rating),),
+            'lowest': (asc(Review.rating),),
         }
 
-        order_by = sort_mapping.get(sort, desc(Review.created_at))
+        order_by = sort_mapping.get(sort, sort_mapping['newest'])
 
         stmt = (
             select(Review, UserProfile)
             .select_from(Review)
             .join(UserProfile, Review.user_id == UserProfile.id)  # type: ignore
-            .order_by(order_by)
+            .order_by(*order_by)
         )
 
+        if after:
+            created_at, review_id = after
+            if sort == 'oldest':
+                stmt = stmt.where(
+                    tuple_(col(Review.created_at), col(Review.id)) > tuple_(created_at, review_id)
+                )
+            else:
+                stmt = stmt.where(
+                    tuple_(col(Review.created_at), col(Review.id)) < tuple_(created_at, review_id)
+                )
+
         if offset:
             stmt = stmt.offset(offset)
         if limit:
@@ -134,20 +153,37 @@ class ReviewService:
         page: int | None = None,
         page_size: int = 10,
         sort: str = 'newest',
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> PaginatedReviewRead:
         """Retrieve paginated reviews with optional sorting.
 
         Parameters:
-            page (int | None): Page number (1-based).
+            page (int | None): Page number (1-based), ignored when a cursor is given.
             page_size (int): Number of items per page.
             sort (str): Sorting strategy (newest, oldest, highest, lowest).
+            cursor (str | None): Cursor token (nextCursor) of the previous page.
+            include_total (bool): Whether to count all reviews for the totals.
 
         Returns:
             PaginatedReviewRead: Paginated reviews and statistics.
+
+        Raises:
+            HTTPException: If the cursor is invalid or used with a rating sort.
         """
+        after = None
+        if cursor:
+            if sort not in CURSOR_SORTS:
+                raise HTTPException(
+                    status_code=400,
+                    detail='Cursor pagination is only supported for newest and oldest sorting',
+                )
+            after = decode_cursor(cursor)
 
         # Pagination
-        total_count = self.db.exec(select(func.count()).select_from(Review)).one()
+        total_count = (
+            self.db.exec(select(func.count()).select_from(Review)).one() if include_total else None
+        )
         if total_count == 0:
             return PaginatedReviewRead(
                 reviews=[],
@@ -156,6 +192,7 @@ class ReviewService:
                     'totalPages': 0,
                     'totalCount': 0,
                     'pageSize': page_size,
+                    'nextCursor': None,
                 },
                 rating_statistics=ReviewStatistics(
                     average=0.0,
@@ -167,12 +204,21 @@ class ReviewService:
                 ),
             )
 
-        total_pages = (total_count + page_size - 1) // page_size
-        offset = (page - 1) * page_size if page else 0
+        total_pages = (
+            (total_count + page_size - 1) // page_size if total_count is not None else None
+        )
+        offset = (page - 1) * page_size if page and not after else 0
 
+        # One extra row tells whether another page follows
         joined_reviews_users = self._query_reviews_with_users(
-            sort=sort, limit=page_size, offset=offset
+            sort=sort, limit=page_size + 1, offset=offset, after=after
         )
+        next_cursor = None
+        if len(joined_reviews_users) > page_size:
+            joined_reviews_users = joined_reviews_users[:page_size]
+            if sort in CURSOR_SORTS:
+                last_review = joined_reviews_users[-1][0]
+                next_cursor = encode_cursor(last_review.created_at, last_review.id)
         review_list = self._build_review_read_list(joined_reviews_users)
 
         review_statistics = self._get_review_statistics()
@@ -184,6 +230,7 @@ class ReviewService:
                 'totalPages': total_pages,
                 'totalCount': total_count,
                 'pageSize': page_size,
+                'nextCursor': next_cursor,
             },
             rating_statistics=review_statistics,
         )
@@ -193,18 +240,22 @@ class ReviewService:
         page: int | None = None,
         page_size: int = 8,
         sort: str = 'newest',
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> PaginatedReviewRead:
         """Retrieve user reviews with pagination, sorting and statistics.
 
         Parameters:
-            page (int | None): Page number (1-based).
+            page (int | None): Page number (1-based), ignored when a cursor is given.
             page_size (int): Number of items per page.
             sort (str): Sorting strategy (newest, oldest, highest, lowest).
+            cursor (str | None): Cursor token (nextCursor) of the previous page.
+            include_total (bool): Whether to count all reviews for the totals.
 
         Returns:
             PaginatedReviewRead: Paginated reviews and statistics.
         """
-        return self._get_paginated_reviews(page, page_size, sort)
+        return self._get_paginated_reviews(page, page_size, sort, cursor, include_total)
 
     def has_user_reviewed_session(self, session_id: UUID, user_id: UUID) -> bool:
         """Check if the current user has already submitted a review for this session.
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-import concurrent.futures
+import hashlib
 import json
+import logging
 import os
 from collections.abc import Callable, Generator
-from contextlib import suppress
-from functools import lru_cache
+from functools import lru_cache, partial
 from uuid import UUID
 
 from sqlmodel import Session as DBSession
+from sqlmodel import col, select
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from app.connections.vertexai_client import call_structured_llm
+from app.config import settings
+from app.connections.vertexai_client import call_structured_llm, llm_executor
+from app.dependencies.database import db_session_scope, log_pool_occupancy
 from app.enums.language import LANGUAGE_NAME, LanguageCode
 from app.enums.scenario_preparation_status import ScenarioPreparationStatus
 from app.models.scenario_preparation import ScenarioPreparation
@@ -27,6 +30,9 @@ from app.schemas.scenario_preparation import (
     ScenarioPreparationCreate,
     StringListRead,
 )
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_resilience import deadline_scope, stop_at_deadline, time_until
+from app.services.prompt_budget import count_tokens, hr_context_section, prompt_budget
 from app.services.vector_db_context_service import get_hr_docs_context
 
 
@@ -47,7 +53,11 @@ CONFIG_PATH = os.path.join('app', 'config', 'scenario_prep_config.json')
 config = load_scenario_prep_config()
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('prep_objectives'),
+)
 def safe_generate_objectives(request: ObjectivesCreate, hr_docs_context: str = '') -> list[str]:
     """Retry-safe wrapper for objective generation.
 
@@ -61,7 +71,11 @@ def safe_generate_objectives(request: ObjectivesCreate, hr_docs_context: str = '
     return generate_objectives(request, hr_docs_context)
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('prep_checklist'),
+)
 def safe_generate_checklist(request: ChecklistCreate, hr_docs_context: str = '') -> list[str]:
     """Retry-safe wrapper for checklist generation.
 
@@ -75,7 +89,11 @@ def safe_generate_checklist(request: ChecklistCreate, hr_docs_context: str = '')
     return generate_checklist(request, hr_docs_context)
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('prep_key_concepts'),
+)
 def safe_generate_key_concepts(
     request: KeyConceptsCreate, hr_docs_context: str = ''
 ) -> list[KeyConcept]:
@@ -109,6 +127,14 @@ def generate_objectives(request: ObjectivesCreate, hr_docs_context: str = '') ->
     system_prompt = settings.system_prompts.objectives
 
     example_items = '\n'.join(mock_response.items)
+    # The rest of the prompt is short, only the HR document context can grow large
+    hr_docs_context = prompt_budget.fit(
+        'preparation.objectives',
+        [hr_context_section(hr_docs_context)],
+        reserved_tokens=count_tokens(
+            system_prompt, request.persona, request.situational_facts, example_items
+        ),
+    )['hr_docs_context']
 
     lang_name = LANGUAGE_NAME.get(lang, 'English')
     user_prompt = (
@@ -135,6 +161,7 @@ def generate_objectives(request: ObjectivesCreate, hr_docs_context: str = '') ->
         request_prompt=user_prompt,
         system_prompt=system_prompt,
         output_model=StringListRead,
+        operation='prep_objectives',
         mock_response=mock_response,
     )
     return result.items
@@ -157,6 +184,14 @@ def generate_checklist(request: ChecklistCreate, hr_docs_context: str = '') -> l
     system_prompt = settings.system_prompts.checklist
 
     example_items = '\n'.join(mock_response.items)
+    # The rest of the prompt is short, only the HR document context can grow large
+    hr_docs_context = prompt_budget.fit(
+        'preparation.checklist',
+        [hr_context_section(hr_docs_context)],
+        reserved_tokens=count_tokens(
+            system_prompt, request.persona, request.situational_facts, example_items
+        ),
+    )['hr_docs_context']
 
     lang_name = LANGUAGE_NAME.get(lang, 'English')
     user_prompt = (
@@ -181,6 +216,7 @@ def generate_checklist(request: ChecklistCreate, hr_docs_context: str = '') -> l
         request_prompt=user_prompt,
         system_prompt=system_prompt,
         output_model=StringListRead,
+        operation='prep_checklist',
         mock_response=mock_response,
     )
     return result.items
@@ -265,25 +301,66 @@ def generate_key_concept(request: KeyConceptsCreate, hr_docs_context: str = '')
     system_prompt = settings.system_prompts.key_concepts
 
     lang_name = LANGUAGE_NAME.get(lang, 'English')
-    prompt = build_key_concept_prompt(
-        request, mock_response.model_dump_json(indent=4), hr_docs_context, lang_name
+    prompt = prompt_budget.build(
+        'preparation.key_concepts',
+        partial(
+            build_key_concept_prompt,
+            request,
+            mock_response.model_dump_json(indent=4),
+            language_name=lang_name,
+        ),
+        [hr_context_section(hr_docs_context)],
+        system_prompt=system_prompt,
     )
 
     result = call_structured_llm(
         request_prompt=prompt,
         system_prompt=system_prompt,
         output_model=KeyConceptsRead,
+        operation='prep_key_concepts',
         mock_response=mock_response,
     )
     return result.items
 
 
-def create_pending_preparation(scenario_id: UUID, db_session: DBSession) -> ScenarioPreparation:
+def compute_preparation_content_hash(request: ScenarioPreparationCreate) -> str:
+    """Return a hash over the normalized inputs of a preparation.
+
+    Text fields are compared case-insensitively with collapsed whitespace, so scenarios
+    that only differ in formatting share a hash.
+
+    Parameters:
+        request (ScenarioPreparationCreate): Preparation request payload.
+
+    Returns:
+        str: SHA-256 hex digest of the normalized inputs.
+    """
+
+    def normalize(text: str) -> str:
+        return ' '.join(text.split()).casefold()
+
+    payload = json.dumps(
+        [
+            normalize(request.category),
+            normalize(request.persona),
+            normalize(request.situational_facts),
+            request.language_code.value,
+            request.num_objectives,
+            request.num_checkpoints,
+        ]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def create_pending_preparation(
+    scenario_id: UUID, db_session: DBSession, content_hash: str | None = None
+) -> ScenarioPreparation:
     """Create a new ScenarioPreparation record with status 'pending'.
 
     Parameters:
         scenario_id (UUID): Scenario identifier.
         db_session (DBSession): Database session for persistence.
+        content_hash (str | None): Hash of the preparation inputs, if reuse is enabled.
 
     Returns:
         ScenarioPreparation: Newly created preparation record.
@@ -294,6 +371,57 @@ def create_pending_preparation(scenario_id: UUID, db_session: DBSession) -> Scen
         objectives=[],
         key_concepts=[],
         prep_checklist=[],
+        content_hash=content_hash,
+    )
+    db_session.add(prep)
+    db_session.commit()
+    return prep
+
+
+def find_reusable_preparation(
+    content_hash: str, db_session: DBSession
+) -> ScenarioPreparation | None:
+    """Return the latest completed preparation generated from the same inputs.
+
+    Parameters:
+        content_hash (str): Hash of the preparation inputs.
+        db_session (DBSession): Database session for the lookup.
+
+    Returns:
+        ScenarioPreparation | None: Completed preparation, or None if there is none.
+    """
+    return db_session.exec(
+        select(ScenarioPreparation)
+        .where(
+            ScenarioPreparation.content_hash == content_hash,
+            ScenarioPreparation.status == ScenarioPreparationStatus.completed,
+        )
+        .order_by(col(ScenarioPreparation.created_at).desc())
+        .limit(1)
+    ).first()
+
+
+def clone_preparation(
+    source: ScenarioPreparation, scenario_id: UUID, db_session: DBSession
+) -> ScenarioPreparation:
+    """Create a completed preparation for a scenario from an existing preparation.
+
+    Parameters:
+        source (ScenarioPreparation): Completed preparation to copy.
+        scenario_id (UUID): Scenario the copy belongs to.
+        db_session (DBSession): Database session for persistence.
+
+    Returns:
+        ScenarioPreparation: Newly created preparation record.
+    """
+    prep = ScenarioPreparation(
+        scenario_id=scenario_id,
+        status=ScenarioPreparationStatus.completed,
+        objectives=list(source.objectives),
+        documents=[dict(document) for document in source.documents],
+        key_concepts=[dict(key_concept) for key_concept in source.key_concepts],
+        prep_checklist=list(source.prep_checklist),
+        content_hash=source.content_hash,
     )
     db_session.add(prep)
     db_session.commit()
@@ -320,11 +448,8 @@ def generate_scenario_preparation(
         ValueError: If preparation is missing or not in pending state.
     """
 
-    session_gen = session_generator_func()
-
-    try:
-        db_session = next(session_gen)
-        # 1. retrieve the preparation record
+    # 1. validate the preparation record in a short read phase
+    with db_session_scope(session_generator_func) as db_session:
         preparation = db_session.get(ScenarioPreparation, preparation_id)
 
         if not preparation:
@@ -332,68 +457,84 @@ def generate_scenario_preparation(
         if preparation.status != ScenarioPreparationStatus.pending:
             raise ValueError(f'Scenario preparation {preparation_id} is not in pending status.')
 
-        # 2. build request objects
-        objectives_request = ObjectivesCreate(
-            category=new_preparation.category,
-            persona=new_preparation.persona,
-            situational_facts=new_preparation.situational_facts,
-            num_objectives=new_preparation.num_objectives,
-            language_code=new_preparation.language_code,
+    # 2. build request objects
+    objectives_request = ObjectivesCreate(
+        category=new_preparation.category,
+        persona=new_preparation.persona,
+        situational_facts=new_preparation.situational_facts,
+        num_objectives=new_preparation.num_objectives,
+        language_code=new_preparation.language_code,
+    )
+    checklist_request = ChecklistCreate(
+        category=new_preparation.category,
+        persona=new_preparation.persona,
+        situational_facts=new_preparation.situational_facts,
+        num_checkpoints=new_preparation.num_checkpoints,
+        language_code=new_preparation.language_code,
+    )
+    key_concept_request = KeyConceptsCreate(
+        category=new_preparation.category,
+        persona=new_preparation.persona,
+        situational_facts=new_preparation.situational_facts,
+        language_code=new_preparation.language_code,
+    )
+
+    # hr_docs_context is used for LLM prompt; doc_names is available for future use
+    hr_docs_context, _, documents = get_hr_docs_context(
+        persona=new_preparation.persona,
+        situational_facts=new_preparation.situational_facts,
+        category=new_preparation.category,
+    )
+
+    # 3. run the LLM calls without holding a database connection
+    log_pool_occupancy('scenario preparation generation')
+    has_error = False
+    objectives: list[str] = []
+    prep_checklist: list[str] = []
+    key_concepts: list[dict] = []
+
+    # The LLM tasks inherit the deadline, which bounds their calls and retries
+    with deadline_scope(settings.SCENARIO_PREPARATION_DEADLINE_SECONDS) as deadline:
+        future_key_concepts = llm_executor.submit(
+            safe_generate_key_concepts, key_concept_request, hr_docs_context
         )
-        checklist_request = ChecklistCreate(
-            category=new_preparation.category,
-            persona=new_preparation.persona,
-            situational_facts=new_preparation.situational_facts,
-            num_checkpoints=new_preparation.num_checkpoints,
-            language_code=new_preparation.language_code,
+        future_objectives = llm_executor.submit(
+            safe_generate_objectives, objectives_request, hr_docs_context
         )
-        key_concept_request = KeyConceptsCreate(
-            category=new_preparation.category,
-            persona=new_preparation.persona,
-            situational_facts=new_preparation.situational_facts,
-            language_code=new_preparation.language_code,
+        future_checklist = llm_executor.submit(
+            safe_generate_checklist, checklist_request, hr_docs_context
         )
 
-        # hr_docs_context is used for LLM prompt; doc_names is available for future use
-        hr_docs_context, _, documents = get_hr_docs_context(
-            persona=new_preparation.persona,
-            situational_facts=new_preparation.situational_facts,
-            category=new_preparation.category,
-        )
+    try:
+        objectives = future_objectives.result(timeout=time_until(deadline))
+    except Exception as e:
+        has_error = True
+        logging.error('Failed to generate objectives: %s', e)
 
-        has_error = False
-        preparation.documents = documents
+    try:
+        prep_checklist = future_checklist.result(timeout=time_until(deadline))
+    except Exception as e:
+        has_error = True
+        logging.error('Failed to generate checklist: %s', e)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_key_concepts = executor.submit(
-                safe_generate_key_concepts, key_concept_request, hr_docs_context
-            )
-            future_objectives = executor.submit(
-                safe_generate_objectives, objectives_request, hr_docs_context
-            )
-            future_checklist = executor.submit(
-                safe_generate_checklist, checklist_request, hr_docs_context
-            )
-
-            try:
-                preparation.objectives = future_objectives.result()
-            except Exception as e:
-                has_error = True
-                print('[ERROR] Failed to generate objectives:', e)
-
-            try:
-                preparation.prep_checklist = future_checklist.result()
-            except Exception as e:
-                has_error = True
-                print('[ERROR] Failed to generate checklist:', e)
-
-            try:
-                key_concepts = future_key_concepts.result()
-                preparation.key_concepts = [ex.model_dump() for ex in key_concepts]
-            except Exception as e:
-                has_error = True
-                print('[ERROR] Failed to generate key concepts:', e)
+    try:
+        key_concepts = [
+            ex.model_dump() for ex in future_key_concepts.result(timeout=time_until(deadline))
+        ]
+    except Exception as e:
+        has_error = True
+        logging.error('Failed to generate key concepts: %s', e)
+
+    # 4. persist the results in a short write phase
+    with db_session_scope(session_generator_func) as db_session:
+        preparation = db_session.get(ScenarioPreparation, preparation_id)
+        if not preparation:
+            raise ValueError(f'Scenario preparation with ID {preparation_id} not found.')
 
+        preparation.documents = documents
+        preparation.objectives = objectives
+        preparation.prep_checklist = prep_checklist
+        preparation.key_concepts = key_concepts
         if has_error:
             preparation.status = ScenarioPreparationStatus.failed
         else:
@@ -404,10 +545,6 @@ def generate_scenario_preparation(
         db_session.refresh(preparation)
         return preparation
 
-    finally:
-        with suppress(StopIteration):
-            next(session_gen)
-
 
 if __name__ == '__main__':
     # Example usage
@@ -7,9 +7,12 @@ from typing import Any
 
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from app.connections.vertexai_client import call_structured_llm
+from app.connections.vertexai_client import call_structured_llm, vertex_context_cache
 from app.schemas.conversation_scenario import ConversationScenarioRead
 from app.schemas.scoring_schema import ScoringRead
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_resilience import stop_at_deadline
+from app.services.prompt_budget import count_tokens, prompt_budget, transcript_section
 from app.services.utils import normalize_quotes
 
 
@@ -25,6 +28,9 @@ class ScoringService:
         if rubric_path is None:
             rubric_path = Path(__file__).parent.parent / 'data' / 'conversation_rubric.json'
         self.rubric = self._load_json(rubric_path)
+        # The rubric is static, so the system prompt is built and cached once
+        self.system_prompt = self._build_system_prompt()
+        vertex_context_cache.register(self.system_prompt)
 
     def _load_json(self, path: Path) -> dict[str, Any]:
         """Load a JSON file from disk.
@@ -71,23 +77,26 @@ class ScoringService:
             str: User prompt content.
         """
         scenario = conversation.scenario
-        transcript = conversation.transcript
-        prompt = (
+        header = (
             '**Conversation Scenario:**\n'
             f'{getattr(scenario, "description", getattr(scenario, "context", ""))}\n'
             f'User Role: {getattr(scenario, "user_role", "User")}\n'
             f'Assistant Role: {getattr(scenario, "assistant_role", "Assistant")}\n\n'
             '**Conversation Transcript:**\n'
         )
-        for turn in transcript:
-            prompt += f'{turn.speaker}: {turn.text}\n'
-        prompt += (
+        footer = (
             'Based on the evaluation rubric, please provide a score from 1 to 5 for each metric '
             '(structure, empathy, focus, clarity) for the "User" only, and give a brief justification for each score.\n'
             "If the User's performance mostly meets the criteria for a high score, even with minor lapses, you should give a high score.\n"
             'Format the output as a JSON object matching the ScoringRead schema. Do not include markdown, explanation, or code formatting.\n'
         )
-        return prompt
+        transcript = '\n'.join(f'{turn.speaker}: {turn.text}' for turn in conversation.transcript)
+        fitted = prompt_budget.fit(
+            'scoring',
+            [transcript_section(transcript)],
+            reserved_tokens=count_tokens(self.system_prompt, header, footer),
+        )
+        return f'{header}{fitted["transcript"]}\n{footer}'
 
     def score_conversation(
         self,
@@ -106,14 +115,15 @@ class ScoringService:
             ScoringRead: Structured scoring output.
         """
         user_prompt = self._build_user_prompt(conversation)
-        system_prompt = self._build_system_prompt()
 
         response = call_structured_llm(
             request_prompt=user_prompt,
-            system_prompt=system_prompt,
+            system_prompt=self.system_prompt,
             output_model=ScoringRead,
+            operation='scoring',
             temperature=temperature,
             audio_uri=audio_uri,
+            cache=temperature == 0.0,
         )
 
         # Recalculate the overall score based on the rubric
@@ -153,7 +163,11 @@ class ScoringService:
                 md += f'- **Score {score}**: {desc}\n'
         return md
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+    @retry(
+        stop=stop_after_attempt(3) | stop_at_deadline,
+        wait=wait_fixed(1),
+        before_sleep=llm_metrics.retry_callback('scoring'),
+    )
     def safe_score_conversation(self, conversation: ConversationScenarioRead) -> ScoringRead:
         """Retry scoring for transient failures.
 
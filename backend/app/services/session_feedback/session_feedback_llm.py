@@ -2,21 +2,34 @@
 
 import json
 import os
-from functools import lru_cache
+from functools import lru_cache, partial
 
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from app.connections.vertexai_client import call_structured_llm
+from app.connections.vertexai_client import call_structured_llm, vertex_context_cache
 from app.enums.language import LANGUAGE_NAME, LanguageCode
 from app.schemas.session_feedback import (
     FeedbackCreate,
+    FusedFeedbackRead,
     GoalsAchievedCreate,
     GoalsAchievedRead,
     RecommendationsRead,
     SessionExamplesRead,
 )
-from app.schemas.session_feedback_config import SessionFeedbackConfigRead
+from app.schemas.session_feedback_config import (
+    SessionFeedbackConfigRead,
+    SessionFeedbackSystemPromptSet,
+)
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_resilience import stop_at_deadline
+from app.services.prompt_budget import hr_context_section, prompt_budget, transcript_section
 from app.services.session_feedback.session_feedback_prompt_templates import (
+    FUSED_FEEDBACK_INSTRUCTIONS,
+    GOALS_ACHIEVED_INSTRUCTIONS,
+    RECOMMENDATIONS_INSTRUCTIONS,
+    TRAINING_EXAMPLES_INSTRUCTIONS,
+    build_feedback_system_prompt,
+    build_fused_feedback_prompt,
     build_goals_achieved_prompt,
     build_recommendations_prompt,
     build_training_examples_prompt,
@@ -41,7 +54,84 @@ CONFIG_PATH = os.path.join('app', 'config', 'session_feedback_config.json')
 config = load_session_feedback_config()
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+def build_system_prompts(
+    feedback_config: SessionFeedbackConfigRead,
+) -> dict[LanguageCode, SessionFeedbackSystemPromptSet]:
+    """Build the static system prompts of every language and register them for caching.
+
+    Parameters:
+        feedback_config (SessionFeedbackConfigRead): Session feedback configuration.
+
+    Returns:
+        dict[LanguageCode, SessionFeedbackSystemPromptSet]: System prompts including the
+            static task instructions, per language.
+    """
+    system_prompts = {}
+    for lang, lang_settings in feedback_config.root.items():
+        base = lang_settings.system_prompts
+        prompt_set = SessionFeedbackSystemPromptSet(
+            session_examples=build_feedback_system_prompt(
+                base.session_examples, TRAINING_EXAMPLES_INSTRUCTIONS
+            ),
+            goals_achieved=build_feedback_system_prompt(
+                base.goals_achieved, GOALS_ACHIEVED_INSTRUCTIONS
+            ),
+            recommendations=build_feedback_system_prompt(
+                base.recommendations, RECOMMENDATIONS_INSTRUCTIONS
+            ),
+            fused_feedback=build_feedback_system_prompt(
+                base.fused_feedback, FUSED_FEEDBACK_INSTRUCTIONS
+            ),
+        )
+        for system_prompt in prompt_set.model_dump().values():
+            vertex_context_cache.register(system_prompt)
+        system_prompts[lang] = prompt_set
+    return system_prompts
+
+
+system_prompts = build_system_prompts(config)
+
+
+def has_user_statements(transcript: str | None) -> bool:
+    """Check whether a transcript contains anything said by the user.
+
+    Parameters:
+        transcript (str | None): Session transcript.
+
+    Returns:
+        bool: True if at least one non-empty line is not an assistant line.
+    """
+    if not transcript:
+        return False
+    return any(
+        line.strip() != '' and not line.strip().startswith('Assistant:')
+        for line in transcript.splitlines()
+    )
+
+
+def normalize_example_quotes(examples: SessionExamplesRead) -> SessionExamplesRead:
+    """Normalize all quote fields to ensure consistent output.
+
+    Parameters:
+        examples (SessionExamplesRead): Generated examples.
+
+    Returns:
+        SessionExamplesRead: The same examples with normalized quotes.
+    """
+    for ex in examples.positive_examples:
+        ex.quote = normalize_quotes(ex.quote)
+    for ex in examples.negative_examples:
+        ex.quote = normalize_quotes(ex.quote)
+        if ex.improved_quote:
+            ex.improved_quote = normalize_quotes(ex.improved_quote)
+    return examples
+
+
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('examples'),
+)
 def safe_generate_training_examples(
     request: FeedbackCreate,
     hr_docs_context: str = '',
@@ -62,7 +152,11 @@ def safe_generate_training_examples(
     return generate_training_examples(request, hr_docs_context, audio_uri, temperature)
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('goals'),
+)
 def safe_get_achieved_goals(
     request: GoalsAchievedCreate,
     hr_docs_context: str = '',
@@ -86,7 +180,11 @@ def safe_get_achieved_goals(
         return get_achieved_goals(request, hr_docs_context, temperature=temperature)
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('recommendations'),
+)
 def safe_generate_recommendations(
     request: FeedbackCreate,
     hr_docs_context: str = '',
@@ -107,6 +205,32 @@ def safe_generate_recommendations(
     return generate_recommendations(request, hr_docs_context, audio_uri, temperature)
 
 
+@retry(
+    stop=stop_after_attempt(3) | stop_at_deadline,
+    wait=wait_fixed(1),
+    before_sleep=llm_metrics.retry_callback('fused_feedback'),
+)
+def safe_generate_fused_feedback(
+    request: FeedbackCreate,
+    hr_docs_context: str = '',
+    audio_uri: str | None = None,
+    temperature: float = 0.0,
+) -> tuple[SessionExamplesRead, GoalsAchievedRead, RecommendationsRead]:
+    """Retry-safe wrapper to generate all feedback components in one call.
+
+    Parameters:
+        request (FeedbackCreate): Feedback request payload.
+        hr_docs_context (str): HR document context.
+        audio_uri (str | None): Optional audio URI.
+        temperature (float): Sampling temperature.
+
+    Returns:
+        tuple[SessionExamplesRead, GoalsAchievedRead, RecommendationsRead]: Examples,
+            achieved goals and recommendations.
+    """
+    return generate_fused_feedback(request, hr_docs_context, audio_uri, temperature)
+
+
 def generate_training_examples(
     request: FeedbackCreate,
     hr_docs_context: str = '',
@@ -124,47 +248,42 @@ def generate_training_examples(
     Returns:
         SessionExamplesRead: Generated training examples.
     """
-    if not request.transcript or all(
-        (line.strip() == '' or line.strip().startswith('Assistant:'))
-        for line in request.transcript.splitlines()
-    ):
+    if not has_user_statements(request.transcript):
         return SessionExamplesRead(positive_examples=[], negative_examples=[])
     lang = request.language_code
     settings = config.root[lang]
 
     mock_response = settings.mocks.session_examples
-    system_prompt = settings.system_prompts.session_examples
+    system_prompt = system_prompts[lang].session_examples
 
     lang_name = LANGUAGE_NAME.get(lang, 'English')
-    user_prompt = build_training_examples_prompt(
-        category=request.category,
-        transcript=request.transcript,
-        objectives=request.objectives,
-        persona=request.persona,
-        situational_facts=request.situational_facts,
-        key_concepts=request.key_concepts,
-        hr_docs_context=hr_docs_context,
-        language_name=lang_name,
+    user_prompt = prompt_budget.build(
+        'feedback.training_examples',
+        partial(
+            build_training_examples_prompt,
+            category=request.category,
+            objectives=request.objectives,
+            persona=request.persona,
+            situational_facts=request.situational_facts,
+            key_concepts=request.key_concepts,
+            language_name=lang_name,
+        ),
+        [transcript_section(request.transcript), hr_context_section(hr_docs_context)],
+        system_prompt=system_prompt,
     )
 
     response = call_structured_llm(
         request_prompt=user_prompt,
         system_prompt=system_prompt,
         output_model=SessionExamplesRead,
+        operation='examples',
         temperature=temperature,
         mock_response=mock_response,
         audio_uri=audio_uri,
+        cache=temperature == 0.0,
     )
 
-    # Normalize all quote fields to ensure consistent output
-    for ex in response.positive_examples:
-        ex.quote = normalize_quotes(ex.quote)
-    for ex in response.negative_examples:
-        ex.quote = normalize_quotes(ex.quote)
-        if hasattr(ex, 'improved_quote') and ex.improved_quote:
-            ex.improved_quote = normalize_quotes(ex.improved_quote)
-
-    return response
+    return normalize_example_quotes(response)
 
 
 def get_achieved_goals(
@@ -188,23 +307,27 @@ def get_achieved_goals(
     settings = config.root[lang]
 
     mock_response = settings.mocks.goals_achieved
-    system_prompt = settings.system_prompts.goals_achieved
+    system_prompt = system_prompts[lang].goals_achieved
 
     lang_name = LANGUAGE_NAME.get(lang, 'English')
-    user_prompt = build_goals_achieved_prompt(
-        transcript=request.transcript,
-        objectives=request.objectives,
-        hr_docs_context=hr_docs_context,
-        language_name=lang_name,
+    user_prompt = prompt_budget.build(
+        'feedback.goals_achieved',
+        partial(
+            build_goals_achieved_prompt, objectives=request.objectives, language_name=lang_name
+        ),
+        [transcript_section(request.transcript), hr_context_section(hr_docs_context)],
+        system_prompt=system_prompt,
     )
 
     response = call_structured_llm(
         request_prompt=user_prompt,
         system_prompt=system_prompt,
         output_model=GoalsAchievedRead,
+        operation='goals',
         temperature=temperature,
         mock_response=mock_response,
         audio_uri=audio_uri,
+        cache=temperature == 0.0,
     )
 
     response.goals_achieved = [goal for goal in response.goals_achieved if goal.strip()]
@@ -228,41 +351,128 @@ def generate_recommendations(
     Returns:
         RecommendationsRead: Recommendations response.
     """
-    if not request.transcript or all(
-        (line.strip() == '' or line.strip().startswith('Assistant:'))
-        for line in request.transcript.splitlines()
-    ):
+    if not has_user_statements(request.transcript):
         return RecommendationsRead(recommendations=[])
     lang = request.language_code
     settings = config.root[lang]
 
     mock_response = settings.mocks.recommendations
-    system_prompt = settings.system_prompts.recommendations
+    system_prompt = system_prompts[lang].recommendations
 
     lang_name = LANGUAGE_NAME.get(lang, 'English')
-    user_prompt = build_recommendations_prompt(
-        transcript=request.transcript,
-        persona=request.persona,
-        objectives=request.objectives,
-        key_concepts=request.key_concepts,
-        situational_facts=request.situational_facts,
-        category=request.category,
-        hr_docs_context=hr_docs_context,
-        language_name=lang_name,
+    user_prompt = prompt_budget.build(
+        'feedback.recommendations',
+        partial(
+            build_recommendations_prompt,
+            persona=request.persona,
+            objectives=request.objectives,
+            key_concepts=request.key_concepts,
+            situational_facts=request.situational_facts,
+            category=request.category,
+            language_name=lang_name,
+        ),
+        [transcript_section(request.transcript), hr_context_section(hr_docs_context)],
+        system_prompt=system_prompt,
     )
 
     response = call_structured_llm(
         request_prompt=user_prompt,
         system_prompt=system_prompt,
         output_model=RecommendationsRead,
+        operation='recommendations',
         temperature=temperature,
         mock_response=mock_response,
         audio_uri=audio_uri,
+        cache=temperature == 0.0,
     )
 
     return response
 
 
+def generate_fused_feedback(
+    request: FeedbackCreate,
+    hr_docs_context: str = '',
+    audio_uri: str | None = None,
+    temperature: float = 0.0,
+) -> tuple[SessionExamplesRead, GoalsAchievedRead, RecommendationsRead]:
+    """Generate examples, achieved goals and recommendations with a single LLM call.
+
+    The transcript and context are sent once instead of three times. The combined response
+    is split into the same models, with the same post-processing, as the separate calls.
+
+    Parameters:
+        request (FeedbackCreate): Feedback request payload.
+        hr_docs_context (str): HR document context.
+        audio_uri (str | None): Optional audio URI.
+        temperature (float): Sampling temperature.
+
+    Returns:
+        tuple[SessionExamplesRead, GoalsAchievedRead, RecommendationsRead]: Examples,
+            achieved goals and recommendations.
+    """
+    if not has_user_statements(request.transcript):
+        # Examples and recommendations are empty without user statements, like the
+        # separate calls, so only the goals evaluation is left to the model
+        goals_request = GoalsAchievedCreate(
+            transcript=request.transcript,
+            objectives=request.objectives,
+            language_code=request.language_code,
+        )
+        return (
+            SessionExamplesRead(positive_examples=[], negative_examples=[]),
+            get_achieved_goals(goals_request, hr_docs_context, audio_uri, temperature),
+            RecommendationsRead(recommendations=[]),
+        )
+    lang = request.language_code
+    settings = config.root[lang]
+
+    mock_response = FusedFeedbackRead(
+        **settings.mocks.session_examples.model_dump(),
+        **settings.mocks.goals_achieved.model_dump(),
+        **settings.mocks.recommendations.model_dump(),
+    )
+    system_prompt = system_prompts[lang].fused_feedback
+
+    lang_name = LANGUAGE_NAME.get(lang, 'English')
+    user_prompt = prompt_budget.build(
+        'feedback.fused',
+        partial(
+            build_fused_feedback_prompt,
+            category=request.category,
+            objectives=request.objectives,
+            persona=request.persona,
+            situational_facts=request.situational_facts,
+            key_concepts=request.key_concepts,
+            language_name=lang_name,
+        ),
+        [transcript_section(request.transcript), hr_context_section(hr_docs_context)],
+        system_prompt=system_prompt,
+    )
+
+    response = call_structured_llm(
+        request_prompt=user_prompt,
+        system_prompt=system_prompt,
+        output_model=FusedFeedbackRead,
+        operation='fused_feedback',
+        temperature=temperature,
+        mock_response=mock_response,
+        audio_uri=audio_uri,
+        cache=temperature == 0.0,
+    )
+
+    examples = normalize_example_quotes(
+        SessionExamplesRead(
+            positive_examples=response.positive_examples,
+            negative_examples=response.negative_examples,
+        )
+    )
+    goals = GoalsAchievedRead(
+        goals_achieved=[goal for goal in response.goals_achieved if goal.strip()]
+    )
+    recommendations = RecommendationsRead(recommendations=response.recommendations)
+    return examples, goals, recommendations
+
+
 if __name__ == '__main__':
     # Example usage of the service functions
     example_request = FeedbackCreate(
@@ -1,9 +1,7 @@
 """Service layer for session feedback service."""
 
-import concurrent.futures
 import logging
 from collections.abc import Callable, Generator
-from contextlib import suppress
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
@@ -12,10 +10,11 @@ from pydantic import Field
 from sqlmodel import Session as DBSession
 from sqlmodel import select
 
+from app.config import settings
 from app.connections.gcs_client import get_gcs_audio_manager
-from app.dependencies.database import get_db_session
+from app.connections.vertexai_client import llm_executor
+from app.dependencies.database import db_session_scope, get_db_session, log_pool_occupancy
 from app.enums.feedback_status import FeedbackStatus
-from app.models.admin_dashboard_stats import AdminDashboardStats
 from app.models.camel_case import CamelModel
 from app.models.session import Session
 from app.models.session_feedback import SessionFeedback
@@ -32,22 +31,24 @@ from app.schemas.session_feedback import (
     NegativeExample,
     PositiveExample,
     Recommendation,
-    RecommendationsRead,
-    SessionExamplesRead,
 )
 from app.schemas.session_turn import SessionTurnRead, SessionTurnStitchAudioSuccess
+from app.services.admin_stats_service import AdminStatsService
 from app.services.advisor_service import AdvisorService
 from app.services.data_retention_service import (
     delete_full_audio_for_feedback_by_session_id,
     delete_session_turns_by_session_id,
 )
+from app.services.llm_resilience import deadline_scope, time_until
 from app.services.scoring_service import ScoringService, get_scoring_service
 from app.services.session_feedback.session_feedback_llm import (
+    safe_generate_fused_feedback,
     safe_generate_recommendations,
     safe_generate_training_examples,
     safe_get_achieved_goals,
 )
 from app.services.session_turn_service import SessionTurnService
+from app.services.user_stats_service import UserStatsService
 from app.services.vector_db_context_service import query_vector_db_and_prompt
 
 
@@ -131,6 +132,9 @@ def generate_feedback_components(
 ) -> FeedbackGenerationResult:
     """Generate feedback components concurrently.
 
+    Examples, goals and recommendations come from three parallel LLM calls, or from a single
+    fused call when `FEEDBACK_GENERATION_MODE` is 'fused'.
+
     Parameters:
         feedback_request (FeedbackCreate): Feedback request payload.
         goals_request (GoalsAchievedCreate): Goals request payload.
@@ -154,34 +158,52 @@ def generate_feedback_components(
     audio_signed_url: str | None = None
     stitch_result: SessionTurnStitchAudioSuccess | None = None
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        if audio_signed_url is not None:
-            future_examples = executor.submit(
+    fused = settings.FEEDBACK_GENERATION_MODE == 'fused'
+    # The LLM tasks inherit the deadline, which bounds their calls and retries
+    with deadline_scope(settings.FEEDBACK_DEADLINE_SECONDS) as deadline:
+        if fused:
+            future_fused = llm_executor.submit(
+                safe_generate_fused_feedback, feedback_request, hr_docs_context, audio_signed_url
+            )
+        elif audio_signed_url is not None:
+            future_examples = llm_executor.submit(
                 safe_generate_training_examples, feedback_request, hr_docs_context, audio_signed_url
             )
-            future_goals = executor.submit(
+            future_goals = llm_executor.submit(
                 safe_get_achieved_goals, goals_request, hr_docs_context, audio_signed_url
             )
-            future_recommendations = executor.submit(
+            future_recommendations = llm_executor.submit(
                 safe_generate_recommendations, feedback_request, hr_docs_context, audio_signed_url
             )
         else:
-            future_examples = executor.submit(
+            future_examples = llm_executor.submit(
                 safe_generate_training_examples, feedback_request, hr_docs_context
             )
-            future_goals = executor.submit(safe_get_achieved_goals, goals_request, hr_docs_context)
-            future_recommendations = executor.submit(
+            future_goals = llm_executor.submit(
+                safe_get_achieved_goals, goals_request, hr_docs_context
+            )
+            future_recommendations = llm_executor.submit(
                 safe_generate_recommendations, feedback_request, hr_docs_context
             )
-        future_scoring = executor.submit(scoring_service.safe_score_conversation, conversation)
-        future_audio_stitch = executor.submit(
-            session_turn_service.stitch_mp3s_from_gcs,
-            session_id,  # type: ignore
-            f'{session_id}.mp3',
-        )
+        future_scoring = llm_executor.submit(scoring_service.safe_score_conversation, conversation)
+    future_audio_stitch = llm_executor.submit(
+        session_turn_service.stitch_mp3s_from_gcs,
+        session_id,  # type: ignore
+        f'{session_id}.mp3',
+    )
 
+    if fused:
+        try:
+            examples, goals, recs = future_fused.result(timeout=time_until(deadline))
+            examples_positive = examples.positive_examples
+            examples_negative = examples.negative_examples
+            recommendations = recs.recommendations
+        except Exception as e:
+            has_error = True
+            logging.warning('Failed to generate fused feedback: %s', e)
+    else:
         try:
-            examples: SessionExamplesRead = future_examples.result()
+            examples = future_examples.result(timeout=time_until(deadline))
             examples_positive = examples.positive_examples
             examples_negative = examples.negative_examples
         except Exception as e:
@@ -189,40 +211,40 @@ def generate_feedback_components(
             logging.warning('Failed to generate examples: %s', e)
 
         try:
-            goals = future_goals.result()
+            goals = future_goals.result(timeout=time_until(deadline))
         except Exception as e:
             has_error = True
             logging.warning('Failed to generate goals: %s', e)
 
         try:
-            recs: RecommendationsRead = future_recommendations.result()
+            recs = future_recommendations.result(timeout=time_until(deadline))
             recommendations = recs.recommendations
         except Exception as e:
             has_error = True
             logging.warning('Failed to generate key recommendations: %s', e)
 
-        try:
-            scoring_result = future_scoring.result()
-            scores_json = {s.metric: s.score for s in scoring_result.scoring.scores}
-            overall_score = scoring_result.scoring.overall_score
-        except Exception as e:
-            has_error = True
-            logging.warning('Failed to call ScoringService: %s', e)
-            scores_json = {}
-            overall_score = 0.0
+    try:
+        scoring_result = future_scoring.result(timeout=time_until(deadline))
+        scores_json = {s.metric: s.score for s in scoring_result.scoring.scores}
+        overall_score = scoring_result.scoring.overall_score
+    except Exception as e:
+        has_error = True
+        logging.warning('Failed to call ScoringService: %s', e)
+        scores_json = {}
+        overall_score = 0.0
 
-        audio_signed_url = None
-        try:
-            stitch_result = future_audio_stitch.result()
-            if stitch_result and stitch_result.output_filename:
-                gcs = get_gcs_audio_manager()
-                if gcs:
-                    try:
-                        audio_signed_url = gcs.generate_signed_url(stitch_result.output_filename)
-                    except Exception as e:
-                        logging.warning(f'Failed to generate signed url for audio: {e}')
-        except Exception as e:
-            logging.warning('Failed to call Audio Stitching: %s', e)
+    audio_signed_url = None
+    try:
+        stitch_result = future_audio_stitch.result()
+        if stitch_result and stitch_result.output_filename:
+            gcs = get_gcs_audio_manager()
+            if gcs:
+                try:
+                    audio_signed_url = gcs.generate_signed_url(stitch_result.output_filename)
+                except Exception as e:
+                    logging.warning(f'Failed to generate signed url for audio: {e}')
+    except Exception as e:
+        logging.warning('Failed to call Audio Stitching: %s', e)
 
     return FeedbackGenerationResult(
         examples_positive=examples_positive,
@@ -260,23 +282,14 @@ def update_statistics(
     Returns:
         FeedbackStatus: Final feedback status.
     """
-    if conversation and conversation.scenario and conversation.scenario.user_id:
-        user = db_session.exec(
-            select(UserProfile).where(UserProfile.id == conversation.scenario.user_id)
-        ).first()
-    else:
-        user = None
-
-    admin_stats = db_session.exec(select(AdminDashboardStats)).first()
     try:
-        if user:
-            user.score_sum += overall_score
-            user.goals_achieved += len(goals.goals_achieved)
-            db_session.add(user)
-        if admin_stats:
-            admin_stats.score_sum += overall_score
-            admin_stats.total_trainings += 1
-            db_session.add(admin_stats)
+        if conversation and conversation.scenario and conversation.scenario.user_id:
+            UserStatsService(db_session).increment(
+                conversation.scenario.user_id,
+                score_sum=overall_score,
+                goals_achieved=len(goals.goals_achieved),
+            )
+        AdminStatsService(db_session).increment(total_trainings=1, score_sum=overall_score)
         db_session.commit()
         status = FeedbackStatus.completed if not has_error else FeedbackStatus.failed
     except Exception as e:
@@ -392,24 +405,26 @@ def generate_and_store_feedback(
         SessionFeedback: Persisted feedback record.
     """
 
-    session_gen = session_generator_func()
-
-    try:
-        db_session: DBSession = next(session_gen)
-        if scoring_service is None:
-            scoring_service = get_scoring_service()
-
-        if session_turn_service is None:
-            session_turn_service = SessionTurnService(db_session)
+    if scoring_service is None:
+        scoring_service = get_scoring_service()
 
-        if advisor_service is None:
-            advisor_service = AdvisorService()
+    if advisor_service is None:
+        advisor_service = AdvisorService()
 
-        goals_request, recommendations_request = prepare_feedback_requests(feedback_request)
-        hr_docs_context, _, documents = get_hr_docs_context(recommendations_request)
+    goals_request, recommendations_request = prepare_feedback_requests(feedback_request)
+    hr_docs_context, _, documents = get_hr_docs_context(recommendations_request)
 
+    # Read phase: load everything the LLM calls need, then hand the connection back
+    with db_session_scope(session_generator_func) as db_session:
         conversation = get_conversation_data(db_session, session_id)
 
+    # LLM phase: no transaction is open while the model calls are in flight. Audio
+    # stitching only checks out a connection briefly to read and update turn offsets.
+    log_pool_occupancy('feedback generation')
+    with db_session_scope(session_generator_func) as stitch_db_session:
+        if session_turn_service is None:
+            session_turn_service = SessionTurnService(stitch_db_session)
+
         if feedback_request.transcript is None:
             feedback_generation_result = FeedbackGenerationResult()
         else:
@@ -424,6 +439,8 @@ def generate_and_store_feedback(
                 session_id=session_id,
             )
 
+    # Write phase: persist statistics and feedback in a fresh short-lived session
+    with db_session_scope(session_generator_func) as db_session:
         status: FeedbackStatus = update_statistics(
             db_session,
             conversation,
@@ -452,9 +469,6 @@ def generate_and_store_feedback(
         check_data_retention(db_session, session_id, conversation.scenario)
 
         return feedback
-    finally:
-        with suppress(StopIteration):
-            next(session_gen)
 
 
 def check_data_retention(
@@ -6,7 +6,7 @@ from uuid import UUID
 
 from fastapi import BackgroundTasks, HTTPException
 from sqlmodel import Session as DBSession
-from sqlmodel import col, func, select
+from sqlmodel import col, func, select, tuple_
 
 from app.connections.gcs_client import get_gcs_audio_manager
 from app.dependencies.database import get_db_session
@@ -14,7 +14,6 @@ from app.enums.account_role import AccountRole
 from app.enums.feedback_status import FeedbackStatus
 from app.enums.scenario_preparation_status import ScenarioPreparationStatus
 from app.enums.session_status import SessionStatus
-from app.models.admin_dashboard_stats import AdminDashboardStats
 from app.models.conversation_category import ConversationCategory
 from app.models.conversation_scenario import ConversationScenario
 from app.models.scenario_preparation import ScenarioPreparation
@@ -25,9 +24,13 @@ from app.models.user_profile import UserProfile
 from app.schemas.session import SessionCreate, SessionDetailsRead, SessionRead, SessionUpdate
 from app.schemas.session_feedback import FeedbackCreate, SessionFeedbackRead
 from app.schemas.sessions_paginated import PaginatedSessionRead, SessionItem, SkillScores
+from app.services.admin_stats_service import AdminStatsService
+from app.services.bulk_deletion_service import BulkDeletionService
 from app.services.review_service import ReviewService
 from app.services.session_feedback.session_feedback_service import generate_and_store_feedback
 from app.services.session_turn_service import SessionTurnService
+from app.services.user_stats_service import UserStatsService
+from app.services.utils import decode_cursor, encode_cursor
 
 
 class SessionService:
@@ -93,21 +96,29 @@ class SessionService:
         page: int,
         page_size: int,
         scenario_id: UUID | None = None,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> PaginatedSessionRead:
         """Fetch paginated sessions for a user or scenario.
 
+        Pages are addressed either by page number or, in cursor mode, by the opaque
+        next_cursor token of the previous page, which keeps deep pages as fast as the first.
+
         Parameters:
             user_profile (UserProfile): Requesting user profile.
-            page (int): Page number (1-based).
+            page (int): Page number (1-based), ignored when a cursor is given.
             page_size (int): Items per page.
             scenario_id (UUID | None): Optional scenario filter.
+            cursor (str | None): Cursor token returned with the previous page.
+            include_total (bool): Whether to count all matching sessions.
 
         Returns:
             PaginatedSessionRead: Paginated session list.
 
         Raises:
-            HTTPException: If scenario access is invalid.
+            HTTPException: If scenario access or the cursor is invalid.
         """
+        after = decode_cursor(cursor) if cursor else None
         if scenario_id:
             scenario = self._validate_scenario_access(scenario_id, user_profile)
             scenario_ids = [scenario.id]
@@ -119,21 +130,27 @@ class SessionService:
                 page=page, limit=page_size, total_pages=0, total_sessions=0, sessions=[]
             )
 
-        total_sessions = self._count_sessions(scenario_ids)
+        total_sessions = self._count_sessions(scenario_ids) if include_total else None
         if total_sessions == 0:
             return PaginatedSessionRead(
                 page=page, limit=page_size, total_pages=0, total_sessions=0, sessions=[]
             )
 
-        sessions = self._get_sessions_paginated(scenario_ids, page, page_size)
-        session_list = [self._build_session_item(sess) for sess in sessions]
+        rows = self._get_sessions_paginated(scenario_ids, page, page_size, after)
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_session = rows[-1][0]
+            next_cursor = encode_cursor(last_session.created_at, last_session.id)
+        session_list = [self._build_session_item(*row) for row in rows]
 
         return PaginatedSessionRead(
             page=page,
             limit=page_size,
-            total_pages=ceil(total_sessions / page_size),
+            total_pages=ceil(total_sessions / page_size) if total_sessions is not None else None,
             total_sessions=total_sessions,
             sessions=session_list,
+            next_cursor=next_cursor,
         )
 
     def create_new_session(
@@ -238,39 +255,18 @@ class SessionService:
             dict: Deletion summary and deleted audio list.
         """
         user_id = user_profile.id
-        statement = select(ConversationScenario).where(ConversationScenario.user_id == user_id)
-        conversation_scenarios = self.db.exec(statement).all()
-        if not conversation_scenarios:
+        result = BulkDeletionService(self.db).delete_scenarios(
+            col(ConversationScenario.user_id) == user_id
+        )
+        if not result.scenarios:
             return {
                 'message': f'No sessions found for user ID {user_id}',
                 'audios': [],
             }
 
-        to_be_deleted_session_turns = []
-        session_ids = []
-        for scenario in conversation_scenarios:
-            for session in scenario.sessions:
-                session_ids.append(session.id)
-                for turn in session.session_turns:
-                    if turn.audio_uri:
-                        to_be_deleted_session_turns.append(turn)
-
-        # Let the database handle cascade deletes by just deleting the scenarios
-        for scenario in conversation_scenarios:
-            self.db.delete(scenario)
-        self.db.commit()
-
-        session_turn_service = SessionTurnService(self.db)
-        deleted_audios = session_turn_service.delete_session_turns(to_be_deleted_session_turns)
-
-        for session_id in session_ids:
-            deleted_full_audio = self.delete_full_audio_from_session_feedback(session_id)
-            if deleted_full_audio:
-                deleted_audios.append(deleted_full_audio)
-
         return {
-            'message': f'Deleted {len(session_ids)} sessions for user ID {user_id}',
-            'audios': deleted_audios,
+            'message': f'Deleted {result.sessions} sessions for user ID {user_id}',
+            'audios': result.audios,
         }
 
     def delete_session_by_id(self, session_id: UUID, user_profile: UserProfile) -> dict:
@@ -297,26 +293,10 @@ class SessionService:
                 status_code=403, detail='You do not have permission to delete this session'
             )
 
-        to_be_deleted_session_turns = []
-        # Collect all session turns with audio URIs to delete
-        for turn in session.session_turns:
-            if turn.audio_uri:
-                to_be_deleted_session_turns.append(turn)
-
-        # Delete session turns with audio URIs
-        session_turn_service = SessionTurnService(self.db)
-        deleted_audios = session_turn_service.delete_session_turns(to_be_deleted_session_turns)
-
-        # Delete the full audio from session feedback if it exists
-        deleted_full_audio = self.delete_full_audio_from_session_feedback(session_id)
-        if deleted_full_audio:
-            deleted_audios.append(deleted_full_audio)
-
-        self.db.delete(session)
-        self.db.commit()
+        result = BulkDeletionService(self.db).delete_sessions(col(Session.id) == session_id)
         return {
             'message': 'Session deleted successfully',
-            'audios': deleted_audios,
+            'audios': result.audios,
         }
 
     def delete_full_audio_from_session_feedback(self, session_id: UUID) -> str | None:
@@ -513,16 +493,10 @@ class SessionService:
             session_length = (ended_at - started_at).total_seconds() / 3600  # in hours
         else:
             session_length = 0  # Default to 0 if either datetime is None
-        user_profile.total_sessions = (user_profile.total_sessions or 0) + 1
-        user_profile.training_time = (user_profile.training_time or 0) + session_length
-        user_profile.updated_at = datetime.now(UTC)
-        self.db.add(user_profile)
-
-        stats = self.db.exec(select(AdminDashboardStats)).first()
-        if not stats:
-            stats = AdminDashboardStats()
-            self.db.add(stats)
-        stats.total_trainings = (stats.total_trainings or 0) + 1
+        UserStatsService(self.db).increment(
+            user_profile.id, total_sessions=1, training_time=session_length
+        )
+        AdminStatsService(self.db).increment(total_trainings=1)
 
     def _get_session(self, session_id: UUID) -> Session:
         """Load a session by ID.
@@ -690,63 +664,69 @@ class SessionService:
         ).one()
 
     def _get_sessions_paginated(
-        self, scenario_ids: list[UUID], page: int, page_size: int
-    ) -> list[Session]:
-        """Fetch a page of sessions for scenario IDs.
+        self,
+        scenario_ids: list[UUID],
+        page: int,
+        page_size: int,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[tuple[Session, str | None, SessionFeedback | None]]:
+        """Fetch a page of sessions with their category name and feedback in one query.
+
+        One extra row is fetched so the caller can tell whether another page follows.
 
         Parameters:
             scenario_ids (list[UUID]): Scenario identifiers.
-            page (int): Page number (1-based).
+            page (int): Page number (1-based), ignored when after is given.
             page_size (int): Items per page.
+            after (tuple[datetime, UUID] | None): Keyset position of the last seen session.
 
         Returns:
-            list[Session]: Session records.
+            list[tuple[Session, str | None, SessionFeedback | None]]: Up to page_size + 1
+                session records with the category name and feedback of each session.
         """
-        sessions = self.db.exec(
-            select(Session)
+        stmt = (
+            select(Session, ConversationCategory.name, SessionFeedback)
+            .join(ConversationScenario, col(Session.scenario_id) == ConversationScenario.id)
+            .outerjoin(
+                ConversationCategory,
+                col(ConversationScenario.category_id) == ConversationCategory.id,
+            )
+            .outerjoin(SessionFeedback, col(SessionFeedback.session_id) == Session.id)
             .where(col(Session.scenario_id).in_(scenario_ids))
-            .order_by(col(Session.created_at).desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        ).all()
-        return list(sessions)
+            .order_by(col(Session.created_at).desc(), col(Session.id).desc())
+            .limit(page_size + 1)
+        )
+        if after:
+            created_at, session_id = after
+            stmt = stmt.where(
+                tuple_(col(Session.created_at), col(Session.id)) < tuple_(created_at, session_id)
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        return list(self.db.exec(stmt).all())
 
-    def _build_session_item(self, sess: Session) -> SessionItem:
+    def _build_session_item(
+        self, sess: Session, category_name: str | None, feedback: SessionFeedback | None
+    ) -> SessionItem:
         """Build a SessionItem DTO from a session record.
 
         Parameters:
             sess (Session): Session record.
+            category_name (str | None): Name of the scenario's category, if any.
+            feedback (SessionFeedback | None): Feedback of the session, if generated.
 
         Returns:
             SessionItem: Session summary payload.
-
-        Raises:
-            HTTPException: If the scenario is missing.
         """
-        scenario = self.db.exec(
-            select(ConversationScenario).where(ConversationScenario.id == sess.scenario_id)
-        ).first()
-        if not scenario:
-            raise HTTPException(status_code=404, detail='Conversation scenario not found')
-
-        category = (
-            self.db.exec(
-                select(ConversationCategory).where(ConversationCategory.id == scenario.category_id)
-            ).first()
-            if scenario.category_id
-            else None
-        )
-
-        title = category.name if category else 'No Title'
-        summary = category.name if category else 'No Summary'
-        feedback = sess.feedback
+        title = category_name if category_name else 'No Title'
+        summary = category_name if category_name else 'No Summary'
 
         scores = (
             SkillScores(
-                structure=feedback.scores.get('structure', -1) if feedback else -1,
-                empathy=feedback.scores.get('empathy', -1) if feedback else -1,
-                focus=feedback.scores.get('focus', -1) if feedback else -1,
-                clarity=feedback.scores.get('clarity', -1) if feedback else -1,
+                structure=feedback.scores.get('structure', -1),
+                empathy=feedback.scores.get('empathy', -1),
+                focus=feedback.scores.get('focus', -1),
+                clarity=feedback.scores.get('clarity', -1),
             )
             if feedback
             else SkillScores(structure=-1, empathy=-1, focus=-1, clarity=-1)
@@ -10,14 +10,18 @@ from uuid import uuid4
 
 import puremagic
 from fastapi import BackgroundTasks, HTTPException, UploadFile, status
-from sqlalchemy import UUID
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import UUID, update
 from sqlmodel import Session as DBSession
 from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession as AsyncDBSession
 
 from app.config import Settings
 from app.connections.gcs_client import get_gcs_audio_manager
 from app.dependencies.database import get_db_session
 from app.enums.speaker import SpeakerType
+from app.models.conversation_category import ConversationCategory
+from app.models.conversation_scenario import ConversationScenario
 from app.models.session import Session as SessionModel
 from app.models.session_turn import SessionTurn
 from app.models.user_profile import UserProfile
@@ -152,13 +156,15 @@ def store_audio_file(session_id: UUID, audio_file: UploadFile) -> str:
 class SessionTurnService:
     """Service for managing session turns and audio stitching."""
 
-    def __init__(self, db: DBSession) -> None:
+    def __init__(self, db: DBSession, async_db: AsyncDBSession | None = None) -> None:
         """Initialize the service with a database session.
 
         Parameters:
             db (DBSession): Database session used for queries and updates.
+            async_db (AsyncDBSession | None): Async database session used by async handlers.
         """
         self.db = db
+        self.async_db = async_db
         self.gcs_manager = get_gcs_audio_manager()
 
     async def create_session_turn(
@@ -181,38 +187,54 @@ class SessionTurnService:
 
         Raises:
             HTTPException: If session validation fails.
+            RuntimeError: If the service was created without an async session.
         """
-        session = self.db.get(SessionModel, turn.session_id)
+        if self.async_db is None:
+            raise RuntimeError('SessionTurnService.create_session_turn requires an async session')
+
+        row = (
+            await self.async_db.exec(
+                select(ConversationScenario, ConversationCategory.name)
+                .join(SessionModel, col(SessionModel.scenario_id) == ConversationScenario.id)
+                .outerjoin(
+                    ConversationCategory,
+                    col(ConversationScenario.category_id) == ConversationCategory.id,
+                )
+                .where(SessionModel.id == turn.session_id)
+            )
+        ).first()
 
-        if not session.scenario.user_id == user_profile.id:
+        if not row:
+            raise HTTPException(status_code=404, detail='Session not found')
+        scenario, category_name = row
+        if not scenario.user_id == user_profile.id:
             raise HTTPException(
                 status.HTTP_401_UNAUTHORIZED, detail='User does not own this session'
             )
-        if not session:
-            raise HTTPException(status_code=404, detail='Session not found')
         if not turn.text:
             raise HTTPException(status_code=400, detail='Text is required')
 
         audio_uri = ''
         if self.gcs_manager is not None:
-            audio_uri = store_audio_file(turn.session_id, audio_file)
+            # GCS uploads are blocking, keep them off the event loop
+            audio_uri = await run_in_threadpool(store_audio_file, turn.session_id, audio_file)
 
         turn_data = turn.model_dump()
         turn_data['audio_uri'] = audio_uri
         new_turn = SessionTurn(**turn_data)
-        self.db.add(new_turn)
-        self.db.commit()
-        self.db.refresh(new_turn)
+        self.async_db.add(new_turn)
+        await self.async_db.commit()
+        await self.async_db.refresh(new_turn)
 
         if turn.speaker == SpeakerType.user:
-            category = session.scenario.category.name if session.scenario.category else ''
-            hr_docs_context, _, _ = get_hr_docs_context(
-                persona=session.scenario.persona,
-                situational_facts=session.scenario.situational_facts,
-                category=category,
+            hr_docs_context, _, _ = await run_in_threadpool(
+                get_hr_docs_context,
+                persona=scenario.persona,
+                situational_facts=scenario.situational_facts,
+                category=category_name or '',
             )
 
-            language = session.scenario.language_code if session.scenario else 'en'
+            language = scenario.language_code
             # Generate live feedback item in the background
             background_tasks.add_task(
                 generate_and_store_live_feedback,
@@ -358,28 +380,31 @@ class SessionTurnService:
             raise HTTPException(status_code=500, detail='Failed to connect to audio storage')
 
         session_turns = self.db.exec(
-            select(SessionTurn)
+            select(SessionTurn.id, SessionTurn.audio_uri, SessionTurn.start_offset_ms)
             .where(SessionTurn.session_id == session_id)
             .order_by(col(SessionTurn.start_offset_ms))
         ).all()
+        # End the read transaction so no pooled connection is held while downloading
+        self.db.rollback()
         if not session_turns:
             return None
 
         # Download, compute durations, and determine offsets
         mp3_entries = []  # list of (buffer, duration, offset_ms)
+        turn_offsets = []  # list of {'id', 'full_audio_start_offset_ms'} rows
         cumulative = 0.0
         longest_end_ms = 0
-        for turn in session_turns:
+        for turn_id, audio_uri, start_offset_ms in session_turns:
             buf = io.BytesIO()
-            self.gcs_manager.bucket.blob(
-                f'{self.gcs_manager.prefix}{turn.audio_uri}'
-            ).download_to_file(buf)
+            self.gcs_manager.bucket.blob(f'{self.gcs_manager.prefix}{audio_uri}').download_to_file(
+                buf
+            )
             buf.seek(0)
             dur = self.get_audio_duration_seconds(buf)  # seconds (float)
 
             # decide the clip’s offset
             if STITCH_MODE == MODE_TIMELINE:
-                offset_ms = turn.start_offset_ms or 0
+                offset_ms = start_offset_ms or 0
             else:  # MODE_CONCAT
                 offset_ms = int(cumulative * 1000)
                 cumulative += dur
@@ -388,11 +413,11 @@ class SessionTurnService:
             end_ms = offset_ms + int(dur * 1000)
             longest_end_ms = max(longest_end_ms, end_ms)
 
-            # store/update DB as before
-            turn.full_audio_start_offset_ms = offset_ms
-            self.db.add(turn)
+            turn_offsets.append({'id': turn_id, 'full_audio_start_offset_ms': offset_ms})
             mp3_entries.append((buf, dur, offset_ms))
 
+        # Store all offsets with one bulk UPDATE by primary key
+        self.db.exec(update(SessionTurn), params=turn_offsets)
         self.db.commit()
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,104 @@
+"""Service layer for ttl cache."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU cache whose entries expire after a time to live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Parameters:
+            maxsize (int): Maximum number of entries, the least recently used one is evicted.
+            ttl (float): Default time to live of an entry in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:  # noqa: ANN401
+        """Return the cached value for a key.
+
+        Parameters:
+            key (Hashable): Cache key.
+
+        Returns:
+            Any: Cached value, or None when the key is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:  # noqa: ANN401
+        """Store a value, evicting the least recently used entry when the cache is full.
+
+        Parameters:
+            key (Hashable): Cache key.
+            value (Any): Value to cache.
+            ttl (float | None): Time to live in seconds, defaults to the cache TTL.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a key from the cache if present.
+
+        Parameters:
+            key (Hashable): Cache key.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit and miss counters.
+
+        Returns:
+            None: This function mutates the cache in-place.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the share of lookups that were served from the cache.
+
+        Returns:
+            float: Hit rate between 0 and 1.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet evicted.
+
+        Returns:
+            int: Number of entries.
+        """
+        return len(self._entries)
@@ -5,11 +5,12 @@ from uuid import UUID
 
 from fastapi import HTTPException, status
 from pydantic import ValidationError
-from sqlalchemy import func, literal, update
+from sqlalchemy import delete, func, literal, update
 from sqlmodel import Session as DBSession
 from sqlmodel import col, select
 from supabase import AuthError
 
+from app.dependencies.auth import user_profile_cache
 from app.dependencies.database import get_supabase_client
 from app.enums.account_role import AccountRole
 from app.enums.goal import Goal
@@ -98,24 +99,49 @@ class UserService:
                 detail='Only one sorting option can be used at a time.',
             )
 
-        statement = select(UserProfile).where(col(UserProfile.account_role) != AccountRole.admin)
+        filters = [col(UserProfile.account_role) != AccountRole.admin]
 
         if session_limit_type_filter:
             types = set(session_limit_type_filter)
 
             if types == {SessionLimitType.DEFAULT}:
-                statement = statement.where(UserProfile.daily_session_limit.is_(None))
+                filters.append(col(UserProfile.daily_session_limit).is_(None))
 
             elif types == {SessionLimitType.INDIVIDUAL}:
-                statement = statement.where(UserProfile.daily_session_limit.is_not(None))
+                filters.append(col(UserProfile.daily_session_limit).is_not(None))
 
         if email_substring:
-            statement = statement.where(col(UserProfile.email).like(f'%{email_substring}%'))
+            # Served by the ix_userprofile_email_trgm trigram index on Postgres
+            filters.append(col(UserProfile.email).like(f'%{email_substring}%'))
+
+        total_users = self.db.exec(
+            select(func.count()).select_from(UserProfile).where(*filters)
+        ).one()
+        if total_users == 0:
+            return UserListPaginatedRead(
+                page=page,
+                limit=limit,
+                total_pages=1,
+                total_users=0,
+                users=[],
+            )
+
+        total_pages = ceil(total_users / limit)
+        if page < 1 or page > total_pages:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail='Invalid page number.',
+            )
+
+        # Resolved once per request instead of once per listed user
+        default_daily_session_limit = self.app_config_service.get_default_daily_session_limit()
+
+        statement = select(UserProfile).where(*filters)
 
         if session_limit_sorting_option:
             effective_limit = func.coalesce(
                 UserProfile.daily_session_limit,
-                literal(self.app_config_service.get_default_daily_session_limit()),
+                literal(default_daily_session_limit),
             )
 
             match session_limit_sorting_option:
@@ -131,30 +157,15 @@ class UserService:
                 case SortOption.DESC:
                     statement = statement.order_by(col(UserProfile.email).desc())
 
-        all_users = self.db.exec(statement).all()
-        total_users = len(all_users)
-        if total_users == 0:
-            return UserListPaginatedRead(
-                page=page,
-                limit=limit,
-                total_pages=1,
-                total_users=0,
-                users=[],
-            )
-
-        total_pages = ceil(total_users / limit)
-        if page < 1 or page > total_pages:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail='Invalid page number.',
-            )
+        # Tie-breaker so that consecutive pages never overlap
+        statement = statement.order_by(col(UserProfile.id)).offset((page - 1) * limit).limit(limit)
 
-        users = all_users[(page - 1) * limit : page * limit]
+        users = self.db.exec(statement).all()
         user_list = [
             UserProfilePaginatedRead(
                 user_id=user.id,
                 email=user.email,
-                daily_session_limit=self.app_config_service.get_default_daily_session_limit()
+                daily_session_limit=default_daily_session_limit
                 if user.daily_session_limit is None
                 else user.daily_session_limit,
                 limit_type=SessionLimitType.DEFAULT
@@ -342,8 +353,11 @@ class UserService:
             ) from e
 
         try:
-            self.db.delete(user)
+            # Reviews, goals and confidence scores are removed by ON DELETE CASCADE, so the
+            # relationships of the profile are not loaded
+            self.db.exec(delete(UserProfile).where(col(UserProfile.id) == user_id))
             self.db.commit()
+            user_profile_cache.pop(user_id)
         except Exception as e:
             self.db.rollback()
             raise HTTPException(
@@ -408,5 +422,6 @@ class UserService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='User not found')
 
         self.db.commit()
+        user_profile_cache.pop(user_id)
 
         return self.get_user_profile_by_id(user_id, detailed=False)
@@ -0,0 +1,101 @@
+"""Service layer for user stats service."""
+
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import Session as DBSession
+from sqlmodel import col
+
+from app.dependencies.auth import user_profile_cache
+from app.models.user_profile import UserProfile
+
+
+@dataclass
+class UserStats:
+    """Training statistics of a user after an update.
+
+    Parameters:
+        total_sessions (int): Number of completed sessions.
+        training_time (float): Training time in hours.
+        score_sum (float): Sum of all session scores.
+        goals_achieved (int): Number of achieved goals.
+    """
+
+    total_sessions: int
+    training_time: float
+    score_sum: float
+    goals_achieved: int
+
+
+class UserStatsService:
+    """Service for updating user training statistics with atomic increments.
+
+    Every update is a single `UPDATE ... SET x = x + :delta RETURNING` statement, so
+    concurrent session completions of the same user cannot overwrite each other and the
+    profile does not have to be loaded first.
+    """
+
+    def __init__(self, db: DBSession) -> None:
+        """Initialize the service with a database session.
+
+        Parameters:
+            db (DBSession): Database session used for updates.
+        """
+        self.db = db
+
+    def increment(
+        self,
+        user_id: UUID,
+        total_sessions: int = 0,
+        training_time: float = 0.0,
+        score_sum: float = 0.0,
+        goals_achieved: int = 0,
+    ) -> UserStats | None:
+        """Add to the statistics of a user within the current transaction.
+
+        A profile already loaded in the session is updated with the returned values, so
+        it does not have to be refreshed. The change becomes visible when the caller
+        commits the session.
+
+        Parameters:
+            user_id (UUID): User whose statistics are updated.
+            total_sessions (int): Number of sessions to add.
+            training_time (float): Training time in hours to add.
+            score_sum (float): Score to add to the score sum.
+            goals_achieved (int): Number of achieved goals to add.
+
+        Returns:
+            UserStats | None: Updated statistics, or None if the user does not exist.
+        """
+        row = self.db.exec(
+            update(UserProfile)
+            .where(col(UserProfile.id) == user_id)
+            .values(
+                total_sessions=col(UserProfile.total_sessions) + total_sessions,
+                training_time=col(UserProfile.training_time) + training_time,
+                score_sum=col(UserProfile.score_sum) + score_sum,
+                goals_achieved=col(UserProfile.goals_achieved) + goals_achieved,
+                updated_at=datetime.now(UTC),
+            )
+            .returning(
+                col(UserProfile.total_sessions),
+                col(UserProfile.training_time),
+                col(UserProfile.score_sum),
+                col(UserProfile.goals_achieved),
+            )
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            return None
+        user_profile_cache.pop(user_id)
+
+        stats = UserStats(*row)
+        user_profile = self.db.identity_map.get(identity_key(UserProfile, user_id))
+        if user_profile is not None:
+            for key, value in asdict(stats).items():
+                set_committed_value(user_profile, key, value)
+        return stats
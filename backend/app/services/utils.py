@@ -1,6 +1,13 @@
 """Service layer for utils."""
 
+import base64
+import binascii
+import json
 import unicodedata
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
 
 
 # LLMs and user input may use different Unicode quote characters (e.g., curved vs. straight quotes),
@@ -51,3 +58,37 @@ def auto_strip_markdown_code_block(s: str) -> str:
     if s_strip.startswith('```'):
         return strip_markdown_code_block(s_strip)
     return s
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """Encode a keyset pagination position as an opaque cursor token.
+
+    Parameters:
+        created_at (datetime): Creation timestamp of the last item on the page.
+        item_id (UUID): Identifier of the last item on the page.
+
+    Returns:
+        str: URL-safe cursor token.
+    """
+    payload = json.dumps({'c': created_at.isoformat(), 'i': str(item_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor token produced by encode_cursor.
+
+    Parameters:
+        cursor (str): Cursor token from a previous page.
+
+    Returns:
+        tuple[datetime, UUID]: Creation timestamp and identifier of the last seen item.
+
+    Raises:
+        HTTPException: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload['c']), UUID(payload['i'])
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail='Invalid pagination cursor') from e
@@ -23,4 +23,6 @@ def analyze_voice(audio_uri: str) -> str:
     """
     if not audio_uri:
         return ''
-    return call_llm_with_audio(audio_uri=audio_uri, request_prompt=prompt)
+    return call_llm_with_audio(
+        audio_uri=audio_uri, request_prompt=prompt, operation='voice_analysis'
+    )
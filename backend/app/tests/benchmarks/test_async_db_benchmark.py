@@ -0,0 +1,78 @@
+import asyncio
+import os
+import time
+import unittest
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session as DBSession
+from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession as AsyncDBSession
+
+BENCHMARK_DATABASE_URL = os.environ.get('BENCHMARK_DATABASE_URL', '')
+CONCURRENT_REQUESTS = 50
+QUERY_LATENCY_S = 0.02
+
+
+@unittest.skipUnless(
+    os.environ.get('RUN_BENCHMARKS') == 'true' and BENCHMARK_DATABASE_URL,
+    'Benchmarks not enabled or BENCHMARK_DATABASE_URL not set',
+)
+class TestAsyncDatabaseThroughput(unittest.TestCase):
+    """Compare async handler throughput with blocking sync sessions and async sessions.
+
+    Every simulated request issues one query that takes QUERY_LATENCY_S on the server,
+    similar to a handler that waits on the database before answering.
+    """
+
+    def setUp(self) -> None:
+        self.sync_engine = create_engine(
+            BENCHMARK_DATABASE_URL.replace('postgresql+psycopg://', 'postgresql://'),
+            pool_size=5,
+            max_overflow=4,
+        )
+        self.async_engine = create_async_engine(
+            BENCHMARK_DATABASE_URL.replace('postgresql://', 'postgresql+psycopg://'),
+            pool_size=5,
+            max_overflow=4,
+        )
+
+    def tearDown(self) -> None:
+        self.sync_engine.dispose()
+
+    async def _sync_handler(self) -> None:
+        # Mirrors the previous async routes: the sync session blocks the event loop
+        with DBSession(self.sync_engine) as db_session:
+            db_session.execute(text('SELECT pg_sleep(:latency)'), {'latency': QUERY_LATENCY_S})
+
+    async def _async_handler(self) -> None:
+        async with AsyncDBSession(self.async_engine) as db_session:
+            await db_session.execute(
+                text('SELECT pg_sleep(:latency)'), {'latency': QUERY_LATENCY_S}
+            )
+
+    async def _measure(self, handler_factory: Callable[[], Awaitable[None]]) -> float:
+        start = time.perf_counter()
+        await asyncio.gather(*(handler_factory() for _ in range(CONCURRENT_REQUESTS)))
+        return CONCURRENT_REQUESTS / (time.perf_counter() - start)
+
+    async def _run_benchmark(self) -> tuple[float, float]:
+        try:
+            sync_rps = await self._measure(self._sync_handler)
+            async_rps = await self._measure(self._async_handler)
+        finally:
+            await self.async_engine.dispose()
+        return sync_rps, async_rps
+
+    def test_async_session_throughput(self) -> None:
+        sync_rps, async_rps = asyncio.run(self._run_benchmark())
+
+        print(
+            f'[async-db] sync session: {sync_rps:.1f} req/s, async session: {async_rps:.1f} req/s'
+        )
+        self.assertGreater(async_rps, sync_rps)
+
+
+if __name__ == '__main__':
+    unittest.main()
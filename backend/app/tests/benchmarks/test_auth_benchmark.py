@@ -0,0 +1,59 @@
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+import jwt
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.dependencies import auth
+from app.dependencies.auth import jwt_payload_cache, verify_jwt
+
+ITERATIONS = 20_000
+
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS') == 'true', 'Benchmarks not enabled')
+class TestVerifyJwtBenchmark(unittest.TestCase):
+    """Compare verify_jwt with a warm token cache against decoding every token."""
+
+    def setUp(self) -> None:
+        settings_patch = patch.object(auth.settings, 'DEV_MODE_SKIP_AUTH', False)
+        settings_patch.start()
+        self.addCleanup(settings_patch.stop)
+        jwt_payload_cache.clear()
+        self.addCleanup(jwt_payload_cache.clear)
+
+        token = jwt.encode(
+            {
+                'sub': 'bench-user',
+                'aud': 'authenticated',
+                'exp': int(time.time()) + 3600,
+                'email': 'bench@example.com',
+                'role': 'authenticated',
+            },
+            auth.settings.SUPABASE_JWT_SECRET,
+            algorithm='HS256',
+        )
+        self.credentials = HTTPAuthorizationCredentials(scheme='Bearer', credentials=token)
+
+    def _time(self, clear_cache: bool) -> float:
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            if clear_cache:
+                jwt_payload_cache.clear()
+            verify_jwt(self.credentials)
+        return (time.perf_counter() - start) / ITERATIONS * 1_000_000
+
+    def test_verify_jwt(self) -> None:
+        uncached_us = self._time(clear_cache=True)
+        cached_us = self._time(clear_cache=False)
+
+        print(
+            f'[verify-jwt] iterations={ITERATIONS} uncached={uncached_us:.2f}us/call '
+            f'cached={cached_us:.2f}us/call hit rate={jwt_payload_cache.hit_rate:.3f}'
+        )
+        self.assertLess(cached_us, uncached_us)
+
+
+if __name__ == '__main__':
+    unittest.main()
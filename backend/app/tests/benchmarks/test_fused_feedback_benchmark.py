@@ -0,0 +1,160 @@
+import os
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from google.genai.types import GenerateContentConfig
+
+from app.schemas.conversation_scenario import ConversationScenario, ConversationScenarioRead
+from app.schemas.session_feedback import (
+    FeedbackCreate,
+    FusedFeedbackRead,
+    GoalsAchievedCreate,
+    GoalsAchievedRead,
+    RecommendationsRead,
+    SessionExamplesRead,
+)
+from app.services.llm_response_cache import llm_response_cache
+from app.services.session_feedback.session_feedback_llm import config
+from app.services.session_feedback.session_feedback_service import generate_feedback_components
+
+SESSIONS = 5
+# Fake latency model: a fixed round trip plus time per input and output token
+BASE_LATENCY_S = 0.2
+INPUT_TOKEN_LATENCY_S = 0.00005
+OUTPUT_TOKEN_LATENCY_S = 0.002
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_tokens(text: str | None) -> int:
+    return len(text or '') // CHARS_PER_TOKEN
+
+
+class FakeModels:
+    """Blocking fake of `client.models` that counts tokens and simulates latency."""
+
+    def __init__(self) -> None:
+        mocks = config.root['en'].mocks
+        self.responses: dict[type, str] = {
+            SessionExamplesRead: mocks.session_examples.model_dump_json(),
+            GoalsAchievedRead: mocks.goals_achieved.model_dump_json(),
+            RecommendationsRead: mocks.recommendations.model_dump_json(),
+            FusedFeedbackRead: FusedFeedbackRead(
+                **mocks.session_examples.model_dump(),
+                **mocks.goals_achieved.model_dump(),
+                **mocks.recommendations.model_dump(),
+            ).model_dump_json(),
+        }
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self._lock = threading.Lock()
+
+    def generate_content(
+        self, model: str, contents: list[Any], config: GenerateContentConfig
+    ) -> SimpleNamespace:
+        text = self.responses[config.response_schema]
+        input_tokens = _estimate_tokens(config.system_instruction) + sum(
+            _estimate_tokens(part) for part in contents if isinstance(part, str)
+        )
+        output_tokens = _estimate_tokens(text)
+        with self._lock:
+            self.calls += 1
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+        time.sleep(
+            BASE_LATENCY_S
+            + input_tokens * INPUT_TOKEN_LATENCY_S
+            + output_tokens * OUTPUT_TOKEN_LATENCY_S
+        )
+        return SimpleNamespace(text=text)
+
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS') == 'true', 'Benchmarks not enabled')
+class TestFusedFeedbackBenchmark(unittest.TestCase):
+    """Compare token use and latency of parallel and fused feedback generation.
+
+    Token counts are estimated from the prompt and response lengths, the fake client adds
+    latency per call and per token, so the fused call trades a longer output for fewer
+    round trips and a transcript that is only sent once.
+    """
+
+    def setUp(self) -> None:
+        transcript = '\n'.join(
+            f'User: Statement {i} about the missed deadlines and next steps.\n'
+            f'Assistant: Response {i} with concerns about the workload.'
+            for i in range(40)
+        )
+        objectives = ['Bring clarity to the situation', 'Agree on next steps']
+        self.feedback_request = FeedbackCreate(
+            transcript=transcript,
+            objectives=objectives,
+            persona='**Name**: Julian **Training Focus**: Missed deadlines',
+            situational_facts='Review of repeatedly missed project deadlines',
+            category='Giving Feedback',
+            key_concepts='### Active Listening\nShow empathy and paraphrase concerns.',
+        )
+        self.goals_request = GoalsAchievedCreate(transcript=transcript, objectives=objectives)
+        self.conversation = ConversationScenarioRead(
+            scenario=ConversationScenario(user_id=uuid4(), category_id='giving_feedback'),
+            transcript=[],
+        )
+
+    def _measure(self, mode: str) -> tuple[FakeModels, float]:
+        fake_models = FakeModels()
+        client = MagicMock()
+        client.models = fake_models
+        session_turn_service = MagicMock()
+        session_turn_service.stitch_mp3s_from_gcs.return_value = None
+
+        with (
+            patch('app.connections.vertexai_client.ENABLE_AI', True),
+            patch('app.connections.vertexai_client.vertexai_client', client),
+            patch(
+                'app.services.session_feedback.session_feedback_service.settings.'
+                'FEEDBACK_GENERATION_MODE',
+                mode,
+            ),
+        ):
+            start = time.perf_counter()
+            for _ in range(SESSIONS):
+                # Every session is a fresh generation, not a response cache hit
+                llm_response_cache.clear()
+                result = generate_feedback_components(
+                    feedback_request=self.feedback_request,
+                    goals_request=self.goals_request,
+                    hr_docs_context='',
+                    documents=[],
+                    conversation=self.conversation,
+                    scoring_service=MagicMock(),
+                    session_turn_service=session_turn_service,
+                    session_id=uuid4(),
+                )
+                self.assertTrue(result.recommendations)
+            elapsed = time.perf_counter() - start
+        return fake_models, elapsed / SESSIONS
+
+    def test_fused_generation_tokens_and_latency(self) -> None:
+        parallel, parallel_latency = self._measure('parallel')
+        fused, fused_latency = self._measure('fused')
+
+        print(
+            f'[fused-feedback] parallel: {parallel.calls // SESSIONS} calls, '
+            f'{parallel.input_tokens // SESSIONS} input / '
+            f'{parallel.output_tokens // SESSIONS} output tokens, '
+            f'{parallel_latency * 1000:.0f} ms; fused: {fused.calls // SESSIONS} calls, '
+            f'{fused.input_tokens // SESSIONS} input / {fused.output_tokens // SESSIONS} output '
+            f'tokens, {fused_latency * 1000:.0f} ms per session'
+        )
+        self.assertEqual(parallel.calls, 3 * SESSIONS)
+        self.assertEqual(fused.calls, SESSIONS)
+        # The transcript and context are sent once instead of three times
+        self.assertLess(fused.input_tokens, parallel.input_tokens * 0.6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import os
+import time
+import unittest
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine, select
+
+from app.models import ConversationScenario, Review, Session, UserProfile
+from app.services.review_service import ReviewService
+from app.services.session_service import SessionService
+
+ROW_COUNT = 100_000
+PAGE_SIZE = 20
+DEPTHS = (0, 10_000, 50_000, 99_000)
+REPEATS = 5
+
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS') == 'true', 'Benchmarks not enabled')
+class TestKeysetPaginationBenchmark(unittest.TestCase):
+    """Compare OFFSET and keyset page latency at increasing depths over 100k rows."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(cls.engine)
+        cls.db = DBSession(cls.engine)
+
+        user = UserProfile(full_name='Bench', email='bench@example.com', phone_number='1')
+        scenario = ConversationScenario(
+            user_id=user.id,
+            category_id=None,
+            persona_name='bench',
+            persona='',
+            situational_facts='',
+        )
+        cls.db.add_all([user, scenario])
+        cls.db.commit()
+        cls.scenario_id = scenario.id
+
+        start = datetime(2025, 1, 1)
+        cls.db.exec(
+            insert(Review),
+            params=[
+                {
+                    'id': uuid4(),
+                    'user_id': user.id,
+                    'rating': i % 5 + 1,
+                    'comment': 'Benchmark review',
+                    'created_at': start + timedelta(seconds=i),
+                }
+                for i in range(ROW_COUNT)
+            ],
+        )
+        cls.db.exec(
+            insert(Session),
+            params=[
+                {
+                    'id': uuid4(),
+                    'scenario_id': scenario.id,
+                    'created_at': start + timedelta(seconds=i),
+                    'updated_at': start + timedelta(seconds=i),
+                }
+                for i in range(ROW_COUNT)
+            ],
+        )
+        cls.db.commit()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.db.close()
+        cls.engine.dispose()
+
+    def _time(self, query: Callable[[], object]) -> float:
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            query()
+        return (time.perf_counter() - start) / REPEATS * 1000
+
+    def _position_at(self, model: type[Review] | type[Session], depth: int) -> tuple:
+        return self.db.exec(
+            select(model.created_at, model.id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .offset(depth - 1)
+            .limit(1)
+        ).one()
+
+    def _report(self, name: str, offset_ms: list[float], keyset_ms: list[float]) -> None:
+        for depth, offset_time, keyset_time in zip(DEPTHS, offset_ms, keyset_ms, strict=True):
+            print(
+                f'[{name}] depth={depth:>6} offset={offset_time:7.2f}ms keyset={keyset_time:7.2f}ms'
+            )
+        # Keyset pages stay flat while OFFSET pages grow with the depth
+        self.assertLess(keyset_ms[-1], offset_ms[-1])
+        self.assertLess(keyset_ms[-1], max(keyset_ms[0], 1.0) * 5)
+
+    def test_review_pages(self) -> None:
+        service = ReviewService(self.db)
+        offset_ms, keyset_ms = [], []
+        for depth in DEPTHS:
+            after = self._position_at(Review, depth) if depth else None
+            offset_ms.append(
+                self._time(
+                    lambda d=depth: service._query_reviews_with_users(limit=PAGE_SIZE, offset=d)
+                )
+            )
+            keyset_ms.append(
+                self._time(
+                    lambda a=after: service._query_reviews_with_users(limit=PAGE_SIZE, after=a)
+                )
+            )
+        self._report('reviews', offset_ms, keyset_ms)
+
+    def test_session_pages(self) -> None:
+        service = SessionService(self.db)
+        offset_ms, keyset_ms = [], []
+        for depth in DEPTHS:
+            after = self._position_at(Session, depth) if depth else None
+            page = depth // PAGE_SIZE + 1
+            offset_ms.append(
+                self._time(
+                    lambda p=page: service._get_sessions_paginated([self.scenario_id], p, PAGE_SIZE)
+                )
+            )
+            keyset_ms.append(
+                self._time(
+                    lambda a=after: service._get_sessions_paginated(
+                        [self.scenario_id], 1, PAGE_SIZE, a
+                    )
+                )
+            )
+        self._report('sessions', offset_ms, keyset_ms)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import threading
+import time
+import tracemalloc
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel
+
+from app.connections.vertexai_client import (
+    LLMExecutor,
+    acall_structured_llm,
+    call_structured_llm,
+)
+
+CONCURRENT_GENERATIONS = 200
+LLM_LATENCY_S = 0.2
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class FakeModels:
+    """Blocking fake of `client.models` that waits LLM_LATENCY_S per call."""
+
+    def generate_content(self, **kwargs: object) -> SimpleNamespace:
+        time.sleep(LLM_LATENCY_S)
+        return SimpleNamespace(text='{"value": 1}')
+
+
+class FakeAsyncModels:
+    """Async fake of `client.aio.models` that waits LLM_LATENCY_S per call."""
+
+    async def generate_content(self, **kwargs: object) -> SimpleNamespace:
+        await asyncio.sleep(LLM_LATENCY_S)
+        return SimpleNamespace(text='{"value": 1}')
+
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS') == 'true', 'Benchmarks not enabled')
+class TestAsyncLLMThroughput(unittest.TestCase):
+    """Compare thread-per-call generations with asyncio generations on one event loop.
+
+    Both paths run CONCURRENT_GENERATIONS structured calls against a fake client that
+    injects LLM_LATENCY_S of latency, without any concurrency or rate limit in the way.
+    """
+
+    def setUp(self) -> None:
+        client = MagicMock()
+        client.models = FakeModels()
+        client.aio.models = FakeAsyncModels()
+        executor = LLMExecutor(
+            max_workers=1,
+            max_concurrency_per_model=CONCURRENT_GENERATIONS,
+            requests_per_minute=CONCURRENT_GENERATIONS * 600,
+        )
+        for target, value in (
+            ('ENABLE_AI', True),
+            ('vertexai_client', client),
+            ('llm_executor', executor),
+        ):
+            patcher = patch(f'app.connections.vertexai_client.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _measure_threads(self) -> tuple[float, int, int]:
+        tracemalloc.start()
+        peak_threads = 0
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=CONCURRENT_GENERATIONS) as pool:
+            futures = [
+                pool.submit(call_structured_llm, 'prompt', Answer)
+                for _ in range(CONCURRENT_GENERATIONS)
+            ]
+            peak_threads = threading.active_count()
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertEqual(len(results), CONCURRENT_GENERATIONS)
+        return CONCURRENT_GENERATIONS / elapsed, peak_memory, peak_threads
+
+    def _measure_asyncio(self) -> tuple[float, int, int]:
+        async def run() -> int:
+            results = await asyncio.gather(
+                *(acall_structured_llm('prompt', Answer) for _ in range(CONCURRENT_GENERATIONS))
+            )
+            self.assertEqual(len(results), CONCURRENT_GENERATIONS)
+            return threading.active_count()
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        peak_threads = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return CONCURRENT_GENERATIONS / elapsed, peak_memory, peak_threads
+
+    def test_async_generation_throughput_and_memory(self) -> None:
+        thread_rps, thread_memory, thread_count = self._measure_threads()
+        async_rps, async_memory, async_count = self._measure_asyncio()
+
+        print(
+            f'[async-llm] threads: {thread_rps:.1f} gen/s, {thread_memory / 1024:.0f} KiB peak, '
+            f'{thread_count} threads; asyncio: {async_rps:.1f} gen/s, '
+            f'{async_memory / 1024:.0f} KiB peak, {async_count} threads'
+        )
+        self.assertLess(async_count, thread_count)
+        # Both paths overlap all calls, so asyncio must not be slower than the thread pool
+        self.assertGreater(async_rps, thread_rps * 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
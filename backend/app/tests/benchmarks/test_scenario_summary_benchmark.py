@@ -0,0 +1,118 @@
+import os
+import time
+import unittest
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine
+
+from app.enums.feedback_status import FeedbackStatus
+from app.models import ConversationScenario, Session, SessionFeedback, UserProfile
+from app.services.conversation_scenario_service import ConversationScenarioService
+
+SESSION_COUNT = 1_000
+REPEATS = 5
+
+
+@unittest.skipUnless(os.environ.get('RUN_BENCHMARKS') == 'true', 'Benchmarks not enabled')
+class TestScenarioSummaryBenchmark(unittest.TestCase):
+    """Compare the SQL aggregate with lazily loading every session and feedback."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(cls.engine)
+
+        with DBSession(cls.engine) as db:
+            user = UserProfile(full_name='Bench', email='bench@example.com', phone_number='1')
+            scenario = ConversationScenario(
+                user_id=user.id,
+                custom_category_label='Bench',
+                persona_name='bench',
+                persona='',
+                situational_facts='',
+            )
+            db.add_all([user, scenario])
+            db.commit()
+            cls.user_id = user.id
+            cls.scenario_id = scenario.id
+
+            start = datetime(2025, 1, 1)
+            session_ids = [uuid4() for _ in range(SESSION_COUNT)]
+            db.exec(
+                insert(Session),
+                params=[
+                    {
+                        'id': session_id,
+                        'scenario_id': scenario.id,
+                        'started_at': start + timedelta(minutes=i),
+                    }
+                    for i, session_id in enumerate(session_ids)
+                ],
+            )
+            db.exec(
+                insert(SessionFeedback),
+                params=[
+                    {
+                        'id': uuid4(),
+                        'session_id': session_id,
+                        'overall_score': float(i % 5),
+                        'full_audio_filename': '',
+                        'speak_time_percent': 50.0,
+                        'questions_asked': 1,
+                        'session_length_s': 60,
+                        'status': FeedbackStatus.completed,
+                    }
+                    for i, session_id in enumerate(session_ids)
+                ],
+            )
+            db.commit()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.engine.dispose()
+
+    def _time(self, query: Callable[[DBSession], object]) -> float:
+        elapsed = 0.0
+        for _ in range(REPEATS):
+            # A fresh session per run so nothing is served from the identity map
+            with DBSession(self.engine) as db:
+                start = time.perf_counter()
+                query(db)
+                elapsed += time.perf_counter() - start
+        return elapsed / REPEATS * 1000
+
+    def _lazy_load_summary(self, db: DBSession) -> None:
+        # The previous implementation: walk the relationships and aggregate in Python
+        scenario = db.get(ConversationScenario, self.scenario_id)
+        scores = [
+            session.feedback.overall_score
+            for session in scenario.sessions
+            if session.feedback and session.feedback.status == FeedbackStatus.completed
+        ]
+        _ = sum(scores) / len(scores) if scores else None
+        _ = max((s.started_at for s in scenario.sessions if s.started_at), default=None)
+
+    def _aggregate_summary(self, db: DBSession) -> None:
+        user = db.get(UserProfile, self.user_id)
+        ConversationScenarioService(db).get_scenario_summary(self.scenario_id, user)
+
+    def test_scenario_summary(self) -> None:
+        lazy_ms = self._time(self._lazy_load_summary)
+        aggregate_ms = self._time(self._aggregate_summary)
+
+        print(
+            f'[scenario-summary] sessions={SESSION_COUNT} lazy load={lazy_ms:.2f}ms '
+            f'aggregate={aggregate_ms:.2f}ms'
+        )
+        self.assertLess(aggregate_ms, lazy_ms)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,11 +2,25 @@ from collections.abc import Generator
 
 import pytest
 
+from app.dependencies.auth import jwt_payload_cache, user_profile_cache
+from app.services.admin_dashboard_service import admin_dashboard_cache
+from app.services.app_config_service import app_config_cache
+from app.services.llm_response_cache import llm_response_cache
 from app.services.session_feedback.session_feedback_llm import load_session_feedback_config
 
 
 @pytest.fixture(autouse=True)
 def clear_config_cache() -> Generator[None]:
     load_session_feedback_config.cache_clear()
+    user_profile_cache.clear()
+    jwt_payload_cache.clear()
+    app_config_cache.invalidate()
+    admin_dashboard_cache.invalidate()
+    llm_response_cache.clear()
     yield
     load_session_feedback_config.cache_clear()
+    user_profile_cache.clear()
+    jwt_payload_cache.clear()
+    app_config_cache.invalidate()
+    admin_dashboard_cache.invalidate()
+    llm_response_cache.clear()
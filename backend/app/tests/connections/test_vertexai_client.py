@@ -0,0 +1,458 @@
+import asyncio
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+from google.genai import errors
+from pydantic import BaseModel
+
+from app.connections.vertexai_client import (
+    LLMExecutor,
+    ModelLimiterMetrics,
+    TokenBucket,
+    VertexContextCache,
+    acall_structured_llm,
+    call_structured_llm,
+)
+from app.services.llm_metrics import llm_metrics
+from app.services.llm_resilience import (
+    CircuitBreakerRegistry,
+    DeadlineExceededError,
+    LLMUnavailableError,
+    deadline_scope,
+    remaining_time,
+)
+from app.services.llm_response_cache import llm_response_cache
+
+
+def _client_error(code: int, status: str, message: str) -> errors.ClientError:
+    return errors.ClientError(code, {'error': {'code': code, 'status': status, 'message': message}})
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_is_served_immediately_then_rate_limited(self) -> None:
+        bucket = TokenBucket(rate=20, capacity=2)
+
+        start = time.monotonic()
+        bucket.acquire()
+        bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.04)
+
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_acquire_gives_up_before_the_deadline(self) -> None:
+        bucket = TokenBucket(rate=1, capacity=1)
+        self.assertTrue(bucket.acquire(time.monotonic()))
+
+        with patch('app.connections.vertexai_client.time.sleep') as sleep:
+            self.assertFalse(bucket.acquire(time.monotonic() + 0.5))
+        sleep.assert_not_called()
+
+
+class TestLLMExecutor(unittest.TestCase):
+    def test_model_concurrency_is_bounded(self) -> None:
+        executor = LLMExecutor(max_workers=8, max_concurrency_per_model=2, requests_per_minute=6000)
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def call_model() -> None:
+            nonlocal in_flight, peak
+            with executor.model_slot('gemini'):
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        futures = [executor.submit(call_model) for _ in range(8)]
+        for future in futures:
+            future.result()
+
+        self.assertEqual(peak, 2)
+
+    def test_tasks_inherit_the_deadline_of_the_submitter(self) -> None:
+        executor = LLMExecutor(max_workers=1, max_concurrency_per_model=1, requests_per_minute=6000)
+        with deadline_scope(30.0):
+            future = executor.submit(remaining_time)
+
+        self.assertGreater(future.result(), 0)
+        self.assertIsNone(executor.submit(remaining_time).result())
+        self.assertEqual(executor.get_metrics().models['gemini'], ModelLimiterMetrics(0, 0))
+
+    def test_queue_depth_is_tracked(self) -> None:
+        executor = LLMExecutor(max_workers=1, max_concurrency_per_model=1, requests_per_minute=60)
+        release = threading.Event()
+
+        futures = [executor.submit(release.wait, 5) for _ in range(3)]
+        time.sleep(0.05)
+        metrics = executor.get_metrics()
+        self.assertEqual((metrics.queued, metrics.running), (2, 1))
+
+        release.set()
+        for future in futures:
+            future.result()
+        metrics = executor.get_metrics()
+        self.assertEqual((metrics.queued, metrics.running), (0, 0))
+
+    def test_failing_task_releases_model_slot(self) -> None:
+        executor = LLMExecutor(max_workers=2, max_concurrency_per_model=1, requests_per_minute=6000)
+
+        def failing_call() -> None:
+            with executor.model_slot('gemini'):
+                raise RuntimeError('429')
+
+        with self.assertRaises(RuntimeError):
+            executor.submit(failing_call).result()
+
+        metrics = executor.get_metrics()
+        self.assertEqual(metrics.running, 0)
+        self.assertEqual(metrics.models['gemini'], ModelLimiterMetrics(0, 0))
+        with executor.model_slot('gemini'):
+            pass
+
+    def test_rate_limit_is_applied_per_model(self) -> None:
+        executor = LLMExecutor(max_workers=2, max_concurrency_per_model=1, requests_per_minute=60)
+
+        with patch('app.connections.vertexai_client.time.sleep') as sleep:
+            with executor.model_slot('gemini'):
+                pass
+            with executor.model_slot('gemini-lite'):
+                pass
+            sleep.assert_not_called()
+
+    def test_async_slots_share_the_model_limit(self) -> None:
+        executor = LLMExecutor(max_workers=1, max_concurrency_per_model=2, requests_per_minute=6000)
+        in_flight = 0
+        peak = 0
+
+        async def call_model() -> None:
+            nonlocal in_flight, peak
+            async with executor.amodel_slot('gemini'):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.02)
+                in_flight -= 1
+
+        async def run() -> None:
+            await asyncio.gather(*(call_model() for _ in range(6)))
+
+        # A sync caller holds one of the two slots, so the async calls run one at a time
+        with executor.model_slot('gemini'):
+            asyncio.run(run())
+
+        self.assertEqual(peak, 1)
+        self.assertEqual(executor.get_metrics().models['gemini'], ModelLimiterMetrics(0, 0))
+
+
+class TestAsyncStructuredLLM(unittest.TestCase):
+    def test_mock_response_when_ai_is_disabled(self) -> None:
+        with patch('app.connections.vertexai_client.ENABLE_AI', False):
+            result = asyncio.run(
+                acall_structured_llm('prompt', Answer, mock_response=Answer(value=1))
+            )
+            self.assertEqual(result, Answer(value=1))
+
+            with self.assertRaises(ValueError):
+                asyncio.run(acall_structured_llm('prompt', Answer))
+
+    def test_response_is_parsed(self) -> None:
+        client = MagicMock()
+        client.aio.models.generate_content = AsyncMock(
+            return_value=SimpleNamespace(text='{"value": 42}')
+        )
+
+        with (
+            patch('app.connections.vertexai_client.ENABLE_AI', True),
+            patch('app.connections.vertexai_client.vertexai_client', client),
+        ):
+            result = asyncio.run(acall_structured_llm('prompt', Answer, system_prompt='system'))
+
+        self.assertEqual(result, Answer(value=42))
+        client.models.generate_content.assert_not_called()
+        call = client.aio.models.generate_content.await_args
+        self.assertEqual(call.kwargs['contents'], ['prompt'])
+        self.assertEqual(call.kwargs['config'].system_instruction, 'system')
+
+    def test_empty_response_raises(self) -> None:
+        client = MagicMock()
+        client.aio.models.generate_content = AsyncMock(return_value=SimpleNamespace(text=''))
+
+        with (
+            patch('app.connections.vertexai_client.ENABLE_AI', True),
+            patch('app.connections.vertexai_client.vertexai_client', client),
+            self.assertRaises(ValueError),
+        ):
+            asyncio.run(acall_structured_llm('prompt', Answer))
+
+
+class TestStructuredLLMResponseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.models.generate_content.return_value = SimpleNamespace(text='{"value": 7}')
+        self.client.aio.models.generate_content = AsyncMock(
+            return_value=SimpleNamespace(text='{"value": 7}')
+        )
+        for target, value in (('ENABLE_AI', True), ('vertexai_client', self.client)):
+            patcher = patch(f'app.connections.vertexai_client.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_repeated_call_skips_the_network(self) -> None:
+        for _ in range(3):
+            result = call_structured_llm('prompt', Answer, temperature=0.0, cache=True)
+            self.assertEqual(result, Answer(value=7))
+
+        self.client.models.generate_content.assert_called_once()
+        self.assertEqual((llm_response_cache.hits, llm_response_cache.misses), (2, 1))
+
+    def test_async_call_shares_the_cache(self) -> None:
+        call_structured_llm('prompt', Answer, temperature=0.0, cache=True)
+        result = asyncio.run(acall_structured_llm('prompt', Answer, temperature=0.0, cache=True))
+
+        self.assertEqual(result, Answer(value=7))
+        self.client.aio.models.generate_content.assert_not_called()
+
+    def test_calls_are_not_cached_by_default(self) -> None:
+        call_structured_llm('prompt', Answer, temperature=0.0)
+        call_structured_llm('prompt', Answer, temperature=0.0)
+
+        self.assertEqual(self.client.models.generate_content.call_count, 2)
+
+    def test_unparseable_response_is_not_cached(self) -> None:
+        self.client.models.generate_content.return_value = SimpleNamespace(text='not json')
+        with self.assertRaises(ValueError):
+            call_structured_llm('prompt', Answer, temperature=0.0, cache=True)
+
+        self.client.models.generate_content.return_value = SimpleNamespace(text='{"value": 7}')
+        self.assertEqual(
+            call_structured_llm('prompt', Answer, temperature=0.0, cache=True), Answer(value=7)
+        )
+        self.assertEqual(self.client.models.generate_content.call_count, 2)
+
+    def test_calls_and_cache_hits_are_recorded_per_operation(self) -> None:
+        llm_metrics.reset()
+        self.addCleanup(llm_metrics.reset)
+        self.client.models.generate_content.return_value = SimpleNamespace(
+            text='{"value": 7}',
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=120, cached_content_token_count=None, candidates_token_count=8
+            ),
+        )
+
+        for _ in range(2):
+            call_structured_llm('prompt', Answer, temperature=0.0, cache=True, operation='scoring')
+
+        ((operation, _), stats), *_ = llm_metrics.get_stats().items()
+        self.assertEqual(operation, 'scoring')
+        self.assertEqual((stats.calls, stats.cache_hits, stats.failures), (1, 1, 0))
+        self.assertEqual((stats.input_tokens, stats.output_tokens), (120, 8))
+
+
+class TestStructuredLLMResilience(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.models.generate_content.return_value = SimpleNamespace(text='{"value": 7}')
+        self.breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=30.0)
+        for target, value in (
+            ('ENABLE_AI', True),
+            ('vertexai_client', self.client),
+            ('circuit_breakers', self.breakers),
+        ):
+            patcher = patch(f'app.connections.vertexai_client.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_request_timeout_is_bounded_by_the_deadline(self) -> None:
+        with deadline_scope(10.0):
+            call_structured_llm('prompt', Answer)
+
+        config = self.client.models.generate_content.call_args.kwargs['config']
+        self.assertLessEqual(config.http_options.timeout, 10_000)
+        self.assertGreater(config.http_options.timeout, 0)
+
+    def test_open_circuit_fails_fast(self) -> None:
+        self.client.models.generate_content.side_effect = RuntimeError('503 unavailable')
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                call_structured_llm('prompt', Answer)
+
+        with self.assertRaises(LLMUnavailableError):
+            call_structured_llm('prompt', Answer)
+        self.assertEqual(self.client.models.generate_content.call_count, 2)
+
+    def test_unparseable_response_does_not_open_the_circuit(self) -> None:
+        self.client.models.generate_content.return_value = SimpleNamespace(text='not json')
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                call_structured_llm('prompt', Answer)
+
+        self.assertEqual(set(self.breakers.get_states().values()), {'closed'})
+
+    def test_timeouts_under_a_short_deadline_do_not_open_the_circuit(self) -> None:
+        self.client.models.generate_content.side_effect = httpx.ReadTimeout('read timed out')
+        for _ in range(3):
+            with deadline_scope(5.0), self.assertRaises(DeadlineExceededError):
+                call_structured_llm('prompt', Answer, operation='live_feedback')
+
+        self.assertEqual(set(self.breakers.get_states().values()), {'closed'})
+
+        for _ in range(2):
+            with self.assertRaises(httpx.ReadTimeout):
+                call_structured_llm('prompt', Answer, operation='scoring')
+        self.assertEqual(set(self.breakers.get_states().values()), {'open'})
+
+    def _use_executor(self) -> LLMExecutor:
+        executor = LLMExecutor(max_workers=1, max_concurrency_per_model=1, requests_per_minute=6000)
+        for target, value in (('llm_executor', executor), ('FORCE_CHEAP_MODEL', False)):
+            patcher = patch(f'app.connections.vertexai_client.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return executor
+
+    def test_saturated_model_gives_up_at_the_deadline(self) -> None:
+        executor = self._use_executor()
+
+        with executor.model_slot('gemini'):
+            start = time.monotonic()
+            with deadline_scope(0.1), self.assertRaises(DeadlineExceededError):
+                call_structured_llm('prompt', Answer, model='gemini')
+            self.assertLess(time.monotonic() - start, 1)
+
+        self.client.models.generate_content.assert_not_called()
+        self.assertEqual(set(self.breakers.get_states().values()), {'closed'})
+        self.assertEqual(executor.get_metrics().models['gemini'], ModelLimiterMetrics(0, 0))
+
+    def test_timeout_is_taken_once_the_slot_is_held(self) -> None:
+        executor = self._use_executor()
+
+        with deadline_scope(10.0):
+            with executor.model_slot('gemini'):
+                future = executor.submit(call_structured_llm, 'prompt', Answer, model='gemini')
+                time.sleep(0.5)
+            future.result()
+
+        config = self.client.models.generate_content.call_args.kwargs['config']
+        self.assertLessEqual(config.http_options.timeout, 9_500)
+
+
+class TestVertexContextCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = MagicMock()
+        self.client.models.count_tokens.return_value = SimpleNamespace(total_tokens=5_000)
+        self.client.caches.create.return_value = SimpleNamespace(name='cachedContents/1')
+        self.client.models.generate_content.return_value = SimpleNamespace(text='{"value": 7}')
+        self.context_cache = VertexContextCache(enabled=True, ttl=3_600, min_tokens=2_048)
+        for target, value in (
+            ('ENABLE_AI', True),
+            ('vertexai_client', self.client),
+            ('vertex_context_cache', self.context_cache),
+        ):
+            patcher = patch(f'app.connections.vertexai_client.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_registered_prompt_is_referenced_by_handle(self) -> None:
+        self.context_cache.register('static rubric')
+        self.context_cache.refresh()
+        self.context_cache.refresh()
+
+        self.client.caches.create.assert_called_once()
+        self.assertEqual(call_structured_llm('prompt', Answer, 'static rubric'), Answer(value=7))
+        config = self.client.models.generate_content.call_args.kwargs['config']
+        self.assertEqual(config.cached_content, 'cachedContents/1')
+        self.assertIsNone(config.system_instruction)
+
+    def test_small_and_unregistered_prompts_are_sent_inline(self) -> None:
+        self.client.models.count_tokens.return_value = SimpleNamespace(total_tokens=100)
+        self.context_cache.register('short prompt')
+        self.context_cache.refresh()
+        self.context_cache.refresh()
+
+        self.client.models.count_tokens.assert_called_once()
+        self.client.caches.create.assert_not_called()
+        for system_prompt in ('short prompt', 'unregistered prompt'):
+            call_structured_llm('prompt', Answer, system_prompt)
+            config = self.client.models.generate_content.call_args.kwargs['config']
+            self.assertEqual(config.system_instruction, system_prompt)
+            self.assertIsNone(config.cached_content)
+
+    def test_rejected_handle_falls_back_to_inline_prompt(self) -> None:
+        self.context_cache.register('static rubric')
+        self.context_cache.refresh()
+        self.client.models.generate_content.side_effect = [
+            _client_error(404, 'NOT_FOUND', 'Cached content cachedContents/1 not found.'),
+            SimpleNamespace(text='{"value": 7}'),
+        ]
+
+        self.assertEqual(call_structured_llm('prompt', Answer, 'static rubric'), Answer(value=7))
+        call = self.client.models.generate_content.call_args
+        self.assertEqual(call.kwargs['config'].system_instruction, 'static rubric')
+        self.assertIsNone(self.context_cache.get_handle(call.kwargs['model'], 'static rubric'))
+
+        self.client.caches.delete.assert_called_once_with(name='cachedContents/1')
+
+        # The next refresh creates a new cached content
+        self.context_cache.refresh()
+        self.assertEqual(self.client.caches.create.call_count, 2)
+
+    def test_provider_errors_keep_the_handle(self) -> None:
+        self.context_cache.register('static rubric')
+        self.context_cache.refresh()
+        breakers = CircuitBreakerRegistry(failure_threshold=10, reset_timeout=30.0)
+        patcher = patch('app.connections.vertexai_client.circuit_breakers', breakers)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for error in (
+            _client_error(429, 'RESOURCE_EXHAUSTED', 'Quota exceeded.'),
+            errors.ServerError(503, {'error': {'code': 503, 'status': 'UNAVAILABLE'}}),
+            TimeoutError('read timed out'),
+        ):
+            self.client.models.generate_content.side_effect = error
+            with self.assertRaises(type(error)):
+                call_structured_llm('prompt', Answer, 'static rubric')
+
+            call = self.client.models.generate_content.call_args
+            self.assertEqual(call.kwargs['config'].cached_content, 'cachedContents/1')
+            self.assertEqual(
+                self.context_cache.get_handle(call.kwargs['model'], 'static rubric'),
+                'cachedContents/1',
+            )
+        self.assertEqual(self.client.models.generate_content.call_count, 3)
+        self.client.caches.delete.assert_not_called()
+
+    def test_handles_are_extended_before_expiry(self) -> None:
+        self.context_cache.register('static rubric')
+        self.context_cache.refresh()
+
+        with patch(
+            'app.connections.vertexai_client.time.monotonic', return_value=time.monotonic() + 3_000
+        ):
+            self.context_cache.refresh()
+
+        self.client.caches.update.assert_called_once()
+        self.assertEqual(self.client.caches.update.call_args.kwargs['name'], 'cachedContents/1')
+
+    def test_clear_deletes_cached_contents(self) -> None:
+        self.context_cache.register('static rubric')
+        self.context_cache.refresh()
+
+        self.context_cache.clear()
+
+        self.client.caches.delete.assert_called_once_with(name='cachedContents/1')
+        call_structured_llm('prompt', Answer, 'static rubric')
+        config = self.client.models.generate_content.call_args.kwargs['config']
+        self.assertEqual(config.system_instruction, 'static rubric')
+
+
+if __name__ == '__main__':
+    unittest.main()
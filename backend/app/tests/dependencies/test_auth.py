@@ -0,0 +1,258 @@
+import hashlib
+import time
+import unittest
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import jwt
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event, update
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, col, create_engine
+
+from app.data import get_dummy_user_data
+from app.dependencies import auth
+from app.dependencies.auth import (
+    JWTPayload,
+    jwt_payload_cache,
+    require_admin,
+    require_metrics_token,
+    require_user,
+    user_profile_cache,
+    verify_jwt,
+)
+from app.enums.account_role import AccountRole
+from app.models import UserProfile
+
+
+class TestRequireUser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+
+        user = get_dummy_user_data()[0].user_profile
+        with DBSession(self.engine) as db:
+            db.add(user)
+            db.commit()
+            self.user_id = user.id
+            self.email = user.email
+        self.token = JWTPayload(sub=str(self.user_id))
+        self.statements: list[str] = []
+        user_profile_cache.clear()
+
+    def tearDown(self) -> None:
+        user_profile_cache.clear()
+        self.engine.dispose()
+
+    def _record_statements(self) -> None:
+        def before_cursor_execute(*args: object) -> None:
+            self.statements.append(str(args[2]))
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        self.addCleanup(event.remove, self.engine, 'before_cursor_execute', before_cursor_execute)
+
+    def _request(self) -> SimpleNamespace:
+        return SimpleNamespace(state=SimpleNamespace(timezone='UTC'))
+
+    def _set_user_columns(self, **values: object) -> None:
+        with DBSession(self.engine) as db:
+            db.exec(update(UserProfile).where(col(UserProfile.id) == self.user_id).values(**values))
+            db.commit()
+        user_profile_cache.clear()
+
+    def _load_user(self) -> UserProfile:
+        with DBSession(self.engine) as db:
+            return db.get(UserProfile, self.user_id)
+
+    def test_cached_profile_reads_only_fresh_columns(self) -> None:
+        with DBSession(self.engine) as db:
+            require_user(self.token, db, self._request())
+
+        self._record_statements()
+        with DBSession(self.engine) as db:
+            user = require_user(self.token, db, self._request())
+            self.assertEqual(user.id, self.user_id)
+            self.assertEqual(user.email, self.email)
+            self.assertIs(db.get(UserProfile, self.user_id), user)
+
+        self.assertEqual(len(self.statements), 1)
+        self.assertIn('userprofile.sessions_created_today', self.statements[0])
+        self.assertNotIn('userprofile.email', self.statements[0])
+        self.assertEqual(user_profile_cache.hits, 1)
+
+    def test_quota_and_role_are_not_served_from_the_cache(self) -> None:
+        with DBSession(self.engine) as db:
+            require_user(self.token, db, self._request())
+
+        # Another worker changes the columns, so this worker's cache is not evicted
+        with self.engine.begin() as connection:
+            connection.execute(
+                update(UserProfile)
+                .where(col(UserProfile.id) == self.user_id)
+                .values(
+                    sessions_created_today=5,
+                    last_session_date=datetime.now(UTC).date(),
+                    account_role=AccountRole.admin,
+                )
+            )
+
+        with DBSession(self.engine) as db:
+            user = require_admin(self.token, db, self._request())
+            self.assertEqual(user.sessions_created_today, 5)
+        self.assertEqual(user_profile_cache.hits, 1)
+
+    def test_profile_is_shared_within_a_request(self) -> None:
+        self._record_statements()
+        request = self._request()
+        with DBSession(self.engine) as db:
+            first = require_user(self.token, db, request)
+            second = require_user(self.token, db, request)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_new_day_is_written_with_one_update(self) -> None:
+        yesterday = datetime.now(UTC) - timedelta(days=1)
+        self._set_user_columns(
+            last_logged_in=yesterday,
+            current_streak_days=4,
+            sessions_created_today=3,
+            last_session_date=yesterday.date(),
+        )
+
+        self._record_statements()
+        with DBSession(self.engine) as db:
+            user = require_user(self.token, db, self._request())
+            self.assertEqual(user.current_streak_days, 5)
+            self.assertEqual(user.sessions_created_today, 0)
+
+        # One SELECT for the profile and one UPDATE for streak and daily counter
+        self.assertEqual(len(self.statements), 2)
+        self.assertTrue(self.statements[1].startswith('UPDATE userprofile'))
+
+        stored = self._load_user()
+        self.assertEqual(stored.current_streak_days, 5)
+        self.assertEqual(stored.sessions_created_today, 0)
+        self.assertEqual(stored.last_session_date, datetime.now(UTC).date())
+
+    def test_daily_reset_keeps_concurrent_increment(self) -> None:
+        yesterday = datetime.now(UTC) - timedelta(days=1)
+        # Another request already reset the counter and started a session today, while this
+        # process still has yesterday's values cached
+        self._set_user_columns(sessions_created_today=1)
+        with DBSession(self.engine) as db:
+            require_user(self.token, db, self._request())
+        stale = user_profile_cache.get(self.user_id) | {
+            'last_session_date': yesterday.date(),
+            'sessions_created_today': 3,
+        }
+        user_profile_cache.set(self.user_id, stale)
+
+        with DBSession(self.engine) as db:
+            user = require_user(self.token, db, self._request())
+            self.assertEqual(user.sessions_created_today, 1)
+
+        self.assertEqual(self._load_user().sessions_created_today, 1)
+
+    def test_orm_update_evicts_cached_profile(self) -> None:
+        with DBSession(self.engine) as db:
+            user = require_user(self.token, db, self._request())
+            user.full_name = 'Renamed'
+            db.add(user)
+            db.commit()
+
+        self.assertEqual(len(user_profile_cache), 0)
+        with DBSession(self.engine) as db:
+            self.assertEqual(require_user(self.token, db, self._request()).full_name, 'Renamed')
+
+    def test_cached_profile_still_checks_admin_role(self) -> None:
+        with DBSession(self.engine) as db:
+            require_user(self.token, db, self._request())
+
+        with DBSession(self.engine) as db, self.assertRaises(HTTPException) as ctx:
+            require_admin(self.token, db, self._request())
+        self.assertEqual(ctx.exception.status_code, 403)
+
+
+class TestVerifyJwt(unittest.TestCase):
+    def setUp(self) -> None:
+        settings_patch = patch.object(auth.settings, 'DEV_MODE_SKIP_AUTH', False)
+        settings_patch.start()
+        self.addCleanup(settings_patch.stop)
+        jwt_payload_cache.clear()
+        self.addCleanup(jwt_payload_cache.clear)
+
+    def _credentials(self, exp: float) -> HTTPAuthorizationCredentials:
+        token = jwt.encode(
+            {'sub': 'user-id', 'aud': 'authenticated', 'exp': int(exp)},
+            auth.settings.SUPABASE_JWT_SECRET,
+            algorithm='HS256',
+        )
+        return HTTPAuthorizationCredentials(scheme='Bearer', credentials=token)
+
+    def test_verified_token_is_cached(self) -> None:
+        credentials = self._credentials(time.time() + 3600)
+
+        with patch.object(auth.jwt, 'decode', wraps=jwt.decode) as decode:
+            first = verify_jwt(credentials)
+            second = verify_jwt(credentials)
+
+        self.assertEqual(first, second)
+        self.assertEqual(second['sub'], 'user-id')
+        decode.assert_called_once()
+        self.assertEqual((jwt_payload_cache.hits, jwt_payload_cache.misses), (1, 1))
+        self.assertEqual(jwt_payload_cache.hit_rate, 0.5)
+
+    def test_cached_token_expires_with_exp(self) -> None:
+        credentials = self._credentials(time.time() + 3600)
+        verify_jwt(credentials)
+        token_hash = hashlib.sha256(credentials.credentials.encode()).hexdigest()
+        self.assertIsNotNone(jwt_payload_cache.get(token_hash))
+
+        # Pretend the token's lifetime has passed
+        with patch('app.services.ttl_cache.time.monotonic', return_value=time.monotonic() + 3601):
+            self.assertIsNone(jwt_payload_cache.get(token_hash))
+
+    def test_invalid_token_is_not_cached(self) -> None:
+        credentials = HTTPAuthorizationCredentials(scheme='Bearer', credentials='not-a-jwt')
+
+        for _ in range(2):
+            with self.assertRaises(HTTPException) as ctx:
+                verify_jwt(credentials)
+            self.assertEqual(ctx.exception.status_code, 401)
+        self.assertEqual(len(jwt_payload_cache), 0)
+
+
+class TestRequireMetricsToken(unittest.TestCase):
+    def test_endpoint_is_hidden_without_configured_token(self) -> None:
+        credentials = HTTPAuthorizationCredentials(scheme='Bearer', credentials='secret')
+
+        with (
+            patch.object(auth.settings, 'METRICS_TOKEN', None),
+            self.assertRaises(HTTPException) as ctx,
+        ):
+            require_metrics_token(credentials)
+        self.assertEqual(ctx.exception.status_code, 404)
+
+    def test_token_must_match(self) -> None:
+        with patch.object(auth.settings, 'METRICS_TOKEN', 'secret'):
+            require_metrics_token(
+                HTTPAuthorizationCredentials(scheme='Bearer', credentials='secret')
+            )
+
+            for credentials in (
+                None,
+                HTTPAuthorizationCredentials(scheme='Bearer', credentials='wrong'),
+            ):
+                with self.assertRaises(HTTPException) as ctx:
+                    require_metrics_token(credentials)
+                self.assertEqual(ctx.exception.status_code, 401)
+
+
+if __name__ == '__main__':
+    unittest.main()
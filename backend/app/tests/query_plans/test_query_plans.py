@@ -0,0 +1,258 @@
+import os
+import unittest
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy import event, insert, text
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, col, create_engine, select
+
+from app.data import get_dummy_conversation_categories
+from app.enums.feedback_status import FeedbackStatus
+from app.enums.speaker import SpeakerType
+from app.models import (
+    ConversationScenario,
+    Review,
+    Session,
+    SessionFeedback,
+    SessionTurn,
+    UserProfile,
+)
+from app.models.live_feedback_model import LiveFeedback
+from app.services.conversation_scenario_service import ConversationScenarioService
+from app.services.data_retention_service import cleanup_old_session_turns
+from app.services.live_feedback_service import fetch_live_feedback_for_session
+from app.services.review_service import ReviewService
+from app.services.session_service import SessionService
+from app.services.session_turn_service import SessionTurnService
+
+QUERY_PLAN_DATABASE_URL = os.environ.get('QUERY_PLAN_DATABASE_URL', '')
+USERS = 20
+SCENARIOS_PER_USER = 10
+SESSIONS_PER_SCENARIO = 5
+TURNS_PER_SESSION = 10
+
+
+@unittest.skipUnless(QUERY_PLAN_DATABASE_URL, 'QUERY_PLAN_DATABASE_URL not set')
+class TestQueryPlans(unittest.TestCase):
+    """Fail when a hot-path service query can no longer be served by an index.
+
+    The database is seeded and analyzed once, then every statement a service method
+    issues is captured and re-run with EXPLAIN. Sequential scans are disabled for the
+    session, so any remaining Seq Scan node means no usable index exists.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = create_engine(QUERY_PLAN_DATABASE_URL)
+        SQLModel.metadata.drop_all(cls.engine)
+        SQLModel.metadata.create_all(cls.engine)
+
+        start = datetime(2025, 1, 1)
+        users, scenarios, sessions, feedback, turns, live_feedback, reviews = ([] for _ in range(7))
+        categories = get_dummy_conversation_categories()
+        for u in range(USERS):
+            user_id = uuid4()
+            users.append(
+                {
+                    'id': user_id,
+                    'full_name': f'User {u}',
+                    'email': f'user{u}@example.com',
+                    'phone_number': str(u),
+                }
+            )
+            for s in range(SCENARIOS_PER_USER):
+                scenario_id = uuid4()
+                scenarios.append(
+                    {
+                        'id': scenario_id,
+                        'user_id': user_id,
+                        'category_id': categories[s % len(categories)].id,
+                        'persona_name': 'persona',
+                        'persona': '',
+                        'situational_facts': '',
+                    }
+                )
+                for n in range(SESSIONS_PER_SCENARIO):
+                    session_id = uuid4()
+                    created_at = start + timedelta(minutes=len(sessions))
+                    sessions.append(
+                        {
+                            'id': session_id,
+                            'scenario_id': scenario_id,
+                            'started_at': created_at,
+                            'created_at': created_at,
+                            'updated_at': created_at,
+                        }
+                    )
+                    feedback.append(
+                        {
+                            'id': uuid4(),
+                            'session_id': session_id,
+                            'overall_score': float(n),
+                            'full_audio_filename': '',
+                            'speak_time_percent': 50.0,
+                            'questions_asked': 1,
+                            'session_length_s': 60,
+                            'status': FeedbackStatus.completed,
+                        }
+                    )
+                    live_feedback.append(
+                        {
+                            'id': uuid4(),
+                            'session_id': session_id,
+                            'heading': 'Tone',
+                            'feedback_text': 'Speak calmly.',
+                            'created_at': created_at,
+                        }
+                    )
+                    reviews.append(
+                        {
+                            'id': uuid4(),
+                            'user_id': user_id,
+                            'session_id': session_id,
+                            'rating': 5,
+                            'comment': '',
+                            'created_at': created_at,
+                        }
+                    )
+                    turns.extend(
+                        {
+                            'id': uuid4(),
+                            'session_id': session_id,
+                            'speaker': SpeakerType.user,
+                            'start_offset_ms': t * 1000,
+                            'end_offset_ms': t * 1000 + 900,
+                            'full_audio_start_offset_ms': t * 1000,
+                            'text': '',
+                            'audio_uri': '',
+                            'created_at': datetime.now(),
+                        }
+                        for t in range(TURNS_PER_SESSION)
+                    )
+
+        with DBSession(cls.engine) as db:
+            db.add_all(categories)
+            db.commit()
+            for model, rows in (
+                (UserProfile, users),
+                (ConversationScenario, scenarios),
+                (Session, sessions),
+                (SessionFeedback, feedback),
+                (SessionTurn, turns),
+                (LiveFeedback, live_feedback),
+                (Review, reviews),
+            ):
+                db.exec(insert(model), params=rows)
+            db.commit()
+        with cls.engine.connect() as connection:
+            connection.execution_options(isolation_level='AUTOCOMMIT').execute(text('ANALYZE'))
+
+        cls.user_id = users[0]['id']
+        cls.session_id = sessions[0]['id']
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        SQLModel.metadata.drop_all(cls.engine)
+        cls.engine.dispose()
+
+    def setUp(self) -> None:
+        self.db = DBSession(self.engine)
+        self.user = self.db.get(UserProfile, self.user_id)
+        self.gcs_patch = patch('app.connections.gcs_client._gcs_audio_manager', new=MagicMock())
+        self.gcs_patch.start()
+
+    def tearDown(self) -> None:
+        self.gcs_patch.stop()
+        self.db.close()
+
+    def _capture(self, call: Callable[[], Any]) -> list[tuple[str, Any]]:
+        statements = []
+
+        def before_cursor_execute(
+            conn: Any,  # noqa: ANN401
+            cursor: Any,  # noqa: ANN401
+            statement: str,
+            parameters: Any,  # noqa: ANN401
+            *args: Any,  # noqa: ANN401
+        ) -> None:
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append((statement, parameters))
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            call()
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+        return statements
+
+    def _seq_scans(self, plan: dict) -> list[str]:
+        scans = [plan['Relation Name']] if plan['Node Type'] == 'Seq Scan' else []
+        for child in plan.get('Plans', []):
+            scans.extend(self._seq_scans(child))
+        return scans
+
+    def assert_uses_indexes(self, call: Callable[[], Any]) -> None:
+        statements = self._capture(call)
+        self.assertTrue(statements, 'No SELECT statement was captured')
+
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql('SET enable_seqscan = off')
+            for statement, parameters in statements:
+                plan = connection.exec_driver_sql(
+                    f'EXPLAIN (FORMAT JSON) {statement}', parameters
+                ).scalar_one()[0]['Plan']
+                seq_scans = self._seq_scans(plan)
+                self.assertEqual(
+                    seq_scans, [], f'Sequential scan on {seq_scans} for query:\n{statement}'
+                )
+            connection.rollback()
+
+    def test_paginated_sessions(self) -> None:
+        service = SessionService(self.db)
+        self.assert_uses_indexes(lambda: service.fetch_paginated_sessions(self.user, 1, 10))
+
+    def test_scenario_summaries(self) -> None:
+        service = ConversationScenarioService(self.db)
+        self.assert_uses_indexes(lambda: service.list_scenarios_summary(self.user))
+
+    def test_session_turns_by_stitched_offset(self) -> None:
+        service = SessionTurnService(self.db)
+        self.assert_uses_indexes(lambda: service.get_session_turns(self.session_id))
+
+    def test_session_turns_by_start_offset(self) -> None:
+        # Same statement as the audio stitching read, which only runs with AI enabled
+        self.assert_uses_indexes(
+            lambda: self.db.exec(
+                select(SessionTurn.id, SessionTurn.audio_uri, SessionTurn.start_offset_ms)
+                .where(SessionTurn.session_id == self.session_id)
+                .order_by(col(SessionTurn.start_offset_ms))
+            ).all()
+        )
+
+    def test_live_feedback_history(self) -> None:
+        self.assert_uses_indexes(
+            lambda: fetch_live_feedback_for_session(self.db, self.session_id, 5)
+        )
+
+    def test_session_feedback_lookup(self) -> None:
+        service = SessionService(self.db)
+        self.assert_uses_indexes(
+            lambda: service.delete_full_audio_from_session_feedback(self.session_id)
+        )
+
+    def test_review_lookup(self) -> None:
+        service = ReviewService(self.db)
+        self.assert_uses_indexes(
+            lambda: service.has_user_reviewed_session(self.session_id, self.user_id)
+        )
+
+    def test_retention_cleanup_scan(self) -> None:
+        self.assert_uses_indexes(lambda: cleanup_old_session_turns(self.db))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool.impl import StaticPool
 from sqlmodel import Session as DBSession
@@ -18,10 +19,11 @@ from app.data.dummy_data import (
 from app.dependencies.auth import require_user
 from app.dependencies.database import get_db_session
 from app.enums.account_role import AccountRole
+from app.enums.feedback_status import FeedbackStatus
 from app.enums.session_status import SessionStatus
 from app.enums.speaker import SpeakerType
 from app.main import app
-from app.models import Review, Session, UserProfile
+from app.models import Review, Session, SessionFeedback, UserProfile
 from app.schemas.session_turn import SessionTurnRead
 
 
@@ -173,3 +175,75 @@ class TestSessionRoute(unittest.TestCase):
         self.assertEqual(data['updatedAt'], self.test_session.updated_at.isoformat())
         self.assertEqual(data['allowAdminAccess'], False)
         self.assertEqual(data['hasReviewed'], True)
+
+    def _count_statements(self, url: str) -> tuple[int, dict]:
+        statements = []
+
+        def before_cursor_execute(*args: object) -> None:
+            statements.append(args[2])
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = self.client.get(url)
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+        self.assertEqual(response.status_code, 200)
+        return len(statements), response.json()
+
+    def test_get_sessions_statement_count_is_constant(self) -> None:
+        for _ in range(9):
+            session = Session(
+                id=uuid4(),
+                scenario_id=self.test_session.scenario_id,
+                ended_at=datetime.now(),
+                status=SessionStatus.completed,
+            )
+            feedback = SessionFeedback(
+                session_id=session.id,
+                scores={'structure': 4, 'empathy': 5, 'focus': 4, 'clarity': 4},
+                overall_score=17,
+                full_audio_filename=f'{session.id}.mp3',
+                speak_time_percent=60.5,
+                questions_asked=5,
+                session_length_s=1800,
+                status=FeedbackStatus.completed,
+            )
+            self.db.add_all([session, feedback])
+        self.db.commit()
+        # Refresh the expired user profile so it does not count towards the first request
+        self.db.refresh(self.test_user)
+
+        small_page_count, small_page = self._count_statements('/sessions?page=1&page_size=1')
+        full_page_count, full_page = self._count_statements('/sessions?page=1&page_size=10')
+
+        self.assertEqual(len(small_page['sessions']), 1)
+        self.assertEqual(len(full_page['sessions']), 10)
+        self.assertEqual(full_page['totalSessions'], 10)
+        self.assertEqual(small_page_count, full_page_count)
+        # scenario ids, count and the joined page query
+        self.assertLessEqual(full_page_count, 3)
+
+        scored = [item for item in full_page['sessions'] if item['overallScore'] != -1]
+        self.assertEqual(len(scored), 9)
+        self.assertEqual(scored[0]['skills']['empathy'], 5)
+        self.assertEqual(scored[0]['sessionLengthS'], 1800)
+
+    def test_get_sessions_with_cursor(self) -> None:
+        for _ in range(4):
+            self.db.add(Session(id=uuid4(), scenario_id=self.test_session.scenario_id))
+        self.db.commit()
+
+        response = self.client.get('/sessions?page_size=2&include_total=false')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIsNone(data['totalSessions'])
+        seen = [item['sessionId'] for item in data['sessions']]
+        while data['nextCursor']:
+            response = self.client.get(f'/sessions?page_size=2&cursor={data["nextCursor"]}')
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            seen.extend(item['sessionId'] for item in data['sessions'])
+
+        all_sessions = self.client.get('/sessions?page_size=10').json()
+        self.assertEqual(all_sessions['totalSessions'], 5)
+        self.assertEqual(seen, [item['sessionId'] for item in all_sessions['sessions']])
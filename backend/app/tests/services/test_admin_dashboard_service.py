@@ -0,0 +1,160 @@
+import threading
+import unittest
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine
+
+from app.enums.config_type import ConfigType
+from app.models.app_config import AppConfig
+from app.models.user_profile import UserProfile
+from app.schemas.admin_dashboard_stats import AdminDashboardStatsRead
+from app.schemas.app_config import AppConfigCreate
+from app.services.admin_dashboard_service import (
+    AdminDashboardCache,
+    AdminDashboardService,
+    admin_dashboard_cache,
+)
+from app.services.admin_stats_service import AdminStatsService
+from app.services.app_config_service import AppConfigService
+
+
+def _stats(total_users: int) -> AdminDashboardStatsRead:
+    return AdminDashboardStatsRead(
+        total_users=total_users,
+        total_trainings=0,
+        total_reviews=0,
+        score_sum=0,
+        default_daily_session_limit=0,
+    )
+
+
+class TestAdminDashboardCache(unittest.TestCase):
+    def test_stale_payload_is_served_while_refreshing(self) -> None:
+        cache = AdminDashboardCache(ttl=0)
+        self.assertEqual(cache.get(lambda: _stats(1), MagicMock()).total_users, 1)
+
+        refresh_started = threading.Event()
+        release_refresh = threading.Event()
+
+        def refresh() -> AdminDashboardStatsRead:
+            refresh_started.set()
+            release_refresh.wait(5)
+            return _stats(2)
+
+        # Both reads get the stale payload and only one refresh is started
+        self.assertEqual(cache.get(MagicMock(), refresh).total_users, 1)
+        self.assertTrue(refresh_started.wait(5))
+        second_refresh = MagicMock()
+        self.assertEqual(cache.get(MagicMock(), second_refresh).total_users, 1)
+        second_refresh.assert_not_called()
+
+        with patch.object(cache, 'ttl', 60):
+            release_refresh.set()
+            for thread in threading.enumerate():
+                if thread.name == 'admin-dashboard-refresh':
+                    thread.join(5)
+            self.assertEqual(cache.get(MagicMock(), MagicMock()).total_users, 2)
+
+    def test_failed_refresh_keeps_stale_payload(self) -> None:
+        cache = AdminDashboardCache(ttl=0)
+        cache.get(lambda: _stats(1), MagicMock())
+
+        with patch.object(cache, '_store', wraps=cache._store) as store:
+            cache._refresh(MagicMock(side_effect=RuntimeError('db down')), cache.version)
+            store.assert_not_called()
+
+        self.assertEqual(cache.get(MagicMock(), MagicMock()).total_users, 1)
+
+    def test_refresh_racing_with_invalidation_is_not_stored(self) -> None:
+        cache = AdminDashboardCache(ttl=60)
+        version = cache.version
+        cache.invalidate()
+
+        cache._refresh(lambda: _stats(1), version)
+
+        self.assertEqual(cache.get(lambda: _stats(2), MagicMock()).total_users, 2)
+
+
+class TestAdminDashboardService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+        self.db = DBSession(self.engine)
+        self.db.add(AppConfig(key='defaultDailyUserSessionLimit', value='5', type=ConfigType.int))
+        self.db.add(UserProfile(id=uuid4(), full_name='Test', email='a@b.com', phone_number='1'))
+        self.db.commit()
+        AdminStatsService(self.db).increment(total_trainings=3, score_sum=30)
+        self.db.commit()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def _session_generator(self) -> Generator[DBSession]:
+        with DBSession(self.engine) as db:
+            yield db
+
+    def test_counts_are_served_from_cache(self) -> None:
+        service = AdminDashboardService(self.db, self._session_generator)
+        stats = service.get_admin_dashboard_stats()
+        self.assertEqual(
+            (stats.total_users, stats.total_trainings, stats.total_reviews, stats.score_sum),
+            (1, 3, 0, 30),
+        )
+
+        AdminStatsService(self.db).increment(total_trainings=1, score_sum=10)
+        self.db.commit()
+        self.assertEqual(service.get_admin_dashboard_stats().total_trainings, 3)
+
+        admin_dashboard_cache.invalidate()
+        self.assertEqual(service.get_admin_dashboard_stats().total_trainings, 4)
+
+    def test_background_refresh_uses_own_session(self) -> None:
+        service = AdminDashboardService(self.db, self._session_generator)
+        service.get_admin_dashboard_stats()
+        AdminStatsService(self.db).increment(total_trainings=1, score_sum=10)
+        self.db.commit()
+
+        with patch.object(admin_dashboard_cache, 'ttl', 0):
+            self.assertEqual(service.get_admin_dashboard_stats().total_trainings, 3)
+            for thread in threading.enumerate():
+                if thread.name == 'admin-dashboard-refresh':
+                    thread.join(5)
+
+        self.assertEqual(service.get_admin_dashboard_stats().total_trainings, 4)
+
+    def test_session_limit_is_not_cached(self) -> None:
+        service = AdminDashboardService(self.db)
+        self.assertEqual(service.get_admin_dashboard_stats().default_daily_session_limit, 5)
+
+        AppConfigService(self.db).update_existing_app_config(
+            AppConfigCreate(key='defaultDailyUserSessionLimit', value='7', type=ConfigType.int)
+        )
+
+        self.assertEqual(service.get_admin_dashboard_stats().default_daily_session_limit, 7)
+
+    def test_row_counts_use_pg_class_estimate_on_postgres(self) -> None:
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = 'postgresql'
+        db.execute.return_value.scalar.return_value = 1234
+
+        self.assertEqual(AdminDashboardService(db)._get_row_count(db, UserProfile), 1234)
+        db.exec.assert_not_called()
+
+    def test_row_counts_fall_back_to_count_without_estimate(self) -> None:
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = 'postgresql'
+        db.execute.return_value.scalar.return_value = -1
+        db.exec.return_value.one.return_value = 12
+
+        self.assertEqual(AdminDashboardService(db)._get_row_count(db, UserProfile), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine, func, select
+
+from app.models.admin_dashboard_stats import AdminDashboardStats
+from app.services.admin_dashboard_service import AdminDashboardService
+from app.services.admin_stats_service import ADMIN_STATS_SHARDS, AdminStatsService
+
+
+class TestAdminStatsService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+        self.db = DBSession(self.engine)
+        self.service = AdminStatsService(self.db)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def test_totals_without_rows(self) -> None:
+        self.assertEqual(self.service.get_totals(), (0, 0.0))
+
+    def test_increments_are_summed_over_shards(self) -> None:
+        for i in range(100):
+            self.service.increment(total_trainings=1, score_sum=float(i))
+        self.db.commit()
+
+        self.assertEqual(self.service.get_totals(), (100, 4950.0))
+        shard_rows = self.db.exec(select(func.count()).select_from(AdminDashboardStats)).one()
+        self.assertGreater(shard_rows, 1)
+        self.assertLessEqual(shard_rows, ADMIN_STATS_SHARDS)
+
+    def test_increment_of_existing_shard_is_a_single_upsert(self) -> None:
+        self.db.add(AdminDashboardStats(shard=3, total_trainings=345, score_sum=4140))
+        self.db.commit()
+
+        with patch('app.services.admin_stats_service.random.randrange', return_value=3):
+            self.service.increment(total_trainings=1, score_sum=12)
+        self.db.commit()
+
+        row = self.db.exec(select(AdminDashboardStats)).one()
+        self.assertEqual((row.total_trainings, row.score_sum), (346, 4152))
+
+    def test_increment_is_rolled_back_with_the_transaction(self) -> None:
+        self.service.increment(total_trainings=1, score_sum=5)
+        self.db.rollback()
+
+        self.assertEqual(self.service.get_totals(), (0, 0.0))
+
+    def test_dashboard_reports_shard_totals(self) -> None:
+        self.db.add(AdminDashboardStats(shard=0, total_trainings=345, score_sum=4140))
+        self.db.commit()
+        self.service.increment(total_trainings=2, score_sum=20)
+        self.db.commit()
+
+        stats = AdminDashboardService(self.db).get_admin_dashboard_stats()
+
+        self.assertEqual(stats.total_trainings, 347)
+        self.assertEqual(stats.score_sum, 4160)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine
+
+from app.enums.config_type import ConfigType
+from app.models.app_config import AppConfig
+from app.schemas.app_config import AppConfigCreate
+from app.services.app_config_service import (
+    AppConfigChangeListener,
+    AppConfigService,
+    app_config_cache,
+    start_app_config_listener,
+)
+
+
+class TestAppConfigService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+        self.db = DBSession(self.engine)
+        self.db.add(AppConfig(key='defaultDailyUserSessionLimit', value='5', type=ConfigType.int))
+        self.db.commit()
+        self.service = AppConfigService(self.db)
+        app_config_cache.invalidate()
+
+        self.statements: list[str] = []
+
+        def before_cursor_execute(*args: object) -> None:
+            self.statements.append(str(args[2]))
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        self.addCleanup(event.remove, self.engine, 'before_cursor_execute', before_cursor_execute)
+
+    def tearDown(self) -> None:
+        app_config_cache.invalidate()
+        self.db.close()
+        self.engine.dispose()
+
+    def _limit_config(self, value: str) -> AppConfigCreate:
+        return AppConfigCreate(key='defaultDailyUserSessionLimit', value=value, type=ConfigType.int)
+
+    def test_values_are_loaded_once(self) -> None:
+        for _ in range(3):
+            self.assertEqual(self.service.get_default_daily_session_limit(), 5)
+        self.assertIsNone(self.service.get_value('missing'))
+
+        # Another session reuses the values of the process-wide cache
+        with DBSession(self.engine) as other_db:
+            self.assertEqual(
+                AppConfigService(other_db).get_value('defaultDailyUserSessionLimit'), '5'
+            )
+
+        self.assertEqual(len(self.statements), 1)
+
+    def test_update_invalidates_cache(self) -> None:
+        self.assertEqual(self.service.get_default_daily_session_limit(), 5)
+
+        self.service.update_existing_app_config(self._limit_config('8'))
+
+        self.assertEqual(self.service.get_default_daily_session_limit(), 8)
+
+    def test_patch_invalidates_cache(self) -> None:
+        self.assertEqual(self.service.get_default_daily_session_limit(), 5)
+
+        self.service.patch_app_configs([self._limit_config('9')])
+
+        self.assertEqual(self.service.get_default_daily_session_limit(), 9)
+
+    def test_create_and_delete_invalidate_cache(self) -> None:
+        self.assertIsNone(self.service.get_value('feature'))
+
+        self.service.create_new_app_config(
+            AppConfigCreate(key='feature', value='true', type=ConfigType.boolean)
+        )
+        self.assertEqual(self.service.get_value('feature'), 'true')
+
+        self.service.delete_app_config_by_key('feature')
+        self.assertIsNone(self.service.get_value('feature'))
+
+    def test_failed_write_keeps_cached_values(self) -> None:
+        self.service.get_value('defaultDailyUserSessionLimit')
+        version = app_config_cache.version
+
+        with self.assertRaises(HTTPException):
+            self.service.update_existing_app_config(self._limit_config('not-a-number'))
+
+        self.assertEqual(app_config_cache.version, version)
+
+    def test_load_racing_with_invalidation_is_not_stored(self) -> None:
+        original_exec = self.db.exec
+
+        def exec_and_invalidate(*args: object, **kwargs: object) -> object:
+            result = original_exec(*args, **kwargs)
+            app_config_cache.invalidate()
+            return result
+
+        with patch.object(self.db, 'exec', side_effect=exec_and_invalidate):
+            self.service.get_value('defaultDailyUserSessionLimit')
+
+        self.service.get_value('defaultDailyUserSessionLimit')
+        self.assertEqual(len(self.statements), 2)
+
+    def test_values_expire_after_ttl(self) -> None:
+        self.service.get_value('defaultDailyUserSessionLimit')
+
+        with patch.object(app_config_cache, 'ttl', 0):
+            self.service.get_value('defaultDailyUserSessionLimit')
+
+        self.assertEqual(len(self.statements), 2)
+
+    def test_listener_is_postgres_only(self) -> None:
+        self.assertIsNone(start_app_config_listener(self.engine))
+
+    def test_listener_does_not_use_the_application_pool(self) -> None:
+        listener = AppConfigChangeListener(self.engine)
+
+        self.assertIsNot(listener.engine, self.engine)
+        self.assertIsInstance(listener.engine.pool, NullPool)
+        self.assertEqual(listener.engine.url, self.engine.url)
+
+
+if __name__ == '__main__':
+    unittest.main()
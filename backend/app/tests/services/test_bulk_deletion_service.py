@@ -0,0 +1,190 @@
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import event, func
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine, select
+
+from app.data import get_dummy_user_data
+from app.enums.speaker import SpeakerType
+from app.models import (
+    ConversationScenario,
+    Review,
+    Session,
+    SessionFeedback,
+    SessionTurn,
+    UserProfile,
+)
+from app.models.live_feedback_model import LiveFeedback
+from app.models.scenario_preparation import ScenarioPreparation
+from app.services.conversation_scenario_service import ConversationScenarioService
+from app.services.session_service import SessionService
+from app.services.user_profile_service import UserService
+
+
+class FakeGCS:
+    def __init__(self) -> None:
+        self.deleted: list[str] = []
+
+    def delete_documents(self, filenames: list[str]) -> list[str]:
+        self.deleted.extend(filenames)
+        return list(filenames)
+
+
+class TestBulkDeletion(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+
+        # SQLite only enforces ON DELETE CASCADE with foreign keys switched on
+        @event.listens_for(self.engine, 'connect')
+        def enable_foreign_keys(dbapi_connection: Any, _: Any) -> None:  # noqa: ANN401
+            dbapi_connection.execute('PRAGMA foreign_keys=ON')
+
+        SQLModel.metadata.create_all(self.engine)
+        self.db = DBSession(self.engine)
+
+        self.user, self.other_user = [u.user_profile for u in get_dummy_user_data()[:2]]
+        self.db.add_all([self.user, self.other_user])
+        self.db.commit()
+
+        self.scenarios = [self._add_scenario(self.user, sessions=3) for _ in range(2)]
+        self.other_scenario = self._add_scenario(self.other_user, sessions=1)
+        self.db.commit()
+        self.user_id = self.user.id
+        self.scenario_ids = [s.id for s in self.scenarios]
+
+        self.gcs = FakeGCS()
+        self.gcs_patch = patch('app.connections.gcs_client._gcs_audio_manager', new=self.gcs)
+        self.gcs_patch.start()
+
+    def tearDown(self) -> None:
+        self.gcs_patch.stop()
+        self.db.close()
+        self.engine.dispose()
+
+    def _add_scenario(self, user: UserProfile, sessions: int) -> ConversationScenario:
+        scenario = ConversationScenario(
+            user_id=user.id, persona_name='persona', persona='', situational_facts=''
+        )
+        self.db.add(scenario)
+        self.db.add(ScenarioPreparation(scenario_id=scenario.id))
+        for _ in range(sessions):
+            session = Session(scenario_id=scenario.id)
+            self.db.add(session)
+            # Live feedback has no relationship, so the session row has to exist first
+            self.db.flush()
+            for t in range(2):
+                self.db.add(
+                    SessionTurn(
+                        session_id=session.id,
+                        speaker=SpeakerType.user,
+                        start_offset_ms=t,
+                        end_offset_ms=t + 1,
+                        text='',
+                        audio_uri=f'{session.id}_{t}.webm',
+                    )
+                )
+            self.db.add(
+                SessionFeedback(
+                    session_id=session.id,
+                    overall_score=3.0,
+                    full_audio_filename=f'{session.id}.mp3',
+                    speak_time_percent=50.0,
+                    questions_asked=0,
+                    session_length_s=60,
+                )
+            )
+            self.db.add(LiveFeedback(session_id=session.id, heading='Tone', feedback_text='Calm'))
+            self.db.add(Review(user_id=user.id, session_id=session.id, rating=5, comment=''))
+        return scenario
+
+    def _count(self, model: type) -> int:
+        return self.db.exec(select(func.count()).select_from(model)).one()
+
+    def test_clear_all_conversation_scenarios(self) -> None:
+        statements = []
+
+        def before_cursor_execute(*args: object) -> None:
+            statements.append(args[2])
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            result = ConversationScenarioService(self.db).clear_all_conversation_scenarios(
+                self.user
+            )
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+
+        self.assertEqual(result['message'], f'Deleted 2 scenario for user ID {self.user_id}')
+        # 6 sessions with two turn recordings and one stitched recording each
+        self.assertEqual(len(result['audios']), 18)
+        self.assertCountEqual(self.gcs.deleted, result['audios'])
+        # One lookup for the audio keys and one DELETE each for sessions and scenarios
+        self.assertEqual(len(statements), 3)
+
+        self.assertEqual(self._count(ConversationScenario), 1)
+        self.assertEqual(self._count(Session), 1)
+        self.assertEqual(self._count(SessionTurn), 2)
+        self.assertEqual(self._count(SessionFeedback), 1)
+        self.assertEqual(self._count(LiveFeedback), 1)
+        self.assertEqual(self._count(Review), 1)
+        self.assertEqual(self._count(ScenarioPreparation), 1)
+
+    def test_delete_conversation_scenario(self) -> None:
+        result = ConversationScenarioService(self.db).delete_conversation_scenario(
+            self.scenario_ids[0], self.user
+        )
+
+        self.assertEqual(result['message'], f'Deleted 3 sessions for user ID {self.user_id}')
+        self.assertEqual(len(result['audios']), 9)
+        self.assertEqual(self._count(ConversationScenario), 2)
+        self.assertEqual(self._count(Session), 4)
+
+    def test_delete_all_user_sessions(self) -> None:
+        result = SessionService(self.db).delete_all_user_sessions(self.user)
+
+        self.assertEqual(result['message'], f'Deleted 6 sessions for user ID {self.user_id}')
+        self.assertEqual(self._count(Session), 1)
+
+    def test_delete_all_user_sessions_without_scenarios(self) -> None:
+        user = get_dummy_user_data()[2].user_profile
+        self.db.add(user)
+        self.db.commit()
+
+        result = SessionService(self.db).delete_all_user_sessions(user)
+
+        self.assertEqual(result['audios'], [])
+        self.assertEqual(self._count(Session), 7)
+
+    def test_delete_session_by_id(self) -> None:
+        session_id = self.db.exec(
+            select(Session.id).where(Session.scenario_id == self.scenario_ids[0])
+        ).first()
+
+        result = SessionService(self.db).delete_session_by_id(session_id, self.user)
+
+        self.assertEqual(
+            sorted(result['audios']),
+            [f'{session_id}.mp3', f'{session_id}_0.webm', f'{session_id}_1.webm'],
+        )
+        self.assertIsNone(self.db.get(Session, session_id))
+        self.assertEqual(self._count(SessionTurn), 12)
+
+    def test_delete_user(self) -> None:
+        with patch(
+            'app.services.user_profile_service.get_supabase_client', return_value=MagicMock()
+        ):
+            UserService(self.db)._delete_user(self.user_id)
+
+        self.assertIsNone(self.db.get(UserProfile, self.user_id))
+        self.assertEqual(self._count(ConversationScenario), 1)
+        self.assertEqual(self._count(Review), 1)
+        self.assertEqual(len(self.gcs.deleted), 18)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,280 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine, select
+
+from app.data import get_dummy_conversation_categories, get_dummy_user_data
+from app.enums.config_type import ConfigType
+from app.enums.scenario_preparation_status import ScenarioPreparationStatus
+from app.models import (
+    AppConfig,
+    ConversationScenario,
+    ScenarioPreparation,
+    Session,
+    SessionFeedback,
+)
+from app.models.conversation_scenario import DifficultyLevel
+from app.models.session_feedback import FeedbackStatus
+from app.models.user_profile import UserProfile
+from app.schemas.conversation_scenario import ConversationScenarioCreate
+from app.services.admin_stats_service import AdminStatsService
+from app.services.conversation_scenario_service import ConversationScenarioService
+
+
+class TestConversationScenarioService(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+        self.db = DBSession(self.engine)
+
+        self.user = get_dummy_user_data()[0].user_profile
+        self.category = get_dummy_conversation_categories()[0]
+        self.db.add_all([self.user, self.category])
+        self.db.commit()
+
+        # Scenario i has i sessions, the newest scenario has the most recent session
+        start = datetime(2025, 1, 1)
+        self.scenarios = []
+        for i in range(1, 6):
+            scenario = ConversationScenario(
+                user_id=self.user.id,
+                category_id=self.category.id,
+                persona_name=f'persona {i}',
+                persona='',
+                situational_facts='',
+            )
+            self.db.add(scenario)
+            self.scenarios.append(scenario)
+            for j in range(i):
+                session = Session(
+                    scenario_id=scenario.id, started_at=start + timedelta(days=i, hours=j)
+                )
+                self.db.add(session)
+                self.db.add(
+                    SessionFeedback(
+                        session_id=session.id,
+                        overall_score=float(j + 1),
+                        full_audio_filename='',
+                        speak_time_percent=50.0,
+                        questions_asked=0,
+                        session_length_s=60,
+                        status=FeedbackStatus.completed,
+                    )
+                )
+        self.db.commit()
+
+        self.service = ConversationScenarioService(self.db)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def test_list_scenarios_summary_paginates_in_sql(self) -> None:
+        result = self.service.list_scenarios_summary(self.user, page=2, page_size=2)
+
+        self.assertEqual(result.total_scenarios, 5)
+        self.assertEqual(result.total_pages, 3)
+        self.assertEqual(len(result.scenarios), 2)
+        # Ordered by most recent session, newest first
+        self.assertEqual(
+            [s.scenario_id for s in result.scenarios],
+            [self.scenarios[2].id, self.scenarios[1].id],
+        )
+        self.assertEqual(result.scenarios[0].total_sessions, 3)
+        self.assertAlmostEqual(result.scenarios[0].average_score, 2.0)
+
+    def test_list_scenarios_summary_only_fetches_one_page(self) -> None:
+        statements = []
+        self.db.refresh(self.user)
+
+        def before_cursor_execute(*args: object) -> None:
+            statements.append(args[2])
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            result = self.service.list_scenarios_summary(self.user, page=1, page_size=2)
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+
+        self.assertEqual(len(statements), 1)
+        self.assertIn('LIMIT', statements[0])
+        self.assertEqual(len(result.scenarios), 2)
+        self.assertEqual(result.total_scenarios, 5)
+
+    def test_list_scenarios_summary_past_last_page(self) -> None:
+        result = self.service.list_scenarios_summary(self.user, page=10, page_size=2)
+
+        self.assertEqual(result.total_scenarios, 5)
+        self.assertEqual(result.total_pages, 3)
+        self.assertEqual(result.scenarios, [])
+
+    def test_list_scenarios_summary_without_scenarios(self) -> None:
+        other_user = get_dummy_user_data()[1].user_profile
+        self.db.add(other_user)
+        self.db.commit()
+
+        result = self.service.list_scenarios_summary(other_user)
+
+        self.assertEqual(result.total_scenarios, 0)
+        self.assertEqual(result.total_pages, 1)
+        self.assertEqual(result.scenarios, [])
+
+    def test_get_scenario_summary_aggregates_in_one_query(self) -> None:
+        scenario = self.scenarios[3]
+        pending_session = Session(scenario_id=scenario.id, started_at=datetime(2026, 1, 1))
+        self.db.add(pending_session)
+        self.db.add(
+            SessionFeedback(
+                session_id=pending_session.id,
+                overall_score=0.0,
+                full_audio_filename='',
+                speak_time_percent=0.0,
+                questions_asked=0,
+                session_length_s=0,
+                status=FeedbackStatus.pending,
+            )
+        )
+        self.db.add(Session(scenario_id=scenario.id))
+        self.db.commit()
+        self.db.refresh(self.user)
+        scenario_id = scenario.id
+
+        statements = []
+
+        def before_cursor_execute(*args: object) -> None:
+            statements.append(args[2])
+
+        event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            result = self.service.get_scenario_summary(scenario_id, self.user)
+        finally:
+            event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(result.total_sessions, 6)
+        # Averaged over the four completed feedbacks only
+        self.assertAlmostEqual(result.average_score, 2.5)
+        self.assertEqual(result.last_session_at, datetime(2026, 1, 1))
+        self.assertEqual(result.category_name, self.category.name)
+
+    def test_get_scenario_summary_without_sessions(self) -> None:
+        scenario = ConversationScenario(
+            user_id=self.user.id,
+            custom_category_label='Custom',
+            persona_name='persona',
+            persona='',
+            situational_facts='',
+        )
+        self.db.add(scenario)
+        self.db.commit()
+
+        result = self.service.get_scenario_summary(scenario.id, self.user)
+
+        self.assertEqual(result.total_sessions, 0)
+        self.assertIsNone(result.average_score)
+        self.assertIsNone(result.last_session_at)
+        self.assertEqual(result.category_name, 'Custom')
+
+    def test_get_scenario_summary_not_found(self) -> None:
+        with self.assertRaises(HTTPException) as context:
+            self.service.get_scenario_summary(uuid4(), self.user)
+
+        self.assertEqual(context.exception.status_code, 404)
+
+
+class TestScenarioPreparationReuse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+        self.db = DBSession(self.engine)
+
+        users = get_dummy_user_data()
+        self.user = users[0].user_profile
+        self.other_user = users[1].user_profile
+        self.category = get_dummy_conversation_categories()[0]
+        self.db.add_all([self.user, self.other_user, self.category])
+        self.db.commit()
+        self.service = ConversationScenarioService(self.db)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def _create(self, user: UserProfile, persona: str = 'Angry employee') -> MagicMock:
+        background_tasks = MagicMock()
+        self.service.create_conversation_scenario_with_preparation(
+            ConversationScenarioCreate(
+                category_id=self.category.id,
+                persona_name='Alex',
+                persona=persona,
+                situational_facts='Missed  three deadlines.',
+                difficulty_level=DifficultyLevel.medium,
+            ),
+            user,
+            background_tasks,
+        )
+        return background_tasks
+
+    def _complete_preparations(self) -> None:
+        for prep in self.db.exec(select(ScenarioPreparation)).all():
+            prep.status = ScenarioPreparationStatus.completed
+            prep.objectives = ['Stay calm']
+            prep.key_concepts = [{'header': 'Empathy', 'value': 'Listen first'}]
+            prep.prep_checklist = ['Prepare facts']
+            self.db.add(prep)
+        self.db.commit()
+
+    def test_completed_preparation_is_cloned_for_equal_inputs(self) -> None:
+        self.assertEqual(self._create(self.user).add_task.call_count, 1)
+        self._complete_preparations()
+
+        # Only case and whitespace differ, so the preparation is reused without generation
+        background_tasks = self._create(self.other_user, persona='  angry   Employee ')
+        background_tasks.add_task.assert_not_called()
+
+        preparations = self.db.exec(select(ScenarioPreparation)).all()
+        self.assertEqual(len(preparations), 2)
+        self.assertEqual(len({prep.scenario_id for prep in preparations}), 2)
+        clone = next(prep for prep in preparations if prep.scenario.user_id == self.other_user.id)
+        self.assertEqual(clone.status, ScenarioPreparationStatus.completed)
+        self.assertEqual(clone.objectives, ['Stay calm'])
+        self.assertEqual(AdminStatsService(self.db).get_preparation_totals(), (1, 1))
+
+    def test_pending_preparation_is_not_reused(self) -> None:
+        self._create(self.user)
+
+        self.assertEqual(self._create(self.other_user).add_task.call_count, 1)
+        self.assertEqual(AdminStatsService(self.db).get_preparation_totals(), (2, 0))
+
+    def test_different_inputs_are_generated(self) -> None:
+        self._create(self.user)
+        self._complete_preparations()
+
+        self.assertEqual(self._create(self.other_user, persona='Shy').add_task.call_count, 1)
+
+    def test_reuse_can_be_disabled_by_admin(self) -> None:
+        self.db.add(
+            AppConfig(key='scenarioPreparationReuseEnabled', value='false', type=ConfigType.boolean)
+        )
+        self.db.commit()
+        self._create(self.user)
+        self._complete_preparations()
+
+        self.assertEqual(self._create(self.other_user).add_task.call_count, 1)
+        self.assertEqual(AdminStatsService(self.db).get_preparation_totals(), (0, 0))
+        prep = self.db.exec(select(ScenarioPreparation)).first()
+        self.assertIsNone(prep.content_hash)
+
+
+if __name__ == '__main__':
+    unittest.main()
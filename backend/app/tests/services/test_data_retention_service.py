@@ -1,14 +1,15 @@
 from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 from sqlmodel import Session as DBSession
-from sqlmodel import SQLModel, create_engine
+from sqlmodel import SQLModel, create_engine, func, select
 
 from app.enums.speaker import SpeakerType
 from app.models.session import Session
+from app.models.session_feedback import SessionFeedback
 from app.models.session_turn import SessionTurn
 from app.services.data_retention_service import cleanup_old_session_turns
 from app.services.google_cloud_storage_service import GCSManager
@@ -106,12 +107,74 @@ def test_cleanup_old_session_turns_gcs(db: DBSession, gcs_manager: GCSManager) -
     db.add(old_turn)
     db.commit()
 
-    with (
-        patch(
-            'app.services.data_retention_service.get_gcs_audio_manager', return_value=gcs_manager
-        ),
-        patch.object(gcs_manager, 'delete_document') as mock_delete,
+    with patch(
+        'app.services.data_retention_service.get_gcs_audio_manager', return_value=gcs_manager
     ):
         cleanup_old_session_turns(db)
         db.commit()
-        mock_delete.assert_called_with(old_audio_uri)
+
+    gcs_manager.bucket.blob.assert_any_call(f'audio/{old_audio_uri}')
+    gcs_manager.bucket.blob.return_value.delete.assert_called_once_with()
+
+
+def _add_turns(db: DBSession, count: int, days_old: int) -> UUID:
+    session_id = uuid4()
+    db.add(Session(id=session_id, scenario_id=uuid4()))
+    db.add_all(
+        SessionTurn(
+            session_id=session_id,
+            speaker=SpeakerType.user,
+            start_offset_ms=i,
+            end_offset_ms=i + 1,
+            text='',
+            audio_uri=f'{session_id}_{i}.mp3',
+            created_at=datetime.now(UTC) - timedelta(days=days_old, minutes=i),
+        )
+        for i in range(count)
+    )
+    db.commit()
+    return session_id
+
+
+def test_cleanup_old_session_turns_in_chunks(db: DBSession, gcs_manager: GCSManager) -> None:
+    old_session_id = _add_turns(db, 7, days_old=91)
+    _add_turns(db, 2, days_old=1)
+    db.add(
+        SessionFeedback(
+            session_id=old_session_id,
+            overall_score=0,
+            full_audio_filename=f'{old_session_id}_0.mp3',
+            speak_time_percent=0,
+            questions_asked=0,
+            session_length_s=0,
+        )
+    )
+    db.commit()
+
+    with patch(
+        'app.services.data_retention_service.get_gcs_audio_manager', return_value=gcs_manager
+    ):
+        report = cleanup_old_session_turns(db, chunk_size=3)
+
+    assert report.chunks == 3
+    assert report.turns_deleted == 7
+    assert report.feedback_cleared == 1
+    assert report.audios_deleted == 7
+    assert gcs_manager.bucket.blob.return_value.delete.call_count == 7
+    assert db.exec(select(func.count()).select_from(SessionTurn)).one() == 2
+    feedback = db.exec(select(SessionFeedback)).one()
+    assert feedback.full_audio_filename == ''
+
+
+def test_cleanup_old_session_turns_resumes(db: DBSession, gcs_manager: GCSManager) -> None:
+    _add_turns(db, 5, days_old=91)
+
+    with patch(
+        'app.services.data_retention_service.get_gcs_audio_manager', return_value=gcs_manager
+    ):
+        first_run = cleanup_old_session_turns(db, chunk_size=2, max_chunks=1)
+        second_run = cleanup_old_session_turns(db, chunk_size=2)
+
+    assert first_run.turns_deleted == 2
+    assert second_run.turns_deleted == 3
+    assert db.exec(select(func.count()).select_from(SessionTurn)).one() == 0
@@ -1,6 +1,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.api_core.exceptions import NotFound
 from pytest import LogCaptureFixture
 
 from app.services.google_cloud_storage_service import GCSManager
@@ -60,3 +61,30 @@ def test_document_exists_false(gcs_manager: GCSManager) -> None:
     blob.exists.return_value = False
     gcs_manager.bucket.blob.return_value = blob
     assert gcs_manager.document_exists('file.mp3') is False
+
+
+def test_delete_documents(gcs_manager: GCSManager, caplog: LogCaptureFixture) -> None:
+    blobs = {
+        'audio/a.mp3': MagicMock(),
+        'audio/missing.mp3': MagicMock(),
+        'audio/broken.mp3': MagicMock(),
+    }
+    blobs['audio/missing.mp3'].delete.side_effect = NotFound('gone')
+    blobs['audio/broken.mp3'].delete.side_effect = RuntimeError('boom')
+    gcs_manager.bucket.blob.side_effect = lambda name: blobs[name]
+
+    deleted = gcs_manager.delete_documents(['a.mp3', 'missing.mp3', 'broken.mp3', 'a.mp3', ''])
+
+    assert deleted == ['a.mp3', 'missing.mp3']
+    blobs['audio/a.mp3'].delete.assert_called_once()
+    assert any('Failed to delete blob audio/broken.mp3' in r.message for r in caplog.records)
+
+
+def test_delete_documents_sends_a_single_request_per_blob(gcs_manager: GCSManager) -> None:
+    blob = MagicMock()
+    gcs_manager.bucket.blob.return_value = blob
+
+    assert gcs_manager.delete_documents(['a.mp3', 'b.mp3']) == ['a.mp3', 'b.mp3']
+
+    assert blob.delete.call_count == 2
+    blob.exists.assert_not_called()
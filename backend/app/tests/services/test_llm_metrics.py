@@ -0,0 +1,147 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy.pool import QueuePool
+from sqlmodel import create_engine
+from tenacity import retry, stop_after_attempt, wait_none
+
+from app.services.llm_metrics import LLMCallRecord, LLMMetrics, llm_metrics
+from app.services.llm_resilience import CircuitBreakerRegistry
+from app.services.metrics_service import render_metrics
+from app.services.ttl_cache import TTLCache
+
+
+class TestLLMMetrics(unittest.TestCase):
+    def test_call_latency_and_tokens_are_recorded(self) -> None:
+        metrics = LLMMetrics()
+
+        with metrics.track('scoring', 'gemini') as record:
+            record.input_tokens = 1_200
+            record.output_tokens = 300
+
+        stats = metrics.get_stats()[('scoring', 'gemini')]
+        self.assertEqual((stats.calls, stats.failures), (1, 0))
+        self.assertEqual((stats.input_tokens, stats.output_tokens), (1_200, 300))
+        self.assertGreater(stats.latency_sum_s, 0)
+        self.assertEqual(stats.latency_buckets[0], 1)
+
+    def test_latency_is_counted_in_its_bucket(self) -> None:
+        metrics = LLMMetrics()
+        metrics._observe('scoring', 'gemini', 1.5, LLMCallRecord(), failed=False)
+        metrics._observe('scoring', 'gemini', 500.0, LLMCallRecord(), failed=False)
+
+        stats = metrics.get_stats()[('scoring', 'gemini')]
+        # 1.5 s falls into the bucket with the upper bound 2.5 s, 500 s only into +Inf
+        self.assertEqual(stats.latency_buckets[3], 1)
+        self.assertEqual((sum(stats.latency_buckets), stats.calls), (1, 2))
+
+    def test_failed_call_is_recorded_and_reraised(self) -> None:
+        metrics = LLMMetrics()
+
+        with self.assertRaises(ValueError), metrics.track('goals', 'gemini'):
+            raise ValueError('invalid response')
+
+        stats = metrics.get_stats()[('goals', 'gemini')]
+        self.assertEqual((stats.calls, stats.failures), (1, 1))
+
+    def test_cache_hits_are_counted_per_operation(self) -> None:
+        metrics = LLMMetrics()
+        metrics.record_cache_hit('scoring', 'gemini')
+        metrics.record_cache_hit('scoring', 'gemini')
+
+        stats = metrics.get_stats()[('scoring', 'gemini')]
+        self.assertEqual((stats.cache_hits, stats.calls), (2, 0))
+
+    def test_retry_callback_counts_tenacity_retries(self) -> None:
+        metrics = LLMMetrics()
+        attempts = 0
+
+        @retry(
+            stop=stop_after_attempt(3),
+            wait=wait_none(),
+            before_sleep=metrics.retry_callback('examples'),
+        )
+        def flaky() -> str:
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise RuntimeError('provider unavailable')
+            return 'ok'
+
+        self.assertEqual(flaky(), 'ok')
+        self.assertEqual(metrics.get_retries(), {'examples': 2})
+
+        metrics.reset()
+        self.assertEqual((metrics.get_stats(), metrics.get_retries()), ({}, {}))
+
+
+class TestRenderMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        llm_metrics.reset()
+        self.addCleanup(llm_metrics.reset)
+
+    def test_prometheus_text_format(self) -> None:
+        llm_metrics._observe(
+            'live_feedback', 'gemini', 0.4, LLMCallRecord(input_tokens=500), failed=False
+        )
+        llm_metrics.record_retry('live_feedback')
+
+        text = render_metrics()
+
+        self.assertIn('# TYPE llm_call_duration_seconds histogram', text)
+        self.assertIn('llm_calls_total{operation="live_feedback",model="gemini"} 1', text)
+        self.assertIn('llm_input_tokens_total{operation="live_feedback",model="gemini"} 500', text)
+        self.assertIn('llm_call_retries_total{operation="live_feedback"} 1', text)
+        bucket = 'llm_call_duration_seconds_bucket{operation="live_feedback",model="gemini"'
+        self.assertIn(f'{bucket},le="0.25"}} 0', text)
+        self.assertIn(f'{bucket},le="0.5"}} 1', text)
+        self.assertIn(f'{bucket},le="+Inf"}} 1', text)
+        self.assertTrue(text.endswith('\n'))
+
+    def test_auth_cache_lookups_are_exported(self) -> None:
+        jwt_cache = TTLCache(maxsize=10, ttl=60)
+        jwt_cache.set('token', {'sub': 'user'})
+        jwt_cache.get('token')
+        jwt_cache.get('token')
+        jwt_cache.get('other')
+        profile_cache = TTLCache(maxsize=10, ttl=60)
+        profile_cache.get('user')
+
+        with (
+            patch('app.services.metrics_service.jwt_payload_cache', jwt_cache),
+            patch('app.services.metrics_service.user_profile_cache', profile_cache),
+        ):
+            text = render_metrics()
+
+        self.assertIn('jwt_cache_lookups_total{result="hit"} 2', text)
+        self.assertIn('jwt_cache_lookups_total{result="miss"} 1', text)
+        self.assertIn('user_profile_cache_lookups_total{result="hit"} 0', text)
+        self.assertIn('user_profile_cache_lookups_total{result="miss"} 1', text)
+
+    def test_db_pool_occupancy_is_exported(self) -> None:
+        engine = create_engine('sqlite://', poolclass=QueuePool, pool_size=2, max_overflow=2)
+        for _ in range(3):
+            self.addCleanup(engine.connect().close)
+
+        with patch('app.services.metrics_service.engine', engine):
+            text = render_metrics()
+
+        self.assertIn('db_pool_size{engine="sync"} 2', text)
+        self.assertIn('db_pool_checked_out_connections{engine="sync"} 3', text)
+        self.assertIn('db_pool_overflow_connections{engine="sync"} 1', text)
+        self.assertIn('db_pool_checked_out_connections{engine="async"} 0', text)
+
+    def test_open_circuits_are_exported(self) -> None:
+        registry = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=30.0)
+        registry.get('gemini').record_failure()
+        registry.get('gemini-flash')
+
+        with patch('app.services.metrics_service.circuit_breakers', registry):
+            text = render_metrics()
+
+        self.assertIn('llm_circuit_open{model="gemini"} 1', text)
+        self.assertIn('llm_circuit_open{model="gemini-flash"} 0', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
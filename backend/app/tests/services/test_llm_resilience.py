@@ -0,0 +1,229 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import httpx
+from tenacity import retry, stop_after_attempt, wait_none
+
+from app.services.llm_resilience import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    DeadlineExceededError,
+    HedgePolicy,
+    LLMUnavailableError,
+    arun_hedged,
+    deadline_scope,
+    get_call_timeout,
+    remaining_time,
+    run_hedged,
+    stop_at_deadline,
+)
+
+
+class TestDeadlines(unittest.TestCase):
+    def test_call_timeout_is_bounded_by_the_deadline(self) -> None:
+        self.assertIsNone(remaining_time())
+        self.assertEqual(get_call_timeout(60.0), 60.0)
+
+        with deadline_scope(10.0):
+            self.assertLessEqual(get_call_timeout(60.0), 10.0)
+            self.assertEqual(get_call_timeout(5.0), 5.0)
+
+        self.assertIsNone(remaining_time())
+
+    def test_nested_scope_cannot_extend_the_deadline(self) -> None:
+        with deadline_scope(5.0) as outer, deadline_scope(100.0) as inner:
+            self.assertEqual(inner, outer)
+        with deadline_scope(100.0) as outer, deadline_scope(5.0) as inner:
+            self.assertLess(inner, outer)
+
+    def test_expired_deadline_fails_before_the_call(self) -> None:
+        with deadline_scope(0.0), self.assertRaises(DeadlineExceededError):
+            get_call_timeout(60.0)
+
+    def test_retries_stop_when_no_time_is_left(self) -> None:
+        attempts = 0
+
+        @retry(stop=stop_after_attempt(3) | stop_at_deadline, wait=wait_none(), reraise=True)
+        def failing() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise RuntimeError('provider unavailable')
+
+        with deadline_scope(1.0), self.assertRaises(RuntimeError):
+            failing()
+        self.assertEqual(attempts, 1)
+
+        attempts = 0
+        with deadline_scope(60.0), self.assertRaises(RuntimeError):
+            failing()
+        self.assertEqual(attempts, 3)
+
+    def test_retries_stop_on_open_circuit(self) -> None:
+        attempts = 0
+
+        @retry(stop=stop_after_attempt(3) | stop_at_deadline, wait=wait_none(), reraise=True)
+        def unavailable() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise LLMUnavailableError('circuit open')
+
+        with self.assertRaises(LLMUnavailableError):
+            unavailable()
+        self.assertEqual(attempts, 1)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1_000.0
+        patcher = patch('app.services.llm_resilience.time.monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fail(self, breaker: CircuitBreaker) -> None:
+        with self.assertRaises(RuntimeError), breaker.guard():
+            raise RuntimeError('provider unavailable')
+
+    def test_circuit_opens_after_consecutive_failures(self) -> None:
+        breaker = CircuitBreaker('gemini', failure_threshold=3, reset_timeout=30.0)
+        self._fail(breaker)
+        self._fail(breaker)
+        with breaker.guard():
+            pass
+        self._fail(breaker)
+        self._fail(breaker)
+        self.assertEqual(breaker.state, 'closed')
+
+        self._fail(breaker)
+        self.assertEqual(breaker.state, 'open')
+        with self.assertRaises(LLMUnavailableError), breaker.guard():
+            self.fail('the call must not be made while the circuit is open')
+
+    def test_single_probe_closes_the_circuit(self) -> None:
+        breaker = CircuitBreaker('gemini', failure_threshold=1, reset_timeout=30.0)
+        self._fail(breaker)
+        self.now += 31.0
+        self.assertEqual(breaker.state, 'half_open')
+
+        with breaker.guard():
+            # A second call is rejected while the probe is in flight
+            self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_failed_probe_opens_the_circuit_again(self) -> None:
+        breaker = CircuitBreaker('gemini', failure_threshold=1, reset_timeout=30.0)
+        self._fail(breaker)
+        self.now += 31.0
+
+        self._fail(breaker)
+        self.assertEqual(breaker.state, 'open')
+        self.now += 29.0
+        self.assertFalse(breaker.allow())
+
+    def test_deadline_timeouts_are_not_counted(self) -> None:
+        breaker = CircuitBreaker('gemini', failure_threshold=1, reset_timeout=30.0)
+        with self.assertRaises(DeadlineExceededError), breaker.guard():
+            raise DeadlineExceededError('deadline')
+        self.assertEqual(breaker.state, 'closed')
+
+        with self.assertRaises(httpx.ReadTimeout), breaker.guard():
+            raise httpx.ReadTimeout('read timed out')
+        self.assertEqual(breaker.state, 'open')
+
+    def test_deadline_timeout_releases_the_probe(self) -> None:
+        breaker = CircuitBreaker('gemini', failure_threshold=1, reset_timeout=30.0)
+        self._fail(breaker)
+        self.now += 31.0
+
+        with self.assertRaises(DeadlineExceededError), breaker.guard():
+            raise DeadlineExceededError('deadline')
+        self.assertEqual(breaker.state, 'half_open')
+        self.assertTrue(breaker.allow())
+
+    def test_registry_keeps_one_breaker_per_model(self) -> None:
+        registry = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=30.0)
+        self._fail(registry.get('gemini'))
+
+        self.assertIs(registry.get('gemini'), registry.get('gemini'))
+        self.assertEqual(registry.get_states(), {'gemini': 'open'})
+        registry.get('gemini-flash')
+        self.assertEqual(registry.get_states()['gemini-flash'], 'closed')
+
+
+class TestHedging(unittest.TestCase):
+    def test_delay_is_the_p95_latency_once_enough_samples_exist(self) -> None:
+        policy = HedgePolicy(enabled=True, window=100, min_samples=20)
+        for latency in range(1, 20):
+            policy.observe('scoring', 'gemini', float(latency))
+        self.assertIsNone(policy.get_delay('scoring', 'gemini'))
+
+        policy.observe('scoring', 'gemini', 20.0)
+        self.assertEqual(policy.get_delay('scoring', 'gemini'), 19.0)
+        self.assertIsNone(policy.get_delay('goals', 'gemini'))
+
+    def test_disabled_policy_never_hedges(self) -> None:
+        policy = HedgePolicy(enabled=False, window=100, min_samples=1)
+        policy.observe('scoring', 'gemini', 1.0)
+        self.assertIsNone(policy.get_delay('scoring', 'gemini'))
+
+    def test_hedge_answers_when_the_first_call_is_slow(self) -> None:
+        release = threading.Event()
+        calls = 0
+
+        def call() -> str:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                release.wait(5)
+                return 'primary'
+            return 'hedge'
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(run_hedged(call, 0.05, executor), 'hedge')
+            release.set()
+        self.assertEqual(calls, 2)
+
+    def test_fast_call_is_not_hedged(self) -> None:
+        calls = 0
+
+        def call() -> str:
+            nonlocal calls
+            calls += 1
+            return 'primary'
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(run_hedged(call, 1.0, executor), 'primary')
+        self.assertEqual(calls, 1)
+
+    def test_async_hedge_cancels_the_slow_call(self) -> None:
+        calls = 0
+        cancelled = False
+
+        async def call() -> str:
+            nonlocal calls, cancelled
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+                return 'primary'
+            return 'hedge'
+
+        async def run() -> str:
+            result = await arun_hedged(call, 0.05)
+            await asyncio.sleep(0)
+            return result
+
+        start = time.monotonic()
+        self.assertEqual(asyncio.run(run()), 'hedge')
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertTrue(cancelled)
+
+
+if __name__ == '__main__':
+    unittest.main()
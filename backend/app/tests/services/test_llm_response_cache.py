@@ -0,0 +1,135 @@
+import unittest
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine, select
+
+from app.models.llm_response_cache_entry import LLMResponseCacheEntry
+from app.services.llm_response_cache import (
+    InMemoryLLMResponseCacheBackend,
+    LLMResponseCache,
+    PostgresLLMResponseCacheBackend,
+)
+
+
+class Answer(BaseModel):
+    value: int
+
+
+class OtherAnswer(BaseModel):
+    text: str
+
+
+class TestLLMResponseCacheKey(unittest.TestCase):
+    def _key(self, **overrides: object) -> str:
+        arguments = {
+            'model': 'gemini',
+            'system_prompt': 'system',
+            'request_prompt': 'prompt',
+            'output_model': Answer,
+            'audio_uri': None,
+            'temperature': 0.0,
+            'max_tokens': 100,
+        }
+        arguments.update(overrides)
+        return LLMResponseCache.make_key(**arguments)
+
+    def test_identical_calls_share_a_key(self) -> None:
+        self.assertEqual(self._key(), self._key())
+
+    def test_every_input_changes_the_key(self) -> None:
+        keys = {
+            self._key(),
+            self._key(model='gemini-lite'),
+            self._key(system_prompt=None),
+            self._key(request_prompt='other prompt'),
+            self._key(output_model=OtherAnswer),
+            self._key(audio_uri='gs://bucket/audio.mp3'),
+            self._key(temperature=0.5),
+            self._key(max_tokens=200),
+        }
+        self.assertEqual(len(keys), 8)
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    def test_hits_and_misses_are_counted(self) -> None:
+        cache = LLMResponseCache(InMemoryLLMResponseCacheBackend(maxsize=10), ttl=60)
+
+        self.assertIsNone(cache.get('key'))
+        cache.set('key', '{"value": 1}')
+        self.assertEqual(cache.get('key'), '{"value": 1}')
+
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_memory_backend_evicts_least_recently_used(self) -> None:
+        cache = LLMResponseCache(InMemoryLLMResponseCacheBackend(maxsize=2), ttl=60)
+        cache.set('a', '1')
+        cache.set('b', '2')
+        cache.get('a')
+        cache.set('c', '3')
+
+        self.assertEqual(cache.get('a'), '1')
+        self.assertIsNone(cache.get('b'))
+
+    def test_memory_backend_expires_entries(self) -> None:
+        cache = LLMResponseCache(InMemoryLLMResponseCacheBackend(maxsize=2), ttl=0)
+        cache.set('key', '1')
+
+        self.assertIsNone(cache.get('key'))
+
+    def test_backend_errors_are_misses(self) -> None:
+        backend = MagicMock()
+        backend.get.side_effect = RuntimeError('db down')
+        backend.set.side_effect = RuntimeError('db down')
+        cache = LLMResponseCache(backend, ttl=60)
+
+        cache.set('key', '1')
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(cache.misses, 1)
+
+
+class TestPostgresLLMResponseCacheBackend(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine(
+            'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(self.engine)
+        self.backend = PostgresLLMResponseCacheBackend(self._session_generator)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def _session_generator(self) -> Generator[DBSession]:
+        with DBSession(self.engine) as db:
+            yield db
+
+    def test_set_replaces_and_get_returns_entry(self) -> None:
+        self.backend.set('key', '1', ttl=60)
+        self.backend.set('key', '2', ttl=60)
+
+        self.assertEqual(self.backend.get('key'), '2')
+        self.assertIsNone(self.backend.get('missing'))
+
+    def test_expired_entries_are_ignored_and_evicted(self) -> None:
+        with DBSession(self.engine) as db:
+            db.add(
+                LLMResponseCacheEntry(
+                    key='old', response='1', expires_at=datetime.now(UTC) - timedelta(seconds=1)
+                )
+            )
+            db.commit()
+        self.backend.set('new', '2', ttl=60)
+
+        self.assertIsNone(self.backend.get('old'))
+        self.assertEqual(self.backend.evict_expired(), 1)
+        with DBSession(self.engine) as db:
+            self.assertEqual(db.exec(select(LLMResponseCacheEntry.key)).all(), ['new'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+from functools import partial
+
+from app.services.prompt_budget import (
+    PRIORITY_CONTEXT,
+    PRIORITY_HISTORY,
+    PRIORITY_TRANSCRIPT,
+    PromptBudget,
+    PromptSection,
+    count_tokens,
+    trim_text,
+)
+
+
+def _lines(prefix: str, count: int) -> str:
+    return '\n'.join(f'{prefix} line {i:03d}' for i in range(count))
+
+
+class TestTrimText(unittest.TestCase):
+    def test_text_within_budget_is_unchanged(self) -> None:
+        text = _lines('User', 3)
+        self.assertEqual(trim_text(text, count_tokens(text), 'middle'), text)
+
+    def test_head_keeps_leading_lines(self) -> None:
+        trimmed = trim_text(_lines('Doc', 100), 50, 'head')
+
+        self.assertLessEqual(count_tokens(trimmed), 50)
+        self.assertTrue(trimmed.startswith('Doc line 000'))
+        self.assertRegex(trimmed, r'\[\.\.\. \d+ lines omitted \.\.\.\]$')
+
+    def test_tail_keeps_trailing_lines(self) -> None:
+        trimmed = trim_text(_lines('Feedback', 100), 50, 'tail')
+
+        self.assertLessEqual(count_tokens(trimmed), 50)
+        self.assertTrue(trimmed.endswith('Feedback line 099'))
+        self.assertTrue(trimmed.startswith('[... '))
+
+    def test_middle_keeps_both_ends(self) -> None:
+        trimmed = trim_text(_lines('User', 100), 60, 'middle')
+
+        self.assertLessEqual(count_tokens(trimmed), 60)
+        self.assertTrue(trimmed.startswith('User line 000'))
+        self.assertTrue(trimmed.endswith('User line 099'))
+        self.assertIn('lines omitted', trimmed)
+
+    def test_single_long_line_is_truncated(self) -> None:
+        trimmed = trim_text('x' * 1_000, 20, 'head')
+
+        self.assertLessEqual(count_tokens(trimmed), 20)
+        self.assertTrue(trimmed.endswith('[... truncated ...]'))
+
+
+class TestPromptBudget(unittest.TestCase):
+    def test_sections_are_trimmed_by_priority(self) -> None:
+        budget = PromptBudget(max_tokens=400)
+        transcript = _lines('User', 20)
+        context = _lines('Doc', 40)
+        history = _lines('Feedback', 40)
+
+        texts = budget.fit(
+            'test',
+            [
+                PromptSection('transcript', transcript, PRIORITY_TRANSCRIPT, 'middle'),
+                PromptSection('context', context, PRIORITY_CONTEXT, 'head'),
+                PromptSection('history', history, PRIORITY_HISTORY, 'tail'),
+            ],
+            reserved_tokens=50,
+        )
+
+        self.assertEqual(texts['transcript'], transcript)
+        self.assertEqual(texts['context'], context)
+        self.assertLess(len(texts['history']), len(history))
+        self.assertLessEqual(50 + count_tokens(*texts.values()), 400)
+
+    def test_section_max_tokens_applies_within_budget(self) -> None:
+        budget = PromptBudget(max_tokens=10_000)
+        context = _lines('Doc', 100)
+
+        texts = budget.fit(
+            'test',
+            [PromptSection('context', context, PRIORITY_CONTEXT, 'head', max_tokens=100)],
+        )
+
+        self.assertLessEqual(count_tokens(texts['context']), 100)
+
+    def test_min_tokens_is_kept(self) -> None:
+        budget = PromptBudget(max_tokens=100)
+
+        texts = budget.fit(
+            'test',
+            [
+                PromptSection(
+                    'history', _lines('Feedback', 100), PRIORITY_HISTORY, 'tail', min_tokens=80
+                ),
+                PromptSection('transcript', _lines('User', 100), PRIORITY_TRANSCRIPT, 'middle'),
+            ],
+        )
+
+        self.assertGreater(count_tokens(texts['history']), 70)
+        self.assertLessEqual(count_tokens(texts['history']), 80)
+
+    def test_build_counts_fixed_prompt_and_records_stats(self) -> None:
+        budget = PromptBudget(max_tokens=300)
+
+        def build_prompt(instructions: str, transcript: str) -> str:
+            return f'{instructions}\nTranscript:\n{transcript}'
+
+        instructions = 'Rate the conversation. ' * 40
+        prompt = budget.build(
+            'scoring',
+            partial(build_prompt, instructions),
+            [PromptSection('transcript', _lines('User', 100), PRIORITY_TRANSCRIPT, 'middle')],
+            system_prompt='You are a coach.',
+        )
+        budget.build(
+            'scoring',
+            partial(build_prompt, instructions),
+            [PromptSection('transcript', 'User: Hello', PRIORITY_TRANSCRIPT, 'middle')],
+        )
+
+        self.assertTrue(prompt.startswith(instructions))
+        self.assertLessEqual(count_tokens('You are a coach.', prompt), 300)
+        stats = budget.get_stats()['scoring']
+        self.assertEqual((stats.calls, stats.trimmed_calls), (2, 1))
+        self.assertGreater(stats.trimmed_tokens, 0)
+
+        budget.reset_stats()
+        self.assertEqual(budget.get_stats(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
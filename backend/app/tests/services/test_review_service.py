@@ -339,3 +339,32 @@ class TestReviewService(unittest.TestCase):
         self.assertEqual(data.pagination['totalCount'], 7)
         self.assertEqual(data.pagination['pageSize'], 3)
         self.assertEqual(data.rating_statistics.average, 3.43)
+
+    def test_get_reviews_with_cursor(self) -> None:
+        self._create_multiple_dummy_reviews(self.normal_user, 4, 5)
+        self._create_multiple_dummy_reviews(self.normal_user, 3, 2)
+
+        for sort in ('newest', 'oldest'):
+            data = self.service.get_reviews(page=1, page_size=3, sort=sort, include_total=False)
+            self.assertIsNone(data.pagination['totalCount'])
+            seen = [review.id for review in data.reviews]
+            while data.pagination['nextCursor']:
+                data = self.service.get_reviews(
+                    page_size=3, sort=sort, cursor=data.pagination['nextCursor']
+                )
+                seen.extend(review.id for review in data.reviews)
+
+            expected = self.service.get_reviews(page=1, page_size=10, sort=sort).reviews
+            self.assertEqual(seen, [review.id for review in expected])
+
+    def test_get_reviews_with_invalid_cursor(self) -> None:
+        self._create_multiple_dummy_reviews(self.normal_user, 4, 5)
+        cursor = self.service.get_reviews(page=1, page_size=2).pagination['nextCursor']
+
+        with self.assertRaises(HTTPException) as context:
+            self.service.get_reviews(page_size=2, sort='highest', cursor=cursor)
+        self.assertEqual(context.exception.status_code, 400)
+
+        with self.assertRaises(HTTPException) as context:
+            self.service.get_reviews(page_size=2, cursor='not-a-cursor')
+        self.assertEqual(context.exception.status_code, 400)
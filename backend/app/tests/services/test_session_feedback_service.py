@@ -621,6 +621,126 @@ class TestSessionFeedbackService(unittest.TestCase):
             self.assertEqual(feedback.overall_score, 10.0)
             self.assertEqual(feedback.has_error, False)
 
+    def test_generate_fused_feedback_splits_response(self) -> None:
+        from app.schemas.session_feedback import FusedFeedbackRead
+        from app.services.session_feedback import session_feedback_llm
+
+        fused_response = FusedFeedbackRead(
+            positive_examples=[PositiveExample(heading='h', feedback='f', quote='It’s fine')],
+            negative_examples=[
+                NegativeExample(
+                    heading='h', feedback='f', quote='Don’t', improved_quote='Let’s talk'
+                )
+            ],
+            goals_achieved=['G1', '  '],
+            recommendations=[Recommendation(heading='h', recommendation='r')],
+        )
+        req = FeedbackCreate(
+            transcript='User: Hello',
+            objectives=['G1', 'G2'],
+            persona='P',
+            situational_facts='S',
+            category='C',
+            key_concepts='K',
+        )
+        with patch.object(
+            session_feedback_llm, 'call_structured_llm', return_value=fused_response
+        ) as mock_llm:
+            examples, goals, recommendations = session_feedback_llm.generate_fused_feedback(
+                req, hr_docs_context='HR context'
+            )
+
+        mock_llm.assert_called_once()
+        self.assertIs(mock_llm.call_args.kwargs['output_model'], FusedFeedbackRead)
+        self.assertIn('HR context', mock_llm.call_args.kwargs['request_prompt'])
+        self.assertEqual(examples.positive_examples[0].quote, "It's fine")
+        self.assertEqual(examples.negative_examples[0].quote, "Don't")
+        self.assertEqual(examples.negative_examples[0].improved_quote, "Let's talk")
+        self.assertEqual(goals, GoalsAchievedRead(goals_achieved=['G1']))
+        self.assertEqual(recommendations.recommendations[0].heading, 'h')
+
+    def test_generate_fused_feedback_without_user_statements(self) -> None:
+        from app.services.session_feedback import session_feedback_llm
+
+        req = FeedbackCreate(
+            transcript='Assistant: Hello',
+            objectives=['G1'],
+            persona='P',
+            situational_facts='S',
+            category='C',
+            key_concepts='K',
+        )
+        with (
+            patch.object(session_feedback_llm, 'call_structured_llm') as mock_llm,
+            patch.object(
+                session_feedback_llm,
+                'get_achieved_goals',
+                return_value=GoalsAchievedRead(goals_achieved=[]),
+            ) as mock_goals,
+        ):
+            examples, goals, recommendations = session_feedback_llm.generate_fused_feedback(req)
+
+        mock_llm.assert_not_called()
+        mock_goals.assert_called_once()
+        self.assertEqual(examples.positive_examples + examples.negative_examples, [])
+        self.assertEqual(goals.goals_achieved, [])
+        self.assertEqual(recommendations.recommendations, [])
+
+    @patch('app.services.session_feedback.session_feedback_llm.generate_fused_feedback')
+    @patch('app.services.session_feedback.session_feedback_llm.generate_training_examples')
+    @patch('app.services.session_feedback.session_feedback_llm.get_achieved_goals')
+    @patch('app.services.session_feedback.session_feedback_llm.generate_recommendations')
+    def test_generate_feedback_components_in_fused_mode(
+        self,
+        mock_recommendations: MagicMock,
+        mock_goals: MagicMock,
+        mock_examples: MagicMock,
+        mock_fused: MagicMock,
+    ) -> None:
+        mock_fused.return_value = (
+            SessionExamplesRead(
+                positive_examples=[PositiveExample(heading='h', feedback='f', quote='q')],
+                negative_examples=[],
+            ),
+            GoalsAchievedRead(goals_achieved=['G1']),
+            RecommendationsRead(recommendations=[Recommendation(heading='h', recommendation='r')]),
+        )
+        mock_session_turn_service = MagicMock()
+        mock_session_turn_service.stitch_mp3s_from_gcs.return_value = None
+
+        with patch(
+            'app.services.session_feedback.session_feedback_service.settings.'
+            'FEEDBACK_GENERATION_MODE',
+            'fused',
+        ):
+            feedback = generate_feedback_components(
+                feedback_request=FeedbackCreate(
+                    transcript='User: Hello',
+                    objectives=['G1'],
+                    persona='P',
+                    situational_facts='S',
+                    category='C',
+                    key_concepts='K',
+                ),
+                goals_request=GoalsAchievedCreate(
+                    transcript='User: Hello', objectives=['G1'], language_code=LanguageCode.en
+                ),
+                hr_docs_context='',
+                documents=[],
+                conversation=self._mock_conversation_data(),
+                scoring_service=MagicMock(),
+                session_turn_service=mock_session_turn_service,
+                session_id=uuid4(),
+            )
+
+        mock_fused.assert_called_once()
+        mock_examples.assert_not_called()
+        mock_goals.assert_not_called()
+        mock_recommendations.assert_not_called()
+        self.assertEqual(len(feedback.examples_positive), 1)
+        self.assertEqual(feedback.goals, GoalsAchievedRead(goals_achieved=['G1']))
+        self.assertEqual(feedback.recommendations[0].recommendation, 'r')
+
 
 if __name__ == '__main__':
     unittest.main()
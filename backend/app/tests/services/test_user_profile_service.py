@@ -1,11 +1,21 @@
+from collections.abc import Generator
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 from pytest_mock import MockerFixture
-
+from sqlalchemy import event
+from sqlalchemy.pool.impl import StaticPool
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine
+
+from app.dependencies.auth import user_profile_cache
+from app.enums.account_role import AccountRole
+from app.enums.config_type import ConfigType
+from app.models.app_config import AppConfig
 from app.models.user_profile import UserProfile
+from app.schemas.user_profile import SessionLimitType, SortOption
 from app.services.user_profile_service import UserService
 
 
@@ -38,10 +48,16 @@ def mock_supabase(mocker: MockerFixture) -> MagicMock:
 def test__delete_user_success(
     user_service: UserService, mock_user: UserProfile, mock_db: MagicMock, mock_supabase: MagicMock
 ) -> None:
+    user_profile_cache.set(mock_user.id, {'id': mock_user.id})
+
     user_service._delete_user(mock_user.id)
 
+    assert user_profile_cache.get(mock_user.id) is None
+
     mock_db.get.assert_called_once_with(UserProfile, mock_user.id)
-    mock_db.delete.assert_called_once_with(mock_user)
+    mock_db.delete.assert_not_called()
+    statements = [str(call.args[0]) for call in mock_db.exec.call_args_list]
+    assert any(statement.startswith('DELETE FROM userprofile') for statement in statements)
     # mock_db.commit.assert_called_once()
     mock_supabase.auth.admin.delete_user.assert_called_once_with(str(mock_user.id))
 
@@ -60,3 +76,84 @@ def test__delete_user_db_commit_fails(
     # mock_db.rollback.assert_called_once()
     mock_supabase.auth.admin.delete_user.assert_not_called()
     assert exc_info.value.status_code == 500
+
+
+@pytest.fixture
+def sqlite_db() -> Generator[DBSession]:
+    engine = create_engine(
+        'sqlite:///:memory:', connect_args={'check_same_thread': False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with DBSession(engine) as db:
+        db.add(AppConfig(key='defaultDailyUserSessionLimit', value='5', type=ConfigType.int))
+        db.add(
+            UserProfile(
+                full_name='Admin',
+                email='admin@example.com',
+                phone_number='0',
+                account_role=AccountRole.admin,
+            )
+        )
+        db.add_all(
+            UserProfile(
+                full_name=f'User {i}',
+                email=f'user{i:02d}@{"acme" if i % 2 else "example"}.com',
+                phone_number=str(i + 1),
+                daily_session_limit=i if i % 3 == 0 else None,
+            )
+            for i in range(25)
+        )
+        db.commit()
+        yield db
+    engine.dispose()
+
+
+def test_get_user_profiles_paginates_in_sql(sqlite_db: DBSession) -> None:
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: object) -> None:
+        statements.append(args[2])
+
+    service = UserService(db=sqlite_db)
+    event.listen(sqlite_db.get_bind(), 'before_cursor_execute', before_cursor_execute)
+    try:
+        result = service.get_user_profiles(page=3, limit=10, email_sorting_option=SortOption.ASC)
+    finally:
+        event.remove(sqlite_db.get_bind(), 'before_cursor_execute', before_cursor_execute)
+
+    assert result.total_users == 25
+    assert result.total_pages == 3
+    assert [u.email for u in result.users] == [
+        'user20@example.com',
+        'user21@acme.com',
+        'user22@example.com',
+        'user23@acme.com',
+        'user24@example.com',
+    ]
+    # One count, one config lookup and one page query regardless of the number of users
+    assert len(statements) == 3
+    assert 'LIMIT' in statements[-1]
+
+
+def test_get_user_profiles_filters_and_resolves_default_limit(sqlite_db: DBSession) -> None:
+    service = UserService(db=sqlite_db)
+
+    result = service.get_user_profiles(
+        email_substring='acme',
+        session_limit_type_filter=[SessionLimitType.DEFAULT],
+        session_limit_sorting_option=SortOption.DESC,
+    )
+
+    assert result.total_users == 8
+    assert all('acme' in u.email for u in result.users)
+    assert all(u.limit_type == SessionLimitType.DEFAULT for u in result.users)
+    assert all(u.daily_session_limit == 5 for u in result.users)
+
+
+def test_get_user_profiles_invalid_page(sqlite_db: DBSession) -> None:
+    service = UserService(db=sqlite_db)
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.get_user_profiles(page=4, limit=10)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+from sqlalchemy import event
+from sqlmodel import Session as DBSession
+from sqlmodel import SQLModel, create_engine
+
+from app.dependencies.auth import user_profile_cache
+from app.models import UserProfile
+from app.services.admin_stats_service import AdminStatsService
+from app.services.user_stats_service import UserStats, UserStatsService
+
+THREADS = 8
+UPDATES_PER_THREAD = 25
+
+
+class TestUserStatsService(unittest.TestCase):
+    def setUp(self) -> None:
+        # A file database so that every thread gets its own connection
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.engine = create_engine(f'sqlite:///{self.db_path}', connect_args={'timeout': 30})
+        SQLModel.metadata.create_all(self.engine)
+
+        self.user_id = uuid4()
+        with DBSession(self.engine) as db:
+            db.add(
+                UserProfile(
+                    id=self.user_id,
+                    full_name='Test',
+                    email='a@b.com',
+                    phone_number='1',
+                    total_sessions=2,
+                    training_time=1.5,
+                    score_sum=20,
+                    goals_achieved=1,
+                )
+            )
+            db.commit()
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def test_increment_returns_updated_stats(self) -> None:
+        with DBSession(self.engine) as db:
+            stats = UserStatsService(db).increment(
+                self.user_id, total_sessions=1, training_time=0.5, score_sum=8, goals_achieved=2
+            )
+            db.commit()
+
+        self.assertEqual(stats, UserStats(3, 2.0, 28.0, 3))
+        with DBSession(self.engine) as db:
+            user = db.get(UserProfile, self.user_id)
+            self.assertEqual(
+                (user.total_sessions, user.training_time, user.score_sum, user.goals_achieved),
+                (3, 2.0, 28.0, 3),
+            )
+
+    def test_increment_updates_loaded_profile_without_query(self) -> None:
+        statements = []
+
+        def before_cursor_execute(*args: object) -> None:
+            statements.append(args[2])
+
+        with DBSession(self.engine) as db:
+            user = db.get(UserProfile, self.user_id)
+            event.listen(self.engine, 'before_cursor_execute', before_cursor_execute)
+            try:
+                UserStatsService(db).increment(self.user_id, score_sum=5, goals_achieved=1)
+                self.assertEqual((user.score_sum, user.goals_achieved), (25.0, 2))
+            finally:
+                event.remove(self.engine, 'before_cursor_execute', before_cursor_execute)
+
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith('UPDATE userprofile'))
+
+    def test_increment_evicts_only_the_cached_profile_of_the_user(self) -> None:
+        other_user_id = uuid4()
+        user_profile_cache.set(self.user_id, {'total_sessions': 2})
+        user_profile_cache.set(other_user_id, {'total_sessions': 4})
+        self.addCleanup(user_profile_cache.clear)
+
+        with DBSession(self.engine) as db:
+            UserStatsService(db).increment(self.user_id, total_sessions=1)
+            db.commit()
+
+        self.assertIsNone(user_profile_cache.get(self.user_id))
+        self.assertEqual(user_profile_cache.get(other_user_id), {'total_sessions': 4})
+
+    def test_increment_of_missing_user(self) -> None:
+        with DBSession(self.engine) as db:
+            self.assertIsNone(UserStatsService(db).increment(uuid4(), total_sessions=1))
+
+    def test_concurrent_increments_are_not_lost(self) -> None:
+        def complete_sessions() -> None:
+            for _ in range(UPDATES_PER_THREAD):
+                with DBSession(self.engine) as db:
+                    UserStatsService(db).increment(
+                        self.user_id, total_sessions=1, training_time=0.25, score_sum=2
+                    )
+                    AdminStatsService(db).increment(total_trainings=1, score_sum=2)
+                    db.commit()
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            futures = [executor.submit(complete_sessions) for _ in range(THREADS)]
+        for future in futures:
+            future.result()
+
+        updates = THREADS * UPDATES_PER_THREAD
+        with DBSession(self.engine) as db:
+            user = db.get(UserProfile, self.user_id)
+            self.assertEqual(user.total_sessions, 2 + updates)
+            self.assertAlmostEqual(user.training_time, 1.5 + 0.25 * updates)
+            self.assertAlmostEqual(user.score_sum, 20 + 2 * updates)
+            self.assertEqual(AdminStatsService(db).get_totals(), (updates, 2.0 * updates))
+
+
+if __name__ == '__main__':
+    unittest.main()